@@ -0,0 +1,99 @@
+"""Regenerate XNYS.json (NYSE sessions) from the exchange's holiday rules.
+
+Only exceptions are stored: sessions are Monday-Friday minus ``holidays``;
+``early_closes`` lists 13:00 ET closes. Unscheduled closures are listed in
+SPECIAL_CLOSURES. Years past the latest NYSE holiday announcement follow the
+standing rules and may need a refresh when the exchange publishes them.
+"""
+import json
+import pathlib
+from datetime import date, timedelta
+
+FIRST_YEAR, LAST_YEAR = 2010, 2030
+SPECIAL_CLOSURES = {
+    "2012-10-29": "Hurricane Sandy",
+    "2012-10-30": "Hurricane Sandy",
+    "2018-12-05": "National Day of Mourning (George H.W. Bush)",
+    "2025-01-09": "National Day of Mourning (Jimmy Carter)",
+}
+
+
+def easter(year):
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 7 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year, month, weekday, n):
+    d = date(year, month, 1)
+    d += timedelta((weekday - d.weekday()) % 7)
+    return d + timedelta(weeks=n - 1)
+
+
+def last_weekday(year, month, weekday):
+    d = date(year + month // 12, month % 12 + 1, 1) - timedelta(1)
+    return d - timedelta((d.weekday() - weekday) % 7)
+
+
+def observed(d):
+    if d.weekday() == 5:
+        return d - timedelta(1)
+    if d.weekday() == 6:
+        return d + timedelta(1)
+    return d
+
+
+def holidays(year):
+    new_year = date(year, 1, 1)
+    days = {
+        # A Saturday New Year's Day is not observed on the prior Friday.
+        "New Year's Day": new_year + timedelta(1) if new_year.weekday() == 6 else (None if new_year.weekday() == 5 else new_year),
+        "Martin Luther King Jr. Day": nth_weekday(year, 1, 0, 3),
+        "Washington's Birthday": nth_weekday(year, 2, 0, 3),
+        "Good Friday": easter(year) - timedelta(2),
+        "Memorial Day": last_weekday(year, 5, 0),
+        "Juneteenth": observed(date(year, 6, 19)) if year >= 2022 else None,
+        "Independence Day": observed(date(year, 7, 4)),
+        "Labor Day": nth_weekday(year, 9, 0, 1),
+        "Thanksgiving Day": nth_weekday(year, 11, 3, 4),
+        "Christmas Day": observed(date(year, 12, 25)),
+    }
+    return {d.isoformat(): name for name, d in days.items() if d is not None}
+
+
+def early_closes(year):
+    days = [nth_weekday(year, 11, 3, 4) + timedelta(1)]  # day after Thanksgiving
+    for d in (date(year, 7, 3), date(year, 12, 24)):
+        if d.weekday() < 4:  # Mon-Thu: a Friday eve is the observed holiday itself
+            days.append(d)
+    return {d.isoformat(): "13:00" for d in days}
+
+
+def build():
+    hol, early = {}, {}
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        hol.update(holidays(year))
+        early.update(early_closes(year))
+    hol.update(SPECIAL_CLOSURES)
+    return {
+        "calendar_id": "XNYS",
+        "timezone": "America/New_York",
+        "first_session": date(FIRST_YEAR, 1, 4).isoformat(),
+        "last_session": date(LAST_YEAR, 12, 31).isoformat(),
+        "weekmask": "Mon Tue Wed Thu Fri",
+        "regular_session": {"open": "09:30", "close": "16:00"},
+        "holidays": dict(sorted(hol.items())),
+        "early_closes": dict(sorted((d, t) for d, t in early.items() if d not in hol)),
+    }
+
+
+if __name__ == "__main__":
+    p = pathlib.Path(__file__).parent / "XNYS.json"
+    p.write_text(json.dumps(build(), indent=2) + "\n")
+    print(p)
@@ -0,0 +1,95 @@
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from bars_parquet import PART_NAME, STATE_NAME, arrow_schema, main, mirror_to_parquet, open_dataset, partition_dir
+from validation_lib import ValidationError, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+SCHEMA = load_json(BASE / 'schemas' / 'bars_download_manifest.schema.json')
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+
+
+def _record(date, rows=390, vendor='IBKR', bar_size='1 min', symbol='MSFT', **extra):
+    return json.dumps({
+        'schema_version': 'bars_manifest.v1', 'written_at': f'{date}T17:00:00', 'vendor': vendor, 'file_format': 'parquet',
+        'symbol': symbol, 'bar_size': bar_size, 'path': f'/bars/{symbol}/{date}.parquet', 'filename': f'{date}.parquet',
+        'rows': rows, 'columns': ['time', 'open'], 'time_start': f'{date}T09:30:00', 'time_end': f'{date}T16:00:00', **extra,
+    }) + '\n'
+
+
+def _rows(root, **filters):
+    import pyarrow.compute as pc
+    expr = None
+    for k, v in filters.items():
+        e = pc.field(k) == v
+        expr = e if expr is None else expr & e
+    table = open_dataset(root).to_table(filter=expr)
+    return sorted(table.to_pylist(), key=lambda r: r['line'])
+
+
+def test_arrow_schema_follows_json_schema():
+    schema = arrow_schema(SCHEMA)
+    assert schema.names[:3] == ['schema_version', 'written_at', 'source']
+    assert 'bar_size' not in schema.names and 'vendor' not in schema.names
+    assert str(schema.field('rows').type) == 'int64' and not schema.field('rows').nullable
+    assert str(schema.field('columns').type) == 'list<item: string>'
+    assert schema.field('time_start').nullable and schema.names[-2:] == ['line', 'extra']
+
+
+def test_incremental_ingest_and_partition_pruning(tmp_path):
+    jsonl, out = tmp_path / 'dl.jsonl', tmp_path / 'pq'
+    jsonl.write_text(SAMPLE.read_text() + _record('2025-09-16', vendor='POLY', note='re-download'))
+    stats = mirror_to_parquet(jsonl, out)
+    assert (stats.mode, stats.records, stats.partitions_written) == ('full', 3, 3)
+    assert (partition_dir(out, ('1 min', 'POLY', '2025-09-16')) / PART_NAME).exists()
+
+    with jsonl.open('a') as fh:
+        fh.write(_record('2025-09-16', rows=12, vendor='POLY', symbol='AAPL') + '{"broken": \n')
+        fh.write(_record('2025-09-17').rstrip('\n'))  # still being written
+    stats = mirror_to_parquet(jsonl, out)
+    assert (stats.mode, stats.lines, stats.records, stats.skipped, stats.partitions_written) == ('incremental', 2, 1, 1, 1)
+    poly = _rows(out, vendor='POLY', date=datetime.date(2025, 9, 16))
+    assert [(r['symbol'], r['rows'], r['line']) for r in poly] == [('MSFT', 390, 3), ('AAPL', 12, 4)]
+    assert json.loads(poly[0]['extra']) == {'note': 're-download'} and poly[1]['extra'] is None
+    assert poly[0]['bar_size'] == '1 min' and poly[0]['columns'] == ['time', 'open']
+    assert len(_rows(out)) == 4
+
+    state = load_json(out / STATE_NAME)
+    assert state['lines'] == 5 and state['records'] == 4
+    jsonl.write_text(_record('2025-09-01'))  # rewritten log: rebuild
+    stats = mirror_to_parquet(jsonl, out)
+    assert stats.mode == 'full' and [r['date'] for r in _rows(out)] == [datetime.date(2025, 9, 1)]
+
+
+def test_interrupted_run_rows_are_replaced(tmp_path):
+    jsonl, out = tmp_path / 'dl.jsonl', tmp_path / 'pq'
+    jsonl.write_text(_record('2025-09-15'))
+    mirror_to_parquet(jsonl, out)
+    state = (out / STATE_NAME).read_text()
+    with jsonl.open('a') as fh:
+        fh.write(_record('2025-09-15', symbol='AAPL'))
+    mirror_to_parquet(jsonl, out)
+    (out / STATE_NAME).write_text(state)  # as if the run died before committing its checkpoint
+    stats = mirror_to_parquet(jsonl, out)
+    assert stats.mode == 'incremental' and [r['symbol'] for r in _rows(out)] == ['MSFT', 'AAPL']
+
+
+def test_validate_on_ingest(tmp_path, capsys):
+    jsonl, out = tmp_path / 'dl.jsonl', tmp_path / 'pq'
+    jsonl.write_text(_record('2025-09-15') + _record('2025-09-16', bar_size='5 min'))
+    with pytest.raises(ValidationError, match='line 2 failed schema validation'):
+        mirror_to_parquet(jsonl, out, validate=True)
+    assert not (out / STATE_NAME).exists()
+    assert main([str(jsonl), '--out', str(out), '--validate']) == 2
+    assert main([str(jsonl), '--out', str(out)]) == 0  # '5 min' still fits the Arrow schema
+    assert main([str(jsonl), '--out', str(out), '--rebuild', '--strict']) == 0
+    capsys.readouterr()
+    with jsonl.open('a') as fh:
+        fh.write(json.dumps({'symbol': 'X', 'bar_size': '1 min', 'vendor': 'IBKR', 'rows': 'many'}) + '\n')
+    assert main([str(jsonl), '--out', str(out), '--strict']) == 1
+    assert 'incremental: 1 lines, 0 records, 1 skipped' in capsys.readouterr().out
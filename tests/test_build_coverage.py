@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+from build_coverage import build_coverage, main
+
+BASE = Path(__file__).resolve().parent.parent
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+
+
+def _record(date, rows, written_at, symbol='MSFT', bar_size='1 min'):
+    return json.dumps({
+        'schema_version': 'bars_manifest.v1', 'written_at': written_at, 'vendor': 'IBKR', 'file_format': 'parquet',
+        'symbol': symbol, 'bar_size': bar_size, 'path': f'/bars/{symbol}/{date}.parquet', 'filename': f'{date}.parquet',
+        'rows': rows, 'columns': ['time'], 'time_start': f'{date}T09:30:00', 'time_end': f'{date}T16:00:00',
+    }) + '\n'
+
+
+def test_dedupes_days_and_keeps_them_sorted(tmp_path):
+    jsonl = tmp_path / 'dl.jsonl'
+    jsonl.write_text(
+        SAMPLE.read_text()
+        + _record('2025-09-12', 390, '2025-09-12T17:00:00')
+        + _record('2025-09-10', 390, '2025-09-10T17:00:00')
+        + _record('2025-09-12', 120, '2025-09-13T08:00:00')  # truncated re-download loses to the full file
+        + _record('2025-09-10', 390, '2025-09-14T08:00:00')  # same rows, later write wins
+        + 'not json\n'
+    )
+    manifest, stats = build_coverage(jsonl, generated_at='2025-09-16T00:00:00')
+    msft = next(e for e in manifest['entries'] if e['symbol'] == 'MSFT')
+    assert [d['date'] for d in msft['days']] == ['2025-09-10', '2025-09-12']
+    assert msft['total'] == {'date_start': '2025-09-10', 'date_end': '2025-09-12'}
+    assert msft['days'][0]['written_at'] == '2025-09-14T08:00:00' and msft['days'][1]['rows'] == 390
+    assert (stats.records, stats.days_added, stats.days_replaced, stats.skipped) == (6, 4, 1, 1)
+    assert len(manifest['entries']) == 3
+
+
+def test_incremental_merge_matches_full_rebuild(tmp_path):
+    jsonl = tmp_path / 'dl.jsonl'
+    jsonl.write_text(SAMPLE.read_text() + _record('2025-09-15', 390, '2025-09-15T17:00:00'))
+    first, _ = build_coverage(jsonl, generated_at='2025-09-16T00:00:00')
+    with jsonl.open('a') as fh:
+        fh.write(_record('2025-09-16', 390, '2025-09-16T17:00:00') + _record('2025-09-15', 391, '2025-09-16T18:00:00'))
+        fh.write(_record('2025-09-17', 1, '2025-09-17T17:00:00').rstrip('\n'))  # still being written
+    second, stats = build_coverage(jsonl, previous=first, generated_at='2025-09-17T00:00:00')
+    assert stats.mode == 'incremental' and stats.lines == 2
+    full, _ = build_coverage(jsonl, generated_at='2025-09-17T00:00:00')
+    assert second == full
+    assert second['source']['lines'] == 5 and second['source']['records'] == 5
+
+    jsonl.write_text(_record('2025-09-01', 5, '2025-09-01T17:00:00'))  # rewritten log: rebuild
+    rebuilt, stats = build_coverage(jsonl, previous=second)
+    assert stats.mode == 'full' and [e['symbol'] for e in rebuilt['entries']] == ['MSFT']
+
+
+def test_cli_writes_schema_valid_coverage(tmp_path, capsys):
+    jsonl = tmp_path / 'dl.jsonl'
+    jsonl.write_text(SAMPLE.read_text())
+    out = tmp_path / 'coverage.json'
+    assert main([str(jsonl), '--out', str(out)]) == 0
+    assert main([str(jsonl), '--out', str(out)]) == 0
+    assert capsys.readouterr().out.splitlines()[-1].startswith('incremental: 0 lines')
+    import validate
+    assert validate.main(['bars-coverage', str(out), f'schema={BASE / "schemas" / "bars_coverage_manifest.schema.json"}']) == 0
+
+
+def test_schema_rejected_records_are_skipped_with_line_numbers(tmp_path, capsys):
+    jsonl = tmp_path / 'dl.jsonl'
+    jsonl.write_text(
+        _record('2025-09-10', 390, '2025-09-10T17:00:00')
+        + _record('2025-09-11', 390, '2025-09-11T17:00:00', bar_size='5 mins')
+        + _record('2025-09-12', 390, '2025-09-12T17:00:00').replace('2025-09-12T09:30:00', '2025-09-12 09:30:00')
+    )
+    manifest, stats = build_coverage(jsonl, generated_at='2025-09-16T00:00:00')
+    assert [d['date'] for e in manifest['entries'] for d in e['days']] == ['2025-09-10']
+    assert (stats.records, stats.skipped, stats.skipped_lines) == (1, 2, [2, 3])
+
+    with jsonl.open('a') as fh:
+        fh.write(_record('2025-09-15', -1, '2025-09-15T17:00:00'))
+    again, stats = build_coverage(jsonl, previous=manifest)
+    assert stats.mode == 'incremental' and stats.skipped_lines == [4]
+    out = tmp_path / 'coverage.json'
+    assert main([str(jsonl), '--out', str(out), '--strict']) == 1
+    assert capsys.readouterr().out.strip().endswith('line 2, 3, 4')
@@ -0,0 +1,109 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from coverage_audit import TradingCalendar, audit_coverage, main, summarize
+
+
+@pytest.fixture(scope='module')
+def xnys():
+    return TradingCalendar.load('XNYS')
+
+
+def _day(d, path=None, start='09:30:00', end='16:00:00', end_date=None):
+    return {'date': d, 'path': path or f'/b/{d}.parquet', 'filename': f'{d}.parquet', 'rows': 1,
+            'time_start': f'{d}T{start}', 'time_end': f'{end_date or d}T{end}'}
+
+
+def test_bundled_calendar_sessions(xnys):
+    assert xnys.calendar_id == 'XNYS'
+    s = xnys.sessions_between('2025-06-16', '2025-07-07').astype(str).tolist()
+    assert '2025-06-19' not in s and '2025-07-04' not in s  # Juneteenth, Independence Day
+    assert '2025-06-21' not in s and '2025-07-03' in s
+    assert xnys.early_closes['2025-11-28'] == '13:00'
+    assert xnys.is_session(np.array(['2024-03-29', '2024-04-01'], dtype='datetime64[D]')).tolist() == [False, True]
+
+
+def test_reports_each_issue_kind(xnys):
+    manifest = {'entries': [
+        {'symbol': 'AAPL', 'bar_size': '1 min', 'total': {'date_start': '2025-06-16', 'date_end': '2025-06-27'},
+         'days': [
+             _day('2025-06-16'), _day('2025-06-17', end='02:00:00', end_date='2025-06-18'),
+             _day('2025-06-18', start='00:30:00'), _day('2025-06-18', path='/b/dup.parquet'),
+             _day('2025-06-19'),  # Juneteenth
+             _day('2025-06-27', path='/b/shared.parquet'), _day('2025-06-30'),  # after total
+         ]},
+        {'symbol': 'MSFT', 'bar_size': '1 min', 'total': {'date_start': '2025-06-16', 'date_end': '2025-06-18'},
+         'days': [_day('2025-06-17', path='/b/shared.parquet'), _day('2025-06-16', path='/m/16.parquet')]},
+    ]}
+    aapl, msft = audit_coverage(manifest, xnys)
+    assert aapl.window == ('2025-06-16', '2025-06-27')
+    assert aapl.expected_sessions == 9 and aapl.covered_sessions == 4
+    assert aapl.missing == [('2025-06-20', '2025-06-26')]
+    assert aapl.non_session_days == ['2025-06-19']
+    assert aapl.out_of_window_days == ['2025-06-30']
+    assert aapl.duplicate_days == ['2025-06-18']
+    assert aapl.overlapping_days == ['2025-06-17']
+    assert aapl.shared_files == ['/b/shared.parquet'] and msft.shared_files == ['/b/shared.parquet']
+    assert msft.missing == [('2025-06-18', '2025-06-18')] and msft.duplicate_days == []
+
+    explicit = audit_coverage(manifest, xnys, start='2025-06-13', end='2025-06-30')[1]
+    assert explicit.missing == [('2025-06-13', '2025-06-13'), ('2025-06-18', '2025-06-30')]
+    report = summarize([aapl, msft], xnys)
+    assert report['entries_with_issues'] == 2 and report['sessions_missing'] == 5 + 1
+
+
+def test_missing_sessions_match_reference(xnys):
+    rng = random.Random(7)
+    sessions = xnys.sessions_between('2024-01-01', '2024-12-31').astype(str).tolist()
+    entries = []
+    for i in range(40):
+        days = sorted(rng.sample(sessions, rng.randint(0, 60)), key=lambda _: rng.random())
+        entries.append({'symbol': f'S{i}', 'bar_size': '1 sec',
+                        'total': {'date_start': '2024-03-01', 'date_end': '2024-05-31'},
+                        'days': [_day(d) for d in days]})
+    results = audit_coverage({'entries': entries}, xnys)
+    window = [d for d in sessions if '2024-03-01' <= d <= '2024-05-31']
+    for entry, result in zip(entries, results):
+        have = {d['date'] for d in entry['days']}
+        missing = [d for d in window if d not in have]
+        flattened = [d for a, b in result.missing for d in window if a <= d <= b]
+        assert flattened == missing
+        assert result.covered_sessions == len(window) - len(missing)
+        assert sorted(result.out_of_window_days) == sorted(d for d in have if not '2024-03-01' <= d <= '2024-05-31')
+
+
+def test_cli_exit_codes(tmp_path, capsys):
+    import json
+    clean = tmp_path / 'clean.json'
+    d0 = date(2025, 6, 16)
+    days = [(d0 + timedelta(i)).isoformat() for i in range(5)]
+    clean.write_text(json.dumps({'entries': [{'symbol': 'A', 'bar_size': '1 min',
+                                              'total': {'date_start': days[0], 'date_end': days[-1]},
+                                              'days': [_day(d) for d in days if d != '2025-06-19']}]}))
+    assert main([str(clean)]) == 0
+    assert main([str(clean), '--end', '2025-06-23']) == 1
+    assert 'missing=1' in capsys.readouterr().out
+    assert main([str(clean), '--calendar', 'NOPE']) == 2
+
+
+def test_days_outside_the_calendar_are_warnings(xnys, tmp_path, capsys):
+    import json
+    manifest = {'entries': [{'symbol': 'OLD', 'bar_size': '1 day',
+                             'total': {'date_start': '2009-01-02', 'date_end': '2010-01-05'},
+                             'days': [_day('2009-01-02'), _day('2010-01-04'), _day('2010-01-05'), _day('2010-01-06')]}]}
+    (old,) = audit_coverage(manifest, xnys)
+    assert old.outside_calendar == ['2009-01-02']
+    assert old.out_of_window_days == ['2010-01-06'] and old.non_session_days == []
+    assert old.window == ('2010-01-04', '2010-01-05') and old.missing == []
+    report = summarize([old], xnys)
+    assert report['outside_calendar_days'] == 1 and report['warnings'][0]['outside_calendar'] == ['2009-01-02']
+
+    manifest['entries'][0]['days'].pop()
+    path = tmp_path / 'old.json'
+    path.write_text(json.dumps(manifest))
+    assert main([str(path)]) == 0
+    assert 'WARNING OLD 1 day: 1 days outside the XNYS calendar (2009-01-02..2009-01-02), not audited' in capsys.readouterr().out
@@ -0,0 +1,58 @@
+import json
+import os
+
+from coverage_index import SIDECAR_SUFFIX, CoverageIndex
+
+
+def _manifest(days):
+    return {
+        'schema_version': 'bars_coverage.v1',
+        'generated_at': '2025-09-16T00:00:00',
+        'entries': [
+            {'symbol': 'AAPL', 'bar_size': '1 sec', 'total': {'date_start': days[0], 'date_end': days[-1]},
+             'days': [{'date': d, 'path': f'/b/{d}.parquet', 'filename': f'{d}.parquet', 'rows': 100} for d in reversed(days)]},
+            {'symbol': 'MSFT', 'bar_size': '1 sec', 'total': {'date_start': '2025-09-08', 'date_end': '2025-09-08'},
+             'days': [{'date': '2025-09-08', 'path': '/b/m.parquet', 'filename': 'm.parquet', 'rows': 7}]},
+        ],
+    }
+
+
+DAYS = ['2025-09-01', '2025-09-02', '2025-09-03', '2025-09-08', '2025-09-12', '2025-09-15']
+
+
+def test_range_queries_runs_and_gaps():
+    idx = CoverageIndex.from_manifest(_manifest(DAYS))
+    assert idx.days('AAPL', '1 sec', '2025-09-02', '2025-09-12') == ['2025-09-02', '2025-09-03', '2025-09-08', '2025-09-12']
+    assert idx.days('AAPL', '1 sec', end='2025-09-01') == ['2025-09-01']
+    assert idx.days('AAPL', '1 min') == [] and idx.bounds('AAPL', '1 min') is None
+    assert idx.count('AAPL', '1 sec', '2025-09-04', '2025-09-11') == 1
+    assert idx.rows('AAPL', '1 sec', '2025-09-01', '2025-09-03') == 300
+    assert idx.has_day('AAPL', '1 sec', '2025-09-15') and not idx.has_day('AAPL', '1 sec', '2025-09-14')
+    assert idx.intervals('AAPL', '1 sec') == [('2025-09-01', '2025-09-03'), ('2025-09-08', '2025-09-08'),
+                                             ('2025-09-12', '2025-09-12'), ('2025-09-15', '2025-09-15')]
+    # Weekdays by default: the 4th-5th and 9th-11th are missing; weekends never are.
+    assert idx.gaps('AAPL', '1 sec', '2025-09-01', '2025-09-15') == [('2025-09-04', '2025-09-05'), ('2025-09-09', '2025-09-11')]
+    assert idx.gaps('AAPL', '1 sec', '2025-09-01', '2025-09-15', expected=['2025-09-03', '2025-09-10']) == [('2025-09-10', '2025-09-10')]
+    assert idx.query_many(['AAPL', 'MSFT', 'TSLA'], '1 sec', '2025-09-08', '2025-09-08') == {
+        'AAPL': ['2025-09-08'], 'MSFT': ['2025-09-08'], 'TSLA': []}
+    assert idx.counts(['AAPL', 'MSFT'], '1 sec', '2025-09-01', '2025-09-30') == {'AAPL': 6, 'MSFT': 1}
+
+
+def test_sidecar_round_trip_and_invalidation(tmp_path):
+    path = tmp_path / 'coverage.json'
+    path.write_text(json.dumps(_manifest(DAYS)))
+    first = CoverageIndex.load(path)
+    sidecar = tmp_path / ('coverage.json' + SIDECAR_SUFFIX)
+    assert sidecar.exists()
+    st = path.stat()
+    cached = CoverageIndex.read_sidecar(sidecar, st.st_size, st.st_mtime_ns)
+    assert cached is not None and cached.keys() == first.keys()
+    assert cached.days('AAPL', '1 sec') == first.days('AAPL', '1 sec') == DAYS
+    assert cached.rows('MSFT', '1 sec') == 7
+
+    path.write_text(json.dumps(_manifest(DAYS[:2])))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert CoverageIndex.load(path).days('AAPL', '1 sec') == DAYS[:2]
+    sidecar.write_bytes(b'garbage')
+    assert CoverageIndex.read_sidecar(sidecar, 0, 0) is None
+    assert CoverageIndex.load(path).days('AAPL', '1 sec') == DAYS[:2]
@@ -0,0 +1,97 @@
+import math
+import struct
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+feather = pytest.importorskip('pyarrow.feather')
+
+from dataset_hash import hash_bundle, hash_file, merkle_root  # noqa: E402
+
+
+def table(close=(1.0, math.nan, 3.0, 4.0), symbol=('AAPL', None, 'MSFT', '')):
+    return pa.table({
+        'timestamp': pa.array(range(4), pa.timestamp('ns', tz='UTC')),
+        'close': pa.array(close, pa.float64()),
+        'symbol': pa.array(symbol, pa.string()),
+        'l2': pa.array([[{'p': 1.0}], [], None, [{'p': 2.0}]]),
+    })
+
+
+def test_file_hash_ignores_physical_layout(tmp_path):
+    base = tmp_path / 'base.parquet'
+    pq.write_table(table(), base)
+    _, expected = hash_file(base)
+
+    variants = tmp_path / 'variants'
+    variants.mkdir()
+    t = table()
+    pq.write_table(t.select(['symbol', 'l2', 'close', 'timestamp']), variants / 'cols.parquet', row_group_size=1, compression='zstd')
+    pq.write_table(t.set_column(2, 'symbol', t.column('symbol').dictionary_encode()), variants / 'dict.parquet')
+    feather.write_feather(t.set_column(2, 'symbol', t.column('symbol').cast(pa.large_string())), variants / 'large.ftr', chunksize=3)
+    other_nan = struct.unpack('<d', bytes.fromhex('010000000000f87f'))[0]
+    pq.write_table(table(close=(1.0, other_nan, 3.0, 4.0)), variants / 'nan.parquet')
+    for f in sorted(variants.iterdir()):
+        assert hash_file(f) == (4, expected), f.name
+
+    pq.write_table(table(close=(1.0, math.nan, 3.0, 4.5)), tmp_path / 'value.parquet')
+    pq.write_table(table(symbol=('AAPL', '', 'MSFT', '')), tmp_path / 'null.parquet')
+    assert hash_file(tmp_path / 'value.parquet')[1] != expected
+    assert hash_file(tmp_path / 'null.parquet')[1] != expected
+
+
+def test_bundle_merkle_root(tmp_path):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / 'bundle' / name).mkdir(parents=True)
+        pq.write_table(table(), tmp_path / 'bundle' / name / 'part.parquet')
+    serial = hash_bundle(tmp_path / 'bundle', jobs=1)
+    pooled = hash_bundle(tmp_path / 'bundle', jobs=2)
+    assert serial.root == pooled.root and serial.files == 3 and serial.rows == 12
+
+    leaves = {leaf.path: leaf.sha256 for leaf in serial.leaves}
+    assert merkle_root(dict(reversed(list(leaves.items())))) == serial.root
+    leaves['d/part.parquet'] = leaves['a/part.parquet']
+    assert merkle_root(leaves) != serial.root
+
+
+def test_nested_columns_hash_columnar_and_canonical(tmp_path):
+    other_nan = struct.unpack('<d', bytes.fromhex('010000000000f87f'))[0]
+
+    def l2(nan):
+        return pa.table({'l2': pa.array([[{'p': 1.0, 's': 'x'}], [], None, [{'p': nan, 's': None}, {'p': 2.0, 's': 'y'}]])})
+
+    pq.write_table(l2(math.nan), tmp_path / 'a.parquet')
+    t = l2(other_nan)
+    t = t.set_column(0, 'l2', t.column('l2').cast(pa.large_list(t.schema.field('l2').type.value_type)))
+    pq.write_table(t, tmp_path / 'b.parquet', row_group_size=1)
+    assert hash_file(tmp_path / 'a.parquet') == hash_file(tmp_path / 'b.parquet')
+
+    moved = pa.table({'l2': pa.array([[{'p': 1.0, 's': 'x'}, {'p': math.nan, 's': None}], [], None, [{'p': 2.0, 's': 'y'}]])})
+    pq.write_table(moved, tmp_path / 'c.parquet')
+    assert hash_file(tmp_path / 'c.parquet')[1] != hash_file(tmp_path / 'a.parquet')[1]
+
+
+def test_symlinks_are_leaves_under_their_own_name(tmp_path):
+    from leaf_cache import LeafCache
+    from validation_lib import ValidationError
+
+    bundle, outside = tmp_path / 'bundle', tmp_path / 'outside'
+    bundle.mkdir()
+    outside.mkdir()
+    pq.write_table(table(), bundle / 'y.parquet')
+    pq.write_table(table(close=(9.0, 9.0, 9.0, 9.0)), outside / 'z.parquet')
+    (bundle / 'x.parquet').symlink_to(bundle / 'y.parquet')
+    (bundle / 'w.parquet').symlink_to(outside / 'z.parquet')
+
+    with LeafCache(tmp_path / 'cache.sqlite') as cache:
+        result = hash_bundle(bundle, jobs=1, cache=cache)
+    assert [leaf.path for leaf in result.leaves] == ['w.parquet', 'x.parquet', 'y.parquet']
+    assert result.files == 3 and result.rows == 12 and result.verified == 0
+    x, y = result.leaves[1], result.leaves[2]
+    assert x.sha256 == y.sha256 and result.root == merkle_root({leaf.path: leaf.sha256 for leaf in result.leaves})
+
+    with pytest.raises(ValidationError, match='more than once: y.parquet'):
+        hash_bundle(bundle, jobs=1, files=[bundle / 'y.parquet', bundle / 'y.parquet'])
+    with pytest.raises(ValidationError, match='not inside the dataset path'):
+        hash_bundle(bundle, jobs=1, files=[outside / 'z.parquet'])
@@ -0,0 +1,45 @@
+import json
+
+from feature_hash import compute_feature_hash, feature_hash_for_file, main, verify_batch
+
+
+def test_hash_is_canonical_and_memoized(tmp_path):
+    a = tmp_path / 'a.json'
+    b = tmp_path / 'b.json'
+    a.write_text(json.dumps({'features': [{'name': 'ret_1', 'window': 1}], 'feature_set_version': 'fs_v1'}))
+    b.write_text(json.dumps({'feature_set_version': 'fs_v1', 'features': [{'window': 1, 'name': 'ret_1'}]}, indent=4))
+    assert feature_hash_for_file(a) == feature_hash_for_file(b) == compute_feature_hash(json.loads(a.read_text()))
+    assert compute_feature_hash({'features': []}) != feature_hash_for_file(a)
+
+
+def test_batch_verify_against_definition_index(tmp_path, capsys):
+    defs = tmp_path / 'defs'
+    defs.mkdir()
+    definition = {'feature_set_version': 'fs_v2', 'features': ['close', 'vwap']}
+    (defs / 'whatever.json').write_text(json.dumps(definition))
+    digest = compute_feature_hash(definition)
+
+    manifests = tmp_path / 'manifests'
+    manifests.mkdir()
+    for i, stored in enumerate([digest, digest[:12], 'deadbeefdeadbeef']):
+        (manifests / f'm{i}.json').write_text(json.dumps({'feature_set_version': 'fs_v2', 'feature_hash': stored}))
+    (manifests / 'm3.json').write_text(json.dumps({'feature_set_version': 'fs_v9', 'feature_hash': digest}))
+
+    statuses = [r.status for r in verify_batch([manifests], definitions_dir=defs)]
+    assert statuses == ['ok', 'prefix', 'mismatch', 'no-definition']
+    assert main(['verify', '--definitions', str(defs), str(manifests)]) == 1
+    assert '4 manifests: 1 ok, 1 prefix, 1 mismatch, 1 no-definition, 0 invalid' in capsys.readouterr().out
+
+
+def test_prefix_is_not_a_full_match(tmp_path, capsys):
+    definition = tmp_path / 'fs.json'
+    definition.write_text(json.dumps({'features': ['close']}))
+    digest = feature_hash_for_file(definition)
+    manifest = tmp_path / 'm.json'
+    manifest.write_text(json.dumps({'feature_hash': digest[:8].upper()}))
+    args = ['verify', '--definition', str(definition), str(manifest)]
+    assert main(args) == 1
+    assert capsys.readouterr().out.startswith(f'PREFIX {manifest}')
+    assert main(args + ['--allow-prefix']) == 0
+    manifest.write_text(json.dumps({'feature_hash': digest.upper()}))
+    assert main(args) == 0
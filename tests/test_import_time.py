@@ -0,0 +1,41 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE = Path(__file__).resolve().parent.parent
+TOOLS = BASE / 'tools'
+CLIS = sorted(p for p in TOOLS.glob('*.py') if '__main__' in p.read_text())
+HEAVY = {'jsonschema', 'pyarrow', 'numpy', 'pandas'}
+# Cumulative import time (interpreter start-up excluded) a --describe run may spend.
+BUDGET_MS = float(os.environ.get('ML_CONTRACTS_IMPORT_BUDGET_MS', '250'))
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def _importtime(path):
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(path), '--describe'],
+        cwd=BASE, capture_output=True, text=True, timeout=60,
+    )
+    modules = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if not m:
+            continue
+        modules[m.group(4)] = int(m.group(2))
+        if len(m.group(3)) == 1:  # top-level import: cumulative covers its children
+            total_us += int(m.group(2))
+    return proc, modules, total_us / 1000
+
+
+@pytest.mark.parametrize('path', CLIS, ids=lambda p: p.stem)
+def test_describe_starts_without_heavy_imports(path):
+    proc, modules, total_ms = _importtime(path)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    loaded = {name.split('.')[0] for name in modules} & HEAVY
+    assert not loaded, f'{path.name} --describe imports {sorted(loaded)}'
+    assert total_ms < BUDGET_MS, f'{path.name} --describe spent {total_ms:.0f}ms importing (budget {BUDGET_MS:.0f}ms)'
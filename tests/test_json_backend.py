@@ -0,0 +1,61 @@
+import pytest
+
+import validation_lib
+from validation_lib import ValidationError, available_json_backends, json_backend, json_loads, set_json_backend
+
+
+@pytest.fixture
+def restore_backend():
+    previous = json_backend()
+    yield
+    set_json_backend(previous)
+
+
+@pytest.mark.parametrize('backend', available_json_backends())
+def test_backends_decode_bytes_and_raise_value_error(backend, restore_backend):
+    set_json_backend(backend)
+    assert json_loads(b'{"rows": 389, "columns": ["time"]}') == {"rows": 389, "columns": ["time"]}
+    with pytest.raises(ValueError):
+        json_loads(b'{"rows": ')
+
+
+def test_auto_prefers_fast_backend_and_rejects_unknown(restore_backend):
+    expected = 'orjson' if validation_lib.orjson else ('msgspec' if validation_lib.msgspec else 'json')
+    assert set_json_backend('auto') == expected
+    with pytest.raises(ValidationError):
+        set_json_backend('simdjson')
+
+
+def test_unusable_env_backend_warns_and_falls_back(monkeypatch, capsys, restore_backend):
+    monkeypatch.setenv(validation_lib.JSON_BACKEND_ENV, 'simdjson')
+    assert validation_lib._backend_from_env() == set_json_backend('auto')
+    assert "ML_CONTRACTS_JSON_BACKEND='simdjson' ignored" in capsys.readouterr().err
+
+
+def test_cli_starts_with_unusable_env_backend():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    tool = Path(__file__).resolve().parent.parent / 'tools' / 'validate.py'
+    env = dict(os.environ, ML_CONTRACTS_JSON_BACKEND='not-a-backend')
+    proc = subprocess.run([sys.executable, str(tool), '--describe'], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0 and 'WARNING' in proc.stderr and '"name": "validate"' in proc.stdout
+
+
+@pytest.mark.parametrize('backend', available_json_backends())
+def test_every_backend_matches_stdlib_on_nan_and_wide_ints(backend, restore_backend):
+    import json
+    import math
+
+    set_json_backend(backend)
+    doc = b'{"sharpe": NaN, "cap": Infinity, "id": 123456789012345678901234567890, "n": -9223372036854775809}'
+    decoded = json_loads(doc)
+    assert math.isnan(decoded['sharpe']) and decoded['cap'] == math.inf
+    assert decoded['id'] == 123456789012345678901234567890 and isinstance(decoded['id'], int)
+    assert decoded == {**json.loads(doc), 'sharpe': decoded['sharpe']}
+    assert json_loads(doc.decode())['id'] == 123456789012345678901234567890
+    assert json_loads(b'[-9223372036854775809, 18446744073709551616]') == [-9223372036854775809, 18446744073709551616]
+    with pytest.raises(ValueError):
+        json_loads(b'{"id": 123456789012345678901234567890')
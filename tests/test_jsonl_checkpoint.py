@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from jsonl_checkpoint import default_checkpoint_path, load_checkpoint
+from validate import validate_jsonl_incremental
+
+BASE = Path(__file__).resolve().parent.parent
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+SCHEMA = BASE / 'schemas' / 'bars_download_manifest.schema.json'
+GOOD = SAMPLE.read_text().splitlines()[0]
+
+
+def test_resume_validates_only_appended_tail(tmp_path, capsys):
+    path = tmp_path / 'bars.jsonl'
+    path.write_text(f'{GOOD}\n{GOOD}\n')
+    assert validate_jsonl_incremental(str(path), str(SCHEMA)) == (True, 2)
+    first = load_checkpoint(default_checkpoint_path(path))
+    assert (first.offset, first.lines, first.records) == (path.stat().st_size, 2, 2)
+
+    with path.open('a') as f:
+        f.write(f'{GOOD}\n{{"schema_version": "bars_manifest.v1"}}\n')
+    assert validate_jsonl_incremental(str(path), str(SCHEMA)) == (False, 3)
+    captured = capsys.readouterr()
+    assert 'resuming after line 2' in captured.err
+    assert 'ERROR: line 4 ' in captured.out
+    # Failed runs leave the checkpoint untouched.
+    assert load_checkpoint(default_checkpoint_path(path)) == first
+
+
+def test_rewritten_prefix_forces_full_run(tmp_path, capsys):
+    path = tmp_path / 'bars.jsonl'
+    path.write_text(f'{GOOD}\n')
+    validate_jsonl_incremental(str(path), str(SCHEMA))
+    path.write_text('{"broken": true}\n' + f'{GOOD}\n')
+    assert validate_jsonl_incremental(str(path), str(SCHEMA)) == (False, 0)
+    assert 'validating in full' in capsys.readouterr().err
+
+
+def test_partial_trailing_line_is_not_checkpointed(tmp_path):
+    path = tmp_path / 'bars.jsonl'
+    path.write_text(f'{GOOD}\n{GOOD}')
+    assert validate_jsonl_incremental(str(path), str(SCHEMA), jobs=2) == (True, 2)
+    cp = load_checkpoint(default_checkpoint_path(path))
+    assert (cp.offset, cp.lines, cp.records) == (len(GOOD) + 1, 1, 1)
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from jsonl_io import shard_ranges
+from validate import validate_jsonl_per_line, validate_jsonl_sharded
+
+BASE = Path(__file__).resolve().parent.parent
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+SCHEMA = BASE / 'schemas' / 'bars_download_manifest.schema.json'
+GOOD = SAMPLE.read_text().splitlines()[0]
+
+
+def _write(path, bad_lines):
+    lines = [GOOD] * 60
+    for n in bad_lines:
+        lines[n - 1] = '{"schema_version": "bars_manifest.v1"}'
+    lines[9] = ''  # blank lines still count towards line numbers
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def test_shard_ranges_cover_file_on_line_boundaries(tmp_path):
+    path = tmp_path / 'bars.jsonl'
+    _write(path, [])
+    data = path.read_bytes()
+    ranges = shard_ranges(path, 4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start and data[start - 1:start] == b'\n'
+
+
+def test_sharded_matches_serial_with_global_line_numbers(tmp_path, capsys):
+    path = tmp_path / 'bars.jsonl'
+    _write(path, [41, 57])
+    assert validate_jsonl_sharded(str(path), str(SCHEMA), jobs=4) == validate_jsonl_per_line(str(path), str(SCHEMA))
+    out = [line for line in capsys.readouterr().out.splitlines() if line.startswith('ERROR:')]
+    assert len(out) == 2 and out[0] == out[1] and out[0].startswith('ERROR: line 41 ')
+
+    ok, count = validate_jsonl_sharded(str(path), str(SCHEMA), jobs=4, collect_all=True)
+    assert (ok, count) == (False, 57)
+    errors = [line for line in capsys.readouterr().out.splitlines() if line.startswith('ERROR:')]
+    assert [e.split()[2] for e in errors] == ['41', '57']
+
+
+def test_bad_jobs_values_are_usage_errors(capsys):
+    import validate
+
+    for args in (['--jobs', 'abc'], ['--jobs=abc'], ['--jobs', '0'], ['--jobs=-2']):
+        assert validate.main(['bars-jsonl', str(SAMPLE), *args]) == 2
+        assert capsys.readouterr().err.startswith('ERROR: --jobs ')
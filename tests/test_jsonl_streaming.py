@@ -0,0 +1,32 @@
+import gzip
+from pathlib import Path
+
+from validate import validate_jsonl_per_line
+
+BASE = Path(__file__).resolve().parent.parent
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+SCHEMA = BASE / 'schemas' / 'bars_download_manifest.schema.json'
+
+
+def test_gzip_jsonl_streams_without_temp_file(tmp_path, capsys):
+    gz = tmp_path / 'bars_download_manifest.jsonl.gz'
+    with gzip.open(gz, 'wb') as f:
+        f.write(SAMPLE.read_bytes() * 3)
+    ok, count = validate_jsonl_per_line(str(gz), str(SCHEMA), progress_every=2)
+    assert (ok, count) == (True, 6)
+    assert capsys.readouterr().err.count('PROGRESS') == 3
+
+
+def test_streaming_reports_line_number_of_bad_record(tmp_path, capsys):
+    path = tmp_path / 'bars.jsonl'
+    path.write_bytes(SAMPLE.read_bytes() + b'\n{"schema_version": "bars_manifest.v1"}\n')
+    ok, count = validate_jsonl_per_line(str(path), str(SCHEMA))
+    assert (ok, count) == (False, 2)
+    assert 'line 4 failed schema validation' in capsys.readouterr().out
+
+
+def test_bad_progress_value_is_usage_error(capsys):
+    import validate
+
+    assert validate.main(['bars-jsonl', str(SAMPLE), '--progress=abc']) == 2
+    assert 'ERROR: --progress requires an integer' in capsys.readouterr().err
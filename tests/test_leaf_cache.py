@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from dataset_hash import ALGORITHM, hash_bundle, main  # noqa: E402
+from leaf_cache import LeafCache  # noqa: E402
+
+
+def write(path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table({'close': [value, value + 1.0]}), path)
+
+
+def test_cached_rehash_reads_only_changed_files(tmp_path):
+    root = tmp_path / 'bundle'
+    for i in range(4):
+        write(root / f'{i}.parquet', float(i))
+    with LeafCache(tmp_path / 'leaves.sqlite', algorithm=ALGORITHM) as cache:
+        first = hash_bundle(root, jobs=1, cache=cache)
+        assert first.cached == 0 and len(cache) == 4
+
+        write(root / '2.parquet', 20.0)
+        second = hash_bundle(root, jobs=1, cache=cache)
+        assert second.cached == 3 and second.root != first.root
+        assert second.root == hash_bundle(root, jobs=1).root
+
+
+def test_verify_detects_stale_entries(tmp_path):
+    root = tmp_path / 'bundle'
+    write(root / 'a.parquet', 1.0)
+    cache_path = tmp_path / 'leaves.sqlite'
+    args = [str(root), '--jobs', '1', '--cache', str(cache_path)]
+    assert main(args) == 0
+
+    # Same-size in-place rewrite with the mtime restored: the stat signature cannot see it.
+    st = os.stat(root / 'a.parquet')
+    write(tmp_path / 'b.parquet', 2.0)
+    replacement = (tmp_path / 'b.parquet').read_bytes()
+    if len(replacement) != st.st_size:
+        pytest.skip('replacement parquet differs in size')
+    with open(root / 'a.parquet', 'r+b') as fh:
+        fh.write(replacement)
+    os.utime(root / 'a.parquet', ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    with LeafCache(cache_path, algorithm=ALGORITHM) as cache:
+        assert hash_bundle(root, jobs=1, cache=cache).cached == 1
+    assert main(args + ['--verify', '1']) == 1
+    with LeafCache(cache_path, algorithm=ALGORITHM) as cache:
+        result = hash_bundle(root, jobs=1, cache=cache, verify=1)
+        assert result.stale == [] and result.verified == 1
+
+
+def test_rows_for_removed_files_are_purged(tmp_path):
+    root = tmp_path / 'bundle'
+    for name in ('a', 'b', 'sub/c'):
+        write(root / f'{name}.parquet', 1.0)
+    write(tmp_path / 'bundle2' / 'x.parquet', 1.0)  # sibling root sharing the name prefix
+    with LeafCache(tmp_path / 'leaves.sqlite', algorithm=ALGORITHM) as cache:
+        hash_bundle(root, jobs=1, cache=cache)
+        hash_bundle(tmp_path / 'bundle2', jobs=1, cache=cache)
+        assert len(cache) == 4
+        (root / 'a.parquet').unlink()
+        (root / 'sub' / 'c.parquet').rename(root / 'sub' / 'd.parquet')
+        result = hash_bundle(root, jobs=1, cache=cache)
+        assert result.purged == 2 and result.cached == 1
+        assert sorted(os.path.basename(p) for p in cache.paths_under(str(root.resolve()))) == ['b.parquet', 'd.parquet']
+        assert len(cache) == 3
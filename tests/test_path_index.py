@@ -0,0 +1,46 @@
+import json
+
+from promotion_rules import MANIFEST_SCHEMA_PATH, RULE_PATH, audit_rule_against_schema, compile_rule
+from validation_lib import build_path_index
+
+SCHEMA = json.load(MANIFEST_SCHEMA_PATH.open())
+RULE = json.load(RULE_PATH.open())
+
+
+def test_index_resolves_refs_combinators_items_and_cycles():
+    schema = {
+        '$defs': {
+            'node': {'type': 'object', 'properties': {'name': {}, 'children': {'type': 'array', 'items': {'$ref': '#/$defs/node'}}}},
+            'kpi': {'properties': {'value': {'type': 'number'}}},
+        },
+        'properties': {
+            'tree': {'$ref': '#/$defs/node'},
+            'metrics': {'allOf': [{'properties': {'a': {'$ref': '#/$defs/kpi'}}}, {'properties': {'b': {}}}]},
+            'choice': {'oneOf': [{'properties': {'x': {}}}, {'properties': {'y': {}}}]},
+            'counts': {'additionalProperties': {'type': 'integer'}},
+        },
+    }
+    index = build_path_index(schema)
+    assert {'tree.name', 'tree.children.*.name', 'metrics.a.value', 'metrics.b', 'choice.y', 'counts.*'} <= index.paths
+    assert 'tree.children.*.children.*.children.3.name' in index
+    assert index.has_path('tree.children.0.name') and index.has_path('counts.anything')
+    assert 'metrics.a.valu' not in index and index.children('metrics') == ['a', 'b']
+
+
+def test_index_walks_if_then_else():
+    schema = {'properties': {'model': {
+        'if': {'properties': {'family': {'const': 'xgboost'}}},
+        'then': {'properties': {'trees': {}}},
+        'else': {'properties': {'layers': {'items': {'properties': {'width': {}}}}}},
+    }}}
+    index = build_path_index(schema)
+    assert {'model.family', 'model.trees', 'model.layers.*.width'} <= index.paths
+    assert index.children('model') == ['family', 'layers', 'trees']
+
+
+def test_rule_audit_checks_full_paths():
+    assert audit_rule_against_schema(RULE, SCHEMA)['valid']
+    typo = {'and': RULE['and'] + [{'>=': [{'var': 'metrics.sharpe_sim.valu'}, 1.0]}]}
+    audit = audit_rule_against_schema(typo, SCHEMA)
+    assert audit['missing_metrics'] == ['metrics.sharpe_sim.valu'] and not audit['valid']
+    assert compile_rule(typo).unknown_variables(build_path_index(SCHEMA)) == ['metrics.sharpe_sim.valu']
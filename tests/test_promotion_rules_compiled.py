@@ -0,0 +1,47 @@
+import json
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from promotion_rules import RULE_PATH, RuleError, compile_rule, evaluate_batch, evaluate_columns
+
+BASE = Path(__file__).resolve().parent.parent
+RULE = json.load(RULE_PATH.open())
+VALID_MANIFEST = json.load((BASE / 'fixtures' / 'model_manifest_valid.json').open())
+
+
+def test_explain_reports_first_failed_clause():
+    compiled = compile_rule(RULE)
+    assert compiled.explain(VALID_MANIFEST).passed
+
+    bad = deepcopy(VALID_MANIFEST)
+    bad['latency_metrics']['p95_ms']['value'] = 30.0
+    bad['stability']['variance']['value'] = 1.0
+    result = compiled.explain(bad)
+    assert not result.passed and result.failed_clause == 4
+    assert result.clause == {'<=': [{'var': 'latency_metrics.p95_ms.value'}, 25.0]}
+
+    del bad['metrics']
+    with pytest.raises(RuleError):
+        compiled.explain(bad)
+
+
+def test_batch_over_manifests_and_columns():
+    bad = deepcopy(VALID_MANIFEST)
+    bad['metrics']['sharpe_sim']['value'] = 0.1
+    results = evaluate_batch(RULE, [VALID_MANIFEST, bad, {}])
+    assert [r.passed for r in results] == [True, False, False]
+    assert results[1].failed_clause == 0 and results[2].error.startswith('Variable path not found')
+
+    rule = {'and': [
+        {'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]},
+        {'<=': [{'var': 'latency_metrics.p95_ms.value'}, 25.0]},
+    ]}
+    columns = {
+        'metrics.sharpe_sim.value': [2.0, 1.0, 1.6],
+        'latency_metrics.p95_ms.value': [10.0, 10.0, 40.0],
+    }
+    assert [(r.passed, r.failed_clause) for r in evaluate_columns(rule, columns)] == [(True, None), (False, 0), (False, 1)]
+    with pytest.raises(RuleError):
+        evaluate_columns(rule, {'metrics.sharpe_sim.value': [1.0]})
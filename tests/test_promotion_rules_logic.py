@@ -0,0 +1,80 @@
+import pytest
+
+from promotion_rules import RuleError, compile_rule, evaluate_rule, referenced_variables
+
+MANIFEST = {
+    'metrics': {'sharpe_sim': {'value': 1.8}, 'f1_macro': {'value': 0.3}},
+    'model': {'family': 'xgboost', 'tags': ['prod', 'l2']},
+}
+
+
+@pytest.mark.parametrize('rule,expected', [
+    ({'or': [{'>=': [{'var': 'metrics.f1_macro.value'}, 0.4]}, {'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]}]}, True),
+    ({'!': [{'>=': [{'var': 'metrics.f1_macro.value'}, 0.4]}]}, True),
+    ({'!!': [{'var': 'model.tags'}]}, True),
+    ({'==': [{'var': 'model.family'}, 'xgboost']}, True),
+    ({'!=': [{'var': 'model.family'}, 'xgboost']}, False),
+    ({'===': [{'var': 'metrics.sharpe_sim.value'}, 1.8]}, True),
+    ({'!==': [1, True]}, True),
+    ({'in': [{'var': 'model.family'}, ['xgboost', 'lightgbm']]}, True),
+    ({'in': ['l2', {'var': 'model.tags'}]}, True),
+    ({'<': [1.5, {'var': 'metrics.sharpe_sim.value'}, 2.0]}, True),
+    ({'<=': [0.4, {'var': 'metrics.f1_macro.value'}, 1.0]}, False),
+    ({'>=': [{'var': ['metrics.minority_recall.value', 0.5]}, 0.45]}, True),
+    ({'==': [{'var': 'model.tags.1'}, 'l2']}, True),
+    ({'if': [{'==': [{'var': 'model.family'}, 'xgboost']},
+             {'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]},
+             {'>=': [{'var': 'metrics.sharpe_sim.value'}, 2.5]}]}, True),
+])
+def test_extended_operators(rule, expected):
+    assert evaluate_rule(rule, MANIFEST) is expected
+
+
+def test_missing_var_without_default_raises():
+    with pytest.raises(RuleError):
+        evaluate_rule({'>=': [{'var': 'metrics.minority_recall.value'}, 0.45]}, MANIFEST)
+    assert referenced_variables({'var': ['metrics.x.value', 0]}) == {'metrics.x.value'}
+
+
+def test_optimize_puts_most_selective_clause_first():
+    rule = {'and': [
+        {'>=': [{'var': 'metrics.sharpe_sim.value'}, 0.0]},  # almost always true
+        {'or': [{'==': [{'var': 'model.family'}, 'x']}, {'>=': [{'var': 'metrics.f1_macro.value'}, 0.9]}]},
+        {'>=': [{'var': 'metrics.f1_macro.value'}, 0.8]},  # usually fails, cheap
+    ]}
+    samples = [{'metrics': {'sharpe_sim': {'value': 1.0}, 'f1_macro': {'value': f / 10}}, 'model': {'family': 'y'}}
+               for f in range(10)]
+    compiled = compile_rule(rule, samples=samples)
+    assert compiled.clause_order == [2, 1, 0]
+    baseline = compile_rule(rule)
+    for m in samples:
+        assert compiled.evaluate(m) == baseline.evaluate(m)
+    assert compiled.explain(samples[0]).failed_clause == 2
+
+
+def test_vectorized_extended_operators():
+    np = pytest.importorskip('numpy')
+    from promotion_rules import evaluate_table
+
+    rule = {'and': [
+        {'or': [{'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]}, {'!': [{'<': [{'var': 'metrics.f1_macro.value'}, 0.4]}]}]},
+        {'<=': [0.0, {'var': ['latency_metrics.p95_ms.value', 10.0]}, 25.0]},
+        {'in': [{'var': 'metrics.bucket.value'}, [1, 2]]},
+    ]}
+    table = {'sharpe_sim': np.array([2.0, 1.0, 1.0]), 'f1_macro': np.array([0.1, 0.5, 0.1]), 'bucket': np.array([1, 2, 2])}
+    result = evaluate_table(rule, table)
+    assert result.passed.tolist() == [True, True, False]
+    assert result.failed_clause.tolist() == [-1, -1, 0]
+
+
+def test_evaluate_rule_cache_tracks_identity_and_mutation():
+    import promotion_rules
+
+    rule = {'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]}
+    assert evaluate_rule(rule, MANIFEST) is True
+    before = promotion_rules._compiled_from_json.cache_info()
+    assert evaluate_rule(rule, MANIFEST) is True
+    assert promotion_rules._compiled_from_json.cache_info() == before  # identity hit, no JSON key built
+    rule['>='][1] = 2.0
+    assert evaluate_rule(rule, MANIFEST) is False
+    assert evaluate_rule(compile_rule(rule), MANIFEST) is False
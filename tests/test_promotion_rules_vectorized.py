@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from promotion_rules import RuleError, evaluate_columns, evaluate_table  # noqa: E402
+
+RULE = {'and': [
+    {'>=': [{'var': 'metrics.sharpe_sim.value'}, 1.5]},
+    {'<=': [{'var': 'latency_metrics.p95_ms.value'}, 25.0]},
+]}
+
+
+def test_vectorized_matches_row_wise():
+    rng = np.random.default_rng(0)
+    columns = {
+        'metrics.sharpe_sim.value': rng.uniform(0, 3, 1000),
+        'latency_metrics.p95_ms.value': rng.uniform(0, 50, 1000),
+    }
+    result = evaluate_table(RULE, columns)
+    rows = evaluate_columns(RULE, {k: v.tolist() for k, v in columns.items()})
+    assert result.passed.tolist() == [r.passed for r in rows]
+    assert result.failed_clause.tolist() == [-1 if r.passed else r.failed_clause for r in rows]
+
+
+def test_leaderboard_columns_arrow_and_missing_values():
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({'sharpe_sim': [2.0, None, 1.6], 'lat': [10.0, 10.0, math.nan]})
+    result = evaluate_table(RULE, table, column_map={'latency_metrics.p95_ms.value': 'lat'})
+    assert result.passed.tolist() == [True, False, False]
+    assert result.failures_by_clause() == {0: 1, 1: 1}
+    with pytest.raises(RuleError):
+        evaluate_table(RULE, table)
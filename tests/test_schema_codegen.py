@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+from schema_codegen import check_against_jsonschema, get_fast_validator
+import validate
+from validate import validate_jsonl_per_line
+
+BASE = Path(__file__).resolve().parent.parent
+SAMPLE = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+BARS_SCHEMA_PATH = BASE / 'schemas' / 'bars_download_manifest.schema.json'
+BARS_SCHEMA = json.load(BARS_SCHEMA_PATH.open())
+MANIFEST_SCHEMA = json.load((BASE / 'schemas' / 'manifest.schema.json').open())
+
+
+def test_fast_validator_agrees_with_jsonschema_on_fixtures():
+    records = [json.loads(line) for line in SAMPLE.read_text().splitlines() if line.strip()]
+    assert check_against_jsonschema(BARS_SCHEMA, records) == []
+
+
+def test_fast_path_validates_and_reports_errors(tmp_path, capsys):
+    assert get_fast_validator(BARS_SCHEMA) is not None
+    assert validate_jsonl_per_line(str(SAMPLE), str(BARS_SCHEMA_PATH), fast=True) == (True, 2)
+    bad = tmp_path / 'bars.jsonl'
+    bad.write_text(SAMPLE.read_text().replace('"1 sec"', '"5 sec"'))
+    assert validate_jsonl_per_line(str(bad), str(BARS_SCHEMA_PATH), fast=True) == (False, 1)
+    assert "line 2 failed schema validation: bar_size: '5 sec' is not one of" in capsys.readouterr().out
+
+
+def test_unsupported_schema_falls_back_to_jsonschema(tmp_path, capsys):
+    schema = {'type': 'object', 'required': ['rows'],
+              'properties': {'rows': {'oneOf': [{'type': 'integer', 'minimum': 0}, {'type': 'string', 'pattern': '^[0-9]+$'}]}}}
+    assert get_fast_validator(schema) is None
+    assert get_fast_validator(MANIFEST_SCHEMA) is None
+    schema_path = tmp_path / 'oneof.schema.json'
+    schema_path.write_text(json.dumps(schema))
+    jsonl = tmp_path / 'rows.jsonl'
+    jsonl.write_text('{"rows": 3}\n{"rows": "12"}\n')
+    assert validate.main(['bars-jsonl', str(jsonl), f'schema={schema_path}', '--fast']) == 0
+    captured = capsys.readouterr()
+    assert 'NOTE: schema not supported by the fast path; using jsonschema' in captured.err
+    assert 'Schema validation: PASS (records=2)' in captured.out
+    jsonl.write_text('{"rows": 3}\n{"rows": "x"}\n')
+    assert validate.main(['bars-jsonl', str(jsonl), f'schema={schema_path}', '--fast']) == 1
+    assert "line 2 failed schema validation: 'x' is not valid under any of the given schemas" in capsys.readouterr().out
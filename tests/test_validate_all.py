@@ -0,0 +1,19 @@
+import json
+
+import validate_all
+
+
+def test_validate_all_runs_stages_in_process(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(validate_all, 'OUT_DIR', tmp_path)
+    assert validate_all.main([]) == 0
+    summary = json.loads((tmp_path / 'summary.json').read_text())
+    assert set(summary['stage_timings_sec']) == {'schemas', 'fixtures', 'promotion_rule'}
+    assert summary['fixtures'] == 2 and summary['invalid_examples'] == 1 and summary['rule_errors'] == 0
+    for name in ('schema_audit.json', 'fixtures_audit.json', 'promotion_rule_audit.json'):
+        assert (tmp_path / name).exists()
+    assert capsys.readouterr().out.startswith('SUMMARY ')
+
+    serial = tmp_path / 'serial'
+    monkeypatch.setattr(validate_all, 'OUT_DIR', serial)
+    assert validate_all.main(['--serial']) == 0
+    assert json.loads((serial / 'schema_audit.json').read_text()) == json.loads((tmp_path / 'schema_audit.json').read_text())
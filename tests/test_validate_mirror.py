@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from validate_mirror import frequency_from_path, main, validate_mirror  # noqa: E402
+
+
+def minutes_table(wap=1.0, bar_count=1):
+    return pa.table({
+        'timestamp': ['2025-09-15T09:30:00'] * 3,
+        'open': [1.0] * 3, 'high': [1.0] * 3, 'low': [1.0] * 3, 'close': [1.0] * 3, 'volume': [1.0] * 3,
+        'barCount': pa.array([bar_count] * 3, pa.int64()),
+        'WAP': [wap] * 3,
+    })
+
+
+def test_frequency_inferred_from_path_then_columns(tmp_path):
+    assert frequency_from_path(tmp_path / 'mirror' / 'L2' / 'AAPL.parquet', tmp_path) == 'Level2'
+    assert frequency_from_path(tmp_path / 'AAPL_hourly_2025.parquet') == 'Hourly'
+    assert frequency_from_path(tmp_path / 'AAPL.parquet', tmp_path) is None
+
+    root = tmp_path / 'mirror'
+    (root / 'misc').mkdir(parents=True)
+    pq.write_table(minutes_table(), root / 'misc' / 'AAPL.parquet')
+    audit = validate_mirror(root, jobs=1, cache_path=None)
+    assert audit['files'][0]['frequency'] == 'Minutes' and audit['invalid_files'] == 0
+
+
+def test_mirror_audit_and_result_cache(tmp_path):
+    root = tmp_path / 'Stocks_clean_v1'
+    (root / 'Minutes').mkdir(parents=True)
+    pq.write_table(minutes_table(), root / 'Minutes' / 'AAPL.parquet')
+    pq.write_table(minutes_table(bar_count=None), root / 'Minutes' / 'MSFT.parquet')
+    (root / 'Minutes' / 'notes.txt').write_text('ignored')
+    cache, out = tmp_path / 'cache.json', tmp_path / 'mirror_audit.json'
+
+    argv = [str(root), '--jobs', '2', '--cache', str(cache), '--out', str(out)]
+    assert main(argv) == 1
+    audit = json.loads(out.read_text())
+    assert [f['file'] for f in audit['files']] == ['Minutes/AAPL.parquet', 'Minutes/MSFT.parquet']
+    assert audit['invalid_files'] == 1 and audit['cached_files'] == 0
+
+    # Second run is served from the cache until a file changes.
+    again = validate_mirror(root, jobs=1, cache_path=cache)
+    assert again['cached_files'] == 2 and again['invalid_files'] == 1
+    pq.write_table(minutes_table(), root / 'Minutes' / 'MSFT.parquet')
+    st = os.stat(root / 'Minutes' / 'MSFT.parquet')
+    os.utime(root / 'Minutes' / 'MSFT.parquet', ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    fixed = validate_mirror(root, jobs=1, cache_path=cache)
+    assert fixed['cached_files'] == 1 and fixed['invalid_files'] == 0
+
+
+def test_bad_file_is_reported_not_fatal(tmp_path, monkeypatch):
+    import validate_mirror
+
+    root = tmp_path / 'Stocks_clean_v1'
+    (root / 'Minutes').mkdir(parents=True)
+    pq.write_table(minutes_table(), root / 'Minutes' / 'AAPL.parquet')
+    (root / 'Minutes' / 'BROKEN.parquet').write_bytes(b'PAR1 not really parquet')
+    real = validate_mirror.validate_file
+
+    def flaky(path, gates, tier='auto'):
+        if str(path).endswith('BROKEN.parquet'):
+            raise RuntimeError('decoder exploded')
+        return real(path, gates, tier=tier)
+
+    monkeypatch.setattr(validate_mirror, 'validate_file', flaky)
+    out = tmp_path / 'mirror_audit.json'
+    assert main([str(root), '--jobs', '1', '--cache', str(tmp_path / 'cache.json'), '--out', str(out)]) == 1
+    audit = json.loads(out.read_text())
+    by_file = {f['file']: f for f in audit['files']}
+    assert by_file['Minutes/AAPL.parquet']['valid'] is True
+    assert by_file['Minutes/BROKEN.parquet']['errors'] == ['validation crashed: decoder exploded']
+    assert by_file['Minutes/BROKEN.parquet']['crashed'] is True and audit['crashed_files'] == 1
+    cached = json.loads((tmp_path / 'cache.json').read_text())['entries']
+    assert [os.path.basename(k) for k in cached] == ['AAPL.parquet']
+
+    # The crash is retried on the next run instead of being served from the cache.
+    monkeypatch.setattr(validate_mirror, 'validate_file', real)
+    audit = validate_mirror.validate_mirror(root, jobs=1, cache_path=tmp_path / 'cache.json')
+    broken = next(f for f in audit['files'] if f['file'] == 'Minutes/BROKEN.parquet')
+    assert broken['cached'] is False and 'crashed' not in broken and audit['crashed_files'] == 0
@@ -0,0 +1,130 @@
+import math
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from validate_parquet import CONTRACT_PATH, load_quality_gates, validate_file  # noqa: E402
+from validation_lib import load_json  # noqa: E402
+
+CONTRACT = load_json(CONTRACT_PATH)
+VENDOR = ['WAP', 'VWAP', '9EMA', '20EMA', '50EMA', '200EMA', 'MACD']
+
+
+def seconds_table(n=6, nan_at=None):
+    cols = {'timestamp': pa.array(range(n), pa.timestamp('ns', tz='UTC'))}
+    for c in ['open', 'high', 'low', 'close', 'volume']:
+        cols[c] = pa.array([1.0] * n)
+    cols['barCount'] = pa.array([1] * n, pa.int64())
+    for c in VENDOR:
+        cols[c] = pa.array([math.nan if (c, i) == nan_at else 1.0 for i in range(n)])
+    return pa.table(cols)
+
+
+def test_seconds_gates_scan_row_groups(tmp_path):
+    gates = load_quality_gates(CONTRACT, 'Seconds')
+    good = tmp_path / 'good.parquet'
+    pq.write_table(seconds_table(), good, row_group_size=2)
+    report = validate_file(good, gates)
+    assert report.valid and report.rows == 6 and report.row_groups == 3
+
+    feather = pytest.importorskip('pyarrow.feather')
+    ftr = tmp_path / 'good.ftr'
+    feather.write_feather(seconds_table(nan_at=('WAP', 0)), ftr)
+    assert validate_file(ftr, gates).errors == ["column 'WAP' has 1 NaN/null values"]
+
+    bad = tmp_path / 'bad.parquet'
+    pq.write_table(seconds_table(nan_at=('VWAP', 5)).drop_columns(['MACD']), bad, row_group_size=2)
+    errors = validate_file(bad, gates, tier='scan').errors
+    assert "column 'VWAP' has 1 NaN/null values" in errors
+    assert "missing column 'MACD'" in errors and 'expected 14 columns, found 13' in errors
+
+
+def test_level2_spread_depth_and_dtype(tmp_path):
+    gates = load_quality_gates(CONTRACT, 'Level2')
+    table = pa.table({
+        'timestamp_utc': pa.array([0, 1, 2], pa.timestamp('us', tz='UTC')),
+        'bid_price': [1.0, 2.0, 3.0],
+        'ask_price': [1.5, 2.0, 3.5],
+        'bid_size': [1.0, 1.0, 1.0],
+        'ask_size': [1.0, 1.0, 1.0],
+        'l2': pa.array([[{'bid_price': 1.0}], [], [{'bid_price': 3.0}]]),
+    })
+    path = tmp_path / 'l2.parquet'
+    pq.write_table(table, path)
+    errors = validate_file(path, gates, tier='scan').errors
+    assert 'spread_check bid_price < ask_price violated in 1 rows' in errors
+    assert 'depth_check len(l2) >= 1 violated in 1 rows' in errors
+    assert any("'timestamp_utc' dtype" in e for e in errors)
+
+
+def test_footer_tier_decides_from_statistics(tmp_path):
+    gates = load_quality_gates(CONTRACT, 'Minutes')
+    table = pa.table({
+        'timestamp': ['2025-09-15T09:30:00'] * 4,
+        'open': [1.0] * 4, 'high': [1.0] * 4, 'low': [1.0] * 4, 'close': [1.0] * 4, 'volume': [1.0] * 4,
+        'barCount': pa.array([1, None, 1, 1], pa.int64()),
+        'WAP': [math.nan] * 4,
+    })
+    path = tmp_path / 'minutes.parquet'
+    pq.write_table(table, path, row_group_size=2)
+    report = validate_file(path, gates, tier='footer')
+    assert report.valid is False and report.decided_by == 'footer'
+    assert report.errors == ["column 'barCount' has 1 null values (footer statistics)"]
+
+    # Float columns without nulls cannot be proven NaN-free from statistics.
+    pq.write_table(table.set_column(6, 'barCount', pa.array([1] * 4, pa.int64())), path)
+    report = validate_file(path, gates, tier='footer')
+    assert report.valid is None and "NaN count for 'open'" in report.undecided
+    report = validate_file(path, gates)
+    assert report.valid is True and report.decided_by == 'scan'
+
+
+def test_unusable_columns_fail_instead_of_crashing(tmp_path, monkeypatch):
+    gates = load_quality_gates(CONTRACT, 'Level2')
+    table = pa.table({
+        'timestamp_utc': pa.array([0, 1], pa.timestamp('ns', tz='UTC')),
+        'bid_price': [1.0, 2.0],
+        'ask_price': [1.5, 2.5],
+        'bid_size': [1.0, 1.0],
+        'ask_size': [1.0, 1.0],
+        'l2': ['[{"bid_price": 1.0}]', '[]'],  # JSON text, not a list column
+    })
+    path = tmp_path / 'l2_strings.parquet'
+    pq.write_table(table, path)
+    for tier in ('auto', 'scan'):
+        report = validate_file(path, gates, tier=tier)
+        assert report.valid is False
+        assert report.errors == ["column 'l2' dtype string is not a list; depth_check needs list lengths"]
+
+    import validate_parquet
+
+    def broken(*args, **kwargs):
+        raise pa.ArrowInvalid('corrupt page')
+        yield
+
+    good = tmp_path / 'good.parquet'
+    pq.write_table(seconds_table(), good)
+    monkeypatch.setattr(validate_parquet, 'iter_column_chunks', broken)
+    report = validate_file(good, load_quality_gates(CONTRACT, 'Seconds'), tier='scan')
+    assert report.valid is False and report.errors == ['data scan failed: corrupt page']
+
+
+def test_string_spread_column_is_a_schema_error(tmp_path):
+    gates = load_quality_gates(CONTRACT, 'Level2')
+    table = pa.table({
+        'timestamp_utc': pa.array([0, 1], pa.timestamp('ns', tz='UTC')),
+        'bid_price': ['1.0', '2.0'],
+        'ask_price': [1.5, 2.5],
+        'bid_size': [1.0, 1.0],
+        'ask_size': [1.0, 1.0],
+        'l2': pa.array([[{'bid_price': 1.0}], [{'bid_price': 2.0}]]),
+    })
+    path = tmp_path / 'l2_string_bid.parquet'
+    pq.write_table(table, path)
+    for tier in ('auto', 'footer', 'scan'):
+        report = validate_file(path, gates, tier=tier)
+        assert report.valid is False
+        assert report.errors == ["column 'bid_price' dtype string is not numeric; spread_check compares numbers"]
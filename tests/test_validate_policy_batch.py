@@ -0,0 +1,74 @@
+import copy
+import json
+from pathlib import Path
+
+import validate
+from validation_lib import load_json
+
+BASE = Path(__file__).resolve().parent.parent
+POLICY = BASE / 'contracts' / 'fixtures' / 'policy_v1.json'
+WITH_POLICY = load_json(BASE / 'contracts' / 'fixtures' / 'export_manifest_with_policy.json')
+
+
+def _manifest(**data_collection):
+    m = copy.deepcopy(WITH_POLICY)
+    m['export_manifest']['data_collection'].update(data_collection)
+    return m
+
+
+def test_compare_accepts_dicts_paths_and_normalized_policy():
+    drifted = _manifest(l2_window='09:00-11:00', session_timezone='UTC')
+    from_path = validate.compare_manifest_to_policy(drifted, str(POLICY))
+    assert from_path == validate.compare_manifest_to_policy(drifted, load_json(POLICY))
+    assert from_path == validate.compare_data_collection(drifted, validate.normalize_policy(POLICY))
+    assert from_path == [
+        'data_collection.session_timezone differs from policy (manifest=UTC policy=America/New_York)',
+        'data_collection.l2_window vs policy l2_window_default differs from policy (manifest=09:00-11:00 policy=08:30-11:00)',
+    ]
+    assert validate.compare_manifest_to_policy(WITH_POLICY, POLICY) == []
+
+
+def test_policy_batch_aggregates_field_counts(tmp_path, capsys):
+    registry = tmp_path / 'registry'
+    for i in range(12):
+        d = registry / f'model_{i:02d}'
+        d.mkdir(parents=True)
+        m = _manifest(policy_version='v0') if i % 3 == 0 else _manifest(l2_window='09:00-11:00') if i % 4 == 0 else WITH_POLICY
+        (d / 'export_manifest.json').write_text(json.dumps(m))
+    (registry / 'model_00' / 'notes.json').write_text('{"export_manifest": {}}')
+    (registry / 'model_01' / 'broken.json').write_text('{')
+
+    report = validate.compare_policy_batch(validate.expand_manifest_paths(registry), POLICY, jobs=4)
+    assert (report['manifests'], report['with_warnings'], report['errors']) == (14, 7, 1)
+    assert report['field_counts'] == {'policy_version': 4, 'l2_window': 2, 'data_collection': 1}
+    assert validate.compare_policy_batch([WITH_POLICY], POLICY, jobs=1)['with_warnings'] == 0
+
+    glob = str(registry / '*' / 'export_manifest.json')
+    assert validate.main(['policy-batch', glob, '--policy', str(POLICY), '--json']) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out['manifests'] == 12 and out['field_counts'] == {'policy_version': 4, 'l2_window': 2}
+    assert validate.main(['policy-batch', str(registry), '--policy', str(POLICY)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert 'FIELD: policy_version 4' in lines and lines[-1] == 'Policy batch: 14 manifests, 7 with warnings, 1 unreadable'
+    assert validate.main(['policy-batch', str(registry)]) == 2
+    assert validate.main(['policy-batch', str(tmp_path / 'none' / '*.json'), '--policy', str(POLICY)]) == 2
+
+
+def test_keyword_names_and_bad_jobs(capsys):
+    assert validate.compare_manifest_to_policy(manifest_path=str(BASE / 'contracts' / 'fixtures' / 'export_manifest_with_policy.json'),
+                                               policy_path=str(POLICY)) == []
+    for args in (['--jobs', 'x'], ['--jobs=0']):
+        assert validate.main(['policy-batch', str(BASE), '--policy', str(POLICY), *args]) == 2
+        assert capsys.readouterr().err.startswith('ERROR: --jobs ')
+
+
+def test_malformed_manifests_are_errors_not_crashes(tmp_path, capsys):
+    (tmp_path / 'list.json').write_text('{"export_manifest": []}')
+    (tmp_path / 'dc.json').write_text('{"export_manifest": {"data_collection": "v1"}}')
+    (tmp_path / 'ok.json').write_text(json.dumps(WITH_POLICY))
+    report = validate.compare_policy_batch(validate.expand_manifest_paths(tmp_path), POLICY, jobs=2)
+    assert (report['manifests'], report['errors'], report['with_warnings']) == (3, 2, 0)
+    errors = {Path(r['manifest']).name: r['error'] for r in report['results'] if r['error']}
+    assert errors == {'list.json': 'export_manifest is not a JSON object', 'dc.json': 'data_collection is not a JSON object'}
+    assert validate.main(['policy-batch', str(tmp_path), '--policy', str(POLICY)]) == 1
+    assert capsys.readouterr().out.splitlines()[-1] == 'Policy batch: 3 manifests, 0 with warnings, 2 unreadable'
@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+feather = pytest.importorskip('pyarrow.feather')
+
+from validate_raw import CONTRACT_PATH, load_raw_spec, validate_raw_file  # noqa: E402
+from validation_lib import load_json  # noqa: E402
+
+CONTRACT = load_json(CONTRACT_PATH)
+
+
+def raw_bars(n=3, wap=math.nan, close=1.0):
+    return pa.table({
+        'timestamp': ['2025-09-15 09:30:00'] * n,
+        'open': [1.0] * n, 'high': [1.0] * n, 'low': [1.0] * n,
+        'close': [close] * n, 'volume': [1.0] * n,
+        'barCount': pa.array([1] * n, pa.int64()),
+        'WAP': [wap] * n,
+    })
+
+
+def test_seconds_ftr_reports_repairable_all_nan_wap(tmp_path):
+    path = tmp_path / 'AAPL.ftr'
+    feather.write_feather(raw_bars(), path)
+    report = validate_raw_file(path, 'Seconds', load_raw_spec(CONTRACT, 'Seconds'))
+    assert report.valid and report.rows == 3
+    assert report.repair['WAP'] == {'nan_count': 3, 'rows': 3, 'all_nan': True, 'repairable': True}
+    assert report.warnings == ["column 'WAP' is entirely NaN; repairable during mirror build"]
+
+
+def test_minutes_parquet_nullability_dtype_and_extension(tmp_path):
+    spec = load_raw_spec(CONTRACT, 'Minutes')
+    table = raw_bars(wap=1.0, close=math.nan)
+    table = table.set_column(6, 'barCount', pa.array([1, 1, 1], pa.int32()))
+    path = tmp_path / 'AAPL.parquet'
+    pq.write_table(table, path)
+    report = validate_raw_file(path, 'Minutes', spec)
+    assert not report.valid
+    assert "column 'close' is not nullable but has 3 NaN/null values" in report.errors
+    assert "column 'barCount' dtype int32 does not match int64" in report.errors
+    assert report.repair['WAP']['all_nan'] is False
+
+    csv = tmp_path / 'AAPL.csv'
+    csv.write_text('timestamp\n')
+    assert 'unexpected extension' in validate_raw_file(csv, 'Minutes', spec).errors[0]
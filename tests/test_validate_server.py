@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+import validate_client
+from validate_server import ValidationServer, ValidationService
+
+BASE = Path(__file__).resolve().parent.parent
+VALID = BASE / 'fixtures' / 'model_manifest_valid.json'
+INVALID = BASE / 'fixtures' / 'model_manifest_invalid_missing_field.json'
+JSONL = BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl'
+POLICY = BASE / 'contracts' / 'policies' / 'data_collection_policy_v1.json'
+WITH_POLICY = BASE / 'contracts' / 'fixtures' / 'export_manifest_with_policy.json'
+
+
+def test_service_endpoints_and_exit_codes():
+    svc = ValidationService()
+    assert svc.handle({'op': 'validate-manifest', 'manifest_path': str(VALID)})['exit_code'] == 0
+    bad = svc.handle({'op': 'validate-manifest', 'manifest_path': str(INVALID), 'id': 3})
+    assert bad['exit_code'] == 1 and bad['id'] == 3 and any('required property' in e for e in bad['errors'])
+
+    lines = JSONL.read_text().splitlines()
+    ok = svc.handle({'op': 'validate-jsonl-chunk', 'lines': lines})
+    assert ok['exit_code'] == 0 and ok['records'] == 2
+    broken = svc.handle({'op': 'validate-jsonl-chunk', 'lines': [lines[0], '{"x": 1}', 'nope'], 'line_offset': 10, 'all_errors': True})
+    assert broken['exit_code'] == 1 and [e['line'] for e in broken['errors']] == [12, 13]
+
+    promo = svc.handle({'op': 'evaluate-promotion', 'manifest': json.loads(VALID.read_text())})
+    assert promo['exit_code'] == 0 and promo['passed'] is True
+    policy = svc.handle({'op': 'compare-policy', 'manifest_path': str(WITH_POLICY), 'policy_path': str(POLICY)})
+    assert policy == {'ok': True, 'exit_code': 0, 'warnings': []}
+
+    assert svc.handle({'op': 'nope'})['exit_code'] == 2
+    assert svc.handle({'op': 'validate-manifest'})['exit_code'] == 2
+
+
+def test_service_hot_reloads_changed_schema(tmp_path):
+    schema = tmp_path / 'schema.json'
+    schema.write_text(json.dumps({'type': 'object', 'required': ['a']}))
+    svc = ValidationService()
+    req = {'op': 'validate-manifest', 'manifest': {'b': 1}, 'schema_path': str(schema)}
+    assert svc.handle(req)['exit_code'] == 1
+    schema.write_text(json.dumps({'type': 'object', 'required': ['b']}))
+    st = schema.stat()
+    os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert svc.handle(req)['exit_code'] == 0
+    assert svc.docs.reloads == 1
+
+
+def test_client_over_socket_mirrors_cli(tmp_path, capsys):
+    sock = tmp_path / 'v.sock'
+    server = ValidationServer(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        args = ['--socket', str(sock), '--no-fallback']
+        assert validate_client.main(args + [str(WITH_POLICY), str(POLICY)]) == 0
+        assert 'Policy comparison: OK' in capsys.readouterr().out
+        assert validate_client.main(args + [str(INVALID)]) == 1
+        assert validate_client.main(args + ['bars-jsonl', str(JSONL)]) == 0
+        assert 'records=2' in capsys.readouterr().out
+        assert validate_client.main(args + ['promotion', str(VALID)]) == 0
+        assert validate_client.main(args + ['bars-jsonl', str(JSONL), '--bogus']) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not sock.exists()
+    assert validate_client.main(['--socket', str(sock), '--no-fallback', str(VALID)]) == 2
+    assert validate_client.main(['--socket', str(sock), str(VALID)]) == 0
+
+
+def test_handler_errors_become_responses(tmp_path):
+    svc = ValidationService()
+    r = svc.handle({'op': 'validate-jsonl-chunk', 'lines': [1], 'id': 'x'})
+    assert r == {'ok': False, 'exit_code': 2, 'error': "'lines' must be a list of JSON strings", 'id': 'x'}
+    rule = tmp_path / 'rule.json'
+    rule.write_text(json.dumps({'bogus_operator': [1, 2]}))
+    r = svc.handle({'op': 'evaluate-promotion', 'manifest': json.loads(VALID.read_text()), 'rule_path': str(rule)})
+    assert r['exit_code'] == 2 and r['error'].startswith('RuleError: Unsupported rule segment')
+
+
+def test_client_does_not_fall_back_after_sending(tmp_path, capsys):
+    import socket
+
+    sock_path = tmp_path / 'dying.sock'
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(sock_path))
+    listener.listen(1)
+
+    def accept_then_die():
+        conn, _ = listener.accept()
+        conn.makefile('rb').readline()
+        conn.close()
+
+    thread = threading.Thread(target=accept_then_die, daemon=True)
+    thread.start()
+    try:
+        assert validate_client.main(['--socket', str(sock_path), 'bars-jsonl', str(JSONL)]) == 2
+    finally:
+        thread.join(5)
+        listener.close()
+    captured = capsys.readouterr()
+    assert 'connection lost' in captured.err and 'PASS' not in captured.out
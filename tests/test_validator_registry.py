@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import ValidationError
+
+from validate import _validate_instance
+from validator_registry import cache_stats, clear_cache, get_validator
+
+BASE = Path(__file__).resolve().parent.parent
+SCHEMA = json.load((BASE / 'schemas' / 'bars_download_manifest.schema.json').open())
+RECORD = json.loads((BASE / 'contracts' / 'fixtures' / 'bars_download_manifest.sample.jsonl').read_text().splitlines()[0])
+
+
+def test_validator_compiled_once_per_structural_hash():
+    clear_cache()
+    first = get_validator(SCHEMA)
+    # Description-only edits share the compiled validator.
+    retitled = dict(SCHEMA, title="renamed")
+    assert get_validator(retitled) is first
+    _validate_instance(RECORD, SCHEMA)
+    assert cache_stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_cached_validator_still_rejects_bad_records():
+    bad = dict(RECORD, bar_size="5 min")
+    with pytest.raises(ValidationError):
+        _validate_instance(bad, SCHEMA)
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""Mirror bars_download_manifest.jsonl into a partitioned Parquet dataset.
+
+Analytics over the download log (rows per vendor per day, files whose
+``columns`` drift from the contract, ...) should not re-parse every JSON line.
+This tool compacts the log into a hive-partitioned dataset::
+
+    <out>/bar_size=1%20min/vendor=IBKR/date=2025-09-15/part-0.parquet
+
+so pyarrow.dataset filters on bar_size/vendor/date prune whole directories
+and the remaining predicates use row-group statistics.
+
+The Arrow schema is derived from bars_download_manifest.schema.json: one
+column per declared property in schema order (required properties are
+non-nullable), plus ``line`` (1-based line number in the JSONL) and ``extra``
+(JSON text of any undeclared keys, which the schema allows). Timestamps stay
+strings because the schema admits both naive and offset-qualified values.
+A record's ``date`` is derived as in build_coverage.record_date.
+
+Incremental mode mirrors build_coverage: ``<out>/_state.json`` holds a
+jsonl_checkpoint Checkpoint and later runs convert only the appended lines.
+Each touched partition is rewritten as a single file (existing rows + new
+rows), so partitions never accumulate small files. Rows past the committed
+line count are leftovers of an interrupted run and are dropped when their
+partition is next rewritten. A rewritten JSONL, a schema change or a
+compressed input rebuilds the dataset from scratch.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from build_coverage import record_date
+from jsonl_checkpoint import Checkpoint, hash_range, last_line_end, load_checkpoint, save_checkpoint, verify_prefix
+from jsonl_io import is_compressed, iter_range, open_jsonl
+from validation_lib import ValidationError, compute_structural_hash, json_loads, load_json
+
+# pyarrow is imported on first use so that --describe starts fast.
+pa = pc = pq = None
+
+BASE = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = BASE / "schemas" / "bars_download_manifest.schema.json"
+PARTITION_KEYS = ("bar_size", "vendor", "date")
+STATE_NAME = "_state.json"
+PART_NAME = "part-0.parquet"
+CHUNK_RECORDS = 200_000
+
+PartitionKey = Tuple[str, str, str]  # (bar_size, vendor, date)
+
+
+def require_pyarrow():
+    global pa, pc, pq
+    if pa is None:
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.compute  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError as e:  # pragma: no cover
+            raise ValidationError("pyarrow is required for the Parquet mirror") from e
+        pa, pc, pq = pyarrow, pyarrow.compute, pyarrow.parquet
+    return pa
+
+
+def _resolve(schema: Dict[str, Any], prop: Dict[str, Any]) -> Dict[str, Any]:
+    ref = prop.get("$ref")
+    if ref is None:
+        return prop
+    if not ref.startswith("#/"):
+        raise ValidationError(f"cannot resolve $ref {ref!r}")
+    node: Any = schema
+    for part in ref[2:].split("/"):
+        node = node[part]
+    return _resolve(schema, node)
+
+
+def _arrow_type(schema: Dict[str, Any], name: str, prop: Dict[str, Any]):
+    prop = _resolve(schema, prop)
+    if "const" in prop or "enum" in prop:
+        values = [prop["const"]] if "const" in prop else prop["enum"]
+        if all(isinstance(v, str) for v in values):
+            return pa.string()
+    kind = prop.get("type")
+    if kind == "string":
+        return pa.string()
+    if kind == "integer":
+        return pa.int64()
+    if kind == "number":
+        return pa.float64()
+    if kind == "boolean":
+        return pa.bool_()
+    if kind == "array":
+        items = prop.get("items", {})
+        return pa.list_(_arrow_type(schema, f"{name}[]", items))
+    raise ValidationError(f"no Arrow type for schema property '{name}'")
+
+
+def arrow_schema(schema: Dict[str, Any]):
+    """Arrow schema of the data files (partition keys excluded) for a record JSON schema."""
+    require_pyarrow()
+    required = set(schema.get("required", []))
+    fields = [
+        pa.field(name, _arrow_type(schema, name, prop), nullable=name not in required)
+        for name, prop in schema.get("properties", {}).items()
+        if name not in PARTITION_KEYS
+    ]
+    fields += [pa.field("line", pa.int64(), nullable=False), pa.field("extra", pa.string())]
+    return pa.schema(fields, metadata={"schema_hash": compute_structural_hash(schema)})
+
+
+def partitioning():
+    require_pyarrow()
+    import pyarrow.dataset as ds  # type: ignore
+
+    return ds.partitioning(
+        pa.schema([("bar_size", pa.string()), ("vendor", pa.string()), ("date", pa.date32())]), flavor="hive"
+    )
+
+
+def open_dataset(root: Path | str):
+    """Open the mirror as a pyarrow.dataset with typed partition columns."""
+    require_pyarrow()
+    import pyarrow.dataset as ds  # type: ignore
+
+    return ds.dataset(str(root), format="parquet", partitioning=partitioning(), exclude_invalid_files=True)
+
+
+def partition_dir(root: Path, key: PartitionKey) -> Path:
+    return root.joinpath(*(f"{k}={quote(v, safe='')}" for k, v in zip(PARTITION_KEYS, key)))
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _checker(dtype) -> Callable[[Any], bool]:
+    """Python-side test that a JSON value converts losslessly to ``dtype``."""
+    if pa.types.is_string(dtype):
+        return _is_str
+    if pa.types.is_integer(dtype):
+        return _is_int
+    if pa.types.is_floating(dtype):
+        return _is_number
+    if pa.types.is_boolean(dtype):
+        return _is_bool
+    if pa.types.is_list(dtype):
+        item = _checker(dtype.value_type)
+        return lambda v: isinstance(v, list) and all(map(item, v))
+    raise ValidationError(f"no value check for Arrow type {dtype}")
+
+
+@dataclass
+class IngestStats:
+    mode: str = "full"  # full | incremental
+    lines: int = 0
+    records: int = 0
+    skipped: int = 0
+    partitions_written: int = 0
+    rows_written: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ParquetMirror:
+    """Buffers converted records per partition and merges them into the dataset."""
+
+    def __init__(self, root: Path, schema: Dict[str, Any], committed_lines: int, validator=None):
+        self.root = root
+        self.schema = schema
+        self.arrow = arrow_schema(schema)
+        self.declared = [f.name for f in self.arrow if f.name not in ("line", "extra")]
+        # A record that passed the schema validator already has the right types.
+        self.checks = [
+            (f.name, not f.nullable, None if validator is not None else _checker(f.type))
+            for f in self.arrow if f.name in self.declared
+        ]
+        self.known = set(schema.get("properties", {})) | set(PARTITION_KEYS)
+        self.committed_lines = committed_lines
+        self.validator = validator
+        self._pending: Dict[PartitionKey, List[Dict[str, Any]]] = {}
+        self._buffered = 0
+        self._touched: set = set()
+
+    def convert(self, record: Dict[str, Any], line: int) -> Optional[Tuple[PartitionKey, Dict[str, Any]]]:
+        """Return (partition, row) for ``record``, or None if it cannot be stored."""
+        date = record_date(record)
+        bar_size, vendor = record.get("bar_size"), record.get("vendor")
+        if date is None or not isinstance(bar_size, str) or not isinstance(vendor, str) or not bar_size or not vendor:
+            return None
+        try:
+            datetime.date.fromisoformat(date)
+        except ValueError:
+            return None
+        row: Dict[str, Any] = {}
+        for name, required, check in self.checks:
+            value = record.get(name)
+            if value is None:
+                if required:
+                    return None
+            elif check is not None and not check(value):
+                return None
+            row[name] = value
+        extra = {k: v for k, v in record.items() if k not in self.known}
+        row["line"] = line
+        row["extra"] = json.dumps(extra, sort_keys=True) if extra else None
+        return (bar_size, vendor, date), row
+
+    def ingest(self, lines: Iterable[bytes | str], stats: IngestStats, first_line: int) -> IngestStats:
+        for lineno, raw in enumerate(lines, start=first_line):
+            stats.lines += 1
+            if not raw.strip():
+                continue
+            try:
+                record = json_loads(raw)
+            except ValueError as e:
+                if self.validator is not None:
+                    raise ValidationError(f"line {lineno} is not valid JSON: {e}") from e
+                stats.skipped += 1
+                continue
+            if self.validator is not None:
+                try:
+                    self.validator.validate(record)
+                except Exception as e:
+                    raise ValidationError(f"line {lineno} failed schema validation: {e}") from e
+            converted = self.convert(record, lineno) if isinstance(record, dict) else None
+            if converted is None:
+                stats.skipped += 1
+                continue
+            key, row = converted
+            self._pending.setdefault(key, []).append(row)
+            self._buffered += 1
+            stats.records += 1
+            if self._buffered >= CHUNK_RECORDS:
+                self.flush(stats)
+        return stats
+
+    def flush(self, stats: IngestStats) -> None:
+        for key, rows in sorted(self._pending.items()):
+            target = partition_dir(self.root, key) / PART_NAME
+            table = pa.Table.from_pylist(rows, schema=self.arrow)
+            if target.exists():
+                existing = pq.read_table(target, schema=self.arrow)
+                if key not in self._touched:
+                    # Rows beyond the checkpoint come from a run that never committed.
+                    keep = pc.less_equal(existing["line"], self.committed_lines)
+                    existing = existing.filter(keep)
+                table = pa.concat_tables([existing, table])
+            table = table.sort_by([("symbol", "ascending"), ("line", "ascending")])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(target.name + ".tmp")
+            pq.write_table(table, tmp)
+            os.replace(tmp, target)
+            self._touched.add(key)
+            stats.partitions_written += 1
+            stats.rows_written += len(rows)
+        self._pending.clear()
+        self._buffered = 0
+
+
+def _clear(root: Path) -> None:
+    """Remove the dataset's partitions and state (nothing else under ``root``)."""
+    for child in root.glob("bar_size=*"):
+        shutil.rmtree(child)
+    (root / STATE_NAME).unlink(missing_ok=True)
+
+
+def _record_validator(schema: Dict[str, Any]):
+    from schema_codegen import get_fast_validator
+
+    compiled = get_fast_validator(schema)
+    if compiled is not None:
+        return compiled
+    from validator_registry import get_validator
+
+    return get_validator(schema)
+
+
+def mirror_to_parquet(
+    jsonl_path: Path | str,
+    out_dir: Path | str,
+    validate: bool = False,
+    rebuild: bool = False,
+    schema_path: Path | str = SCHEMA_PATH,
+) -> IngestStats:
+    """Bring the Parquet mirror at ``out_dir`` up to date with ``jsonl_path``.
+
+    With ``validate`` every record must pass the download-manifest schema;
+    the first failure raises ValidationError and the checkpoint is not
+    advanced. Otherwise lines that are not JSON objects, lack a date or do
+    not fit the Arrow schema are skipped and counted.
+    """
+    require_pyarrow()
+    jsonl_path, root = Path(jsonl_path), Path(out_dir)
+    if not jsonl_path.exists():
+        raise ValidationError(f"download manifest not found: {jsonl_path}")
+    schema = load_json(Path(schema_path))
+    schema_hash = compute_structural_hash(schema)
+    state_path = root / STATE_NAME
+
+    hasher = None
+    base = None
+    if not rebuild and not is_compressed(jsonl_path):
+        previous = load_checkpoint(state_path)
+        if previous is not None:
+            hasher = verify_prefix(jsonl_path, previous, schema_hash)
+            base = previous if hasher is not None else None
+    stats = IngestStats(mode="incremental" if base is not None else "full")
+    if base is None:
+        _clear(root)
+        base = Checkpoint(offset=0, lines=0, records=0, prefix_sha256="", schema_hash=schema_hash)
+        hasher = hashlib.sha256()
+    root.mkdir(parents=True, exist_ok=True)
+
+    mirror = ParquetMirror(root, schema, base.lines, _record_validator(schema) if validate else None)
+    if is_compressed(jsonl_path):
+        with open_jsonl(jsonl_path) as fh:
+            mirror.ingest(fh, stats, first_line=1)
+        mirror.flush(stats)
+        return stats
+
+    # Stop at the last complete line: a record still being appended is converted next run.
+    end = last_line_end(jsonl_path, base.offset, jsonl_path.stat().st_size)
+    mirror.ingest(iter_range(jsonl_path, base.offset, end), stats, first_line=base.lines + 1)
+    mirror.flush(stats)
+    hash_range(jsonl_path, base.offset, end, hasher)
+    save_checkpoint(state_path, Checkpoint(
+        offset=end,
+        lines=base.lines + stats.lines,
+        records=base.records + stats.records,
+        prefix_sha256=hasher.hexdigest(),
+        schema_hash=schema_hash,
+    ))
+    return stats
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "bars_parquet",
+        "description": "Incrementally mirror bars_download_manifest.jsonl into a Parquet dataset partitioned by bar_size/vendor/date, with an Arrow schema derived from the JSON schema.",
+        "inputs": {"jsonl": "bars_download_manifest.jsonl[.gz|.zst]", "flags": ["--out", "--validate", "--rebuild", "--strict", "--describe"]},
+        "outputs": {"artifact": "<out>/bar_size=*/vendor=*/date=*/part-0.parquet + <out>/_state.json", "stdout": "ingest summary"},
+        "examples": [
+            "python tools/bars_parquet.py bars_download_manifest.jsonl --out bars_manifest_parquet",
+            "python tools/bars_parquet.py bars_download_manifest.jsonl --out bars_manifest_parquet --validate",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Mirror the bars download JSONL into a partitioned Parquet dataset")
+    ap.add_argument("jsonl", nargs="?", type=Path)
+    ap.add_argument("--out", type=Path, help="Dataset directory (default: bars_manifest_parquet next to the JSONL)")
+    ap.add_argument("--validate", action="store_true", help="Validate every record against the download-manifest schema")
+    ap.add_argument("--rebuild", action="store_true", help="Discard the existing dataset and convert the whole JSONL")
+    ap.add_argument("--strict", action="store_true", help="Exit 1 if any line was skipped")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.jsonl is None:
+        ap.error("jsonl is required")
+
+    out = args.out or args.jsonl.with_name("bars_manifest_parquet")
+    try:
+        stats = mirror_to_parquet(args.jsonl.resolve(), out, validate=args.validate, rebuild=args.rebuild)
+    except ValidationError as e:
+        print(f"ERROR: {e}")
+        return 2
+    print(
+        f"{stats.mode}: {stats.lines} lines, {stats.records} records, {stats.skipped} skipped; "
+        f"{stats.rows_written} rows into {stats.partitions_written} partition file(s) -> {out}"
+    )
+    if args.strict and stats.skipped:
+        print(f"ERROR: {stats.skipped} line(s) skipped (not JSON objects, no date, or not matching the Arrow schema)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
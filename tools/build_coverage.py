@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Derive bars_coverage_manifest.json from bars_download_manifest.jsonl.
+
+The download JSONL is an append-only audit log: one line per saved bars
+file, with re-downloads of the same day appended as new lines. The coverage
+manifest keeps one ``days`` item per (symbol, bar_size, date). When a day
+appears more than once, the record with the most rows wins, then the latest
+``written_at``, so a truncated re-download never hides a complete file.
+
+A day's date is the date part of ``time_start`` (else ``time_end``, else the
+first YYYY-MM-DD in ``filename``). Lines that are not JSON objects, that lack
+symbol/bar_size/path/filename/rows or a date, or whose day/entry fields the
+coverage schema would reject (e.g. a bar_size outside its enum, a malformed
+timestamp), are skipped and counted so one bad line never blocks the output.
+
+Incremental mode: the output carries a ``source`` block (a jsonl_checkpoint
+Checkpoint: byte offset, line/record counts, sha256 of the consumed prefix).
+A later run re-hashes that prefix and, if unchanged, merges only the appended
+lines into the existing entries. Each entry's dates are kept sorted, so each
+merge is a bisect, and in the usual append-newer-days case an append. A
+rewritten JSONL, a schema change or a compressed input triggers a full rebuild.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jsonl_checkpoint import Checkpoint, hash_range, last_line_end, verify_prefix
+from jsonl_io import is_compressed, iter_range, open_jsonl
+from validation_lib import ValidationError, compute_structural_hash, dump_json, json_loads, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+COVERAGE_SCHEMA_PATH = BASE / "schemas" / "bars_coverage_manifest.schema.json"
+SCHEMA_VERSION = "bars_coverage.v1"
+DAY_FIELDS = ("date", "time_start", "time_end", "path", "filename", "rows", "written_at")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+EntryKey = Tuple[str, str]  # (symbol, bar_size)
+MAX_SKIPPED_LINES = 20  # line numbers kept for --strict reporting
+
+
+@lru_cache(maxsize=1)
+def _day_validator():
+    """Validator for one merged day plus its entry keys, cut from the coverage schema's $defs."""
+    from schema_codegen import get_fast_validator
+    from validator_registry import get_validator
+
+    schema = load_json(COVERAGE_SCHEMA_PATH)
+    defs = schema["$defs"]
+    entry = defs["entry"]["properties"]
+    subschema = {
+        "$defs": defs,
+        "type": "object",
+        "required": [*defs["day"]["required"], "symbol", "bar_size"],
+        "properties": {**defs["day"]["properties"], "symbol": entry["symbol"], "bar_size": entry["bar_size"]},
+        "additionalProperties": True,
+    }
+    return get_fast_validator(subschema) or get_validator(subschema)
+
+
+def record_date(record: Dict[str, Any]) -> Optional[str]:
+    for field in ("time_start", "time_end"):
+        value = record.get(field)
+        if isinstance(value, str) and _DATE_RE.match(value):
+            return value[:10]
+    m = _DATE_RE.search(str(record.get("filename", "")))
+    return m.group(0) if m else None
+
+
+def _rank(day: Dict[str, Any]) -> Tuple[int, str]:
+    return day.get("rows", 0), day.get("written_at", "")
+
+
+@dataclass
+class MergeStats:
+    mode: str = "full"  # full | incremental
+    lines: int = 0
+    records: int = 0
+    days_added: int = 0
+    days_replaced: int = 0
+    skipped: int = 0
+    skipped_lines: List[int] = field(default_factory=list)  # first MAX_SKIPPED_LINES, 1-based
+
+    def skip(self, line: int) -> None:
+        self.skipped += 1
+        if len(self.skipped_lines) < MAX_SKIPPED_LINES:
+            self.skipped_lines.append(line)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CoverageBuilder:
+    """(symbol, bar_size) -> date-sorted days, merged one download record at a time."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = ()):
+        self._dates: Dict[EntryKey, List[str]] = {}
+        self._days: Dict[EntryKey, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            days = sorted(entry.get("days", []), key=lambda d: d["date"])
+            key = (entry["symbol"], entry["bar_size"])
+            self._days[key] = days
+            self._dates[key] = [d["date"] for d in days]
+
+    def merge(self, record: Dict[str, Any]) -> str:
+        """Merge one download record; returns added | replaced | kept | skipped."""
+        date = record_date(record)
+        if date is None or not all(record.get(f) not in (None, "") for f in ("symbol", "bar_size", "path", "filename")):
+            return "skipped"
+        if not isinstance(record.get("rows"), int):
+            return "skipped"
+        day = {"date": date}
+        day.update((f, record[f]) for f in DAY_FIELDS[1:] if record.get(f) is not None)
+        if not _day_validator().is_valid({**day, "symbol": record["symbol"], "bar_size": record["bar_size"]}):
+            return "skipped"
+        key = (record["symbol"], record["bar_size"])
+        dates = self._dates.setdefault(key, [])
+        days = self._days.setdefault(key, [])
+        i = bisect_left(dates, date)
+        if i < len(dates) and dates[i] == date:
+            if _rank(day) > _rank(days[i]):
+                days[i] = day
+                return "replaced"
+            return "kept"
+        dates.insert(i, date)
+        days.insert(i, day)
+        return "added"
+
+    def merge_lines(self, lines: Iterable[bytes | str], stats: MergeStats, first_line: int = 1) -> MergeStats:
+        for lineno, raw in enumerate(lines, start=first_line):
+            stats.lines += 1
+            if not raw.strip():
+                continue
+            try:
+                record = json_loads(raw)
+            except ValueError:
+                stats.skip(lineno)
+                continue
+            outcome = self.merge(record) if isinstance(record, dict) else "skipped"
+            if outcome == "skipped":
+                stats.skip(lineno)
+                continue
+            stats.records += 1
+            if outcome == "added":
+                stats.days_added += 1
+            elif outcome == "replaced":
+                stats.days_replaced += 1
+        return stats
+
+    def entries(self) -> List[Dict[str, Any]]:
+        out = []
+        for key in sorted(self._days):
+            days = self._days[key]
+            if not days:
+                continue
+            out.append({
+                "symbol": key[0],
+                "bar_size": key[1],
+                "total": {"date_start": days[0]["date"], "date_end": days[-1]["date"]},
+                "days": days,
+            })
+        return out
+
+
+def _coverage_schema_hash() -> str:
+    return compute_structural_hash(load_json(COVERAGE_SCHEMA_PATH))
+
+
+def _resume_point(jsonl_path: Path, previous: Optional[Dict[str, Any]], schema_hash: str):
+    """Return (checkpoint, primed hasher) when ``previous`` can be extended, else None."""
+    if previous is None or is_compressed(jsonl_path):
+        return None
+    source = previous.get("source")
+    if not isinstance(source, dict) or source.get("jsonl") != str(jsonl_path):
+        return None
+    try:
+        checkpoint = Checkpoint(**{k: v for k, v in source.items() if k != "jsonl"})
+    except TypeError:
+        return None
+    hasher = verify_prefix(jsonl_path, checkpoint, schema_hash)
+    return (checkpoint, hasher) if hasher is not None else None
+
+
+def validate_coverage(manifest: Dict[str, Any]) -> None:
+    from validator_registry import get_validator
+
+    errors = sorted(get_validator(load_json(COVERAGE_SCHEMA_PATH)).iter_errors(manifest), key=lambda e: list(map(str, e.path)))
+    if errors:
+        e = errors[0]
+        raise ValidationError(f"coverage manifest is not schema-valid at {'/'.join(map(str, e.path)) or '<root>'}: {e.message}")
+
+
+def build_coverage(
+    jsonl_path: Path | str,
+    previous: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[str] = None,
+) -> Tuple[Dict[str, Any], MergeStats]:
+    """Build the coverage manifest, extending ``previous`` incrementally when possible.
+
+    ``previous`` is an earlier output of this function (e.g. the existing
+    coverage file). The result is validated against
+    bars_coverage_manifest.schema.json before it is returned.
+    """
+    jsonl_path = Path(jsonl_path)
+    if not jsonl_path.exists():
+        raise ValidationError(f"download manifest not found: {jsonl_path}")
+    schema_hash = _coverage_schema_hash()
+    resume = _resume_point(jsonl_path, previous, schema_hash)
+    stats = MergeStats()
+    source = None
+    if resume is not None:
+        base, hasher = resume
+        index = CoverageBuilder(previous.get("entries", []))
+        stats.mode = "incremental"
+    else:
+        base = Checkpoint(offset=0, lines=0, records=0, prefix_sha256="", schema_hash=schema_hash)
+        hasher = hashlib.sha256()
+        index = CoverageBuilder()
+
+    if is_compressed(jsonl_path):
+        with open_jsonl(jsonl_path) as fh:
+            index.merge_lines(fh, stats)
+    else:
+        # Stop at the last complete line: a record still being appended is merged next run.
+        end = last_line_end(jsonl_path, base.offset, jsonl_path.stat().st_size)
+        index.merge_lines(iter_range(jsonl_path, base.offset, end), stats, first_line=base.lines + 1)
+        hash_range(jsonl_path, base.offset, end, hasher)
+        checkpoint = Checkpoint(
+            offset=end,
+            lines=base.lines + stats.lines,
+            records=base.records + stats.records,
+            prefix_sha256=hasher.hexdigest(),
+            schema_hash=schema_hash,
+        )
+        source = {"jsonl": str(jsonl_path), **asdict(checkpoint)}
+
+    manifest: Dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": generated_at or datetime.now().isoformat(timespec="seconds"),
+        "entries": index.entries(),
+    }
+    if source is not None:
+        manifest["source"] = source
+    validate_coverage(manifest)
+    return manifest, stats
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "build_coverage",
+        "description": "Derive the deduplicated bars coverage manifest from bars_download_manifest.jsonl, merging only newly appended lines into an existing output.",
+        "inputs": {"jsonl": "bars_download_manifest.jsonl[.gz|.zst]", "flags": ["--out", "--rebuild", "--strict", "--describe"]},
+        "outputs": {"artifact": "bars_coverage_manifest.json (schema-valid)", "stdout": "merge summary"},
+        "examples": [
+            "python tools/build_coverage.py bars_download_manifest.jsonl --out bars_coverage_manifest.json",
+            "python tools/build_coverage.py bars_download_manifest.jsonl --out bars_coverage_manifest.json --rebuild",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import json
+    ap = argparse.ArgumentParser(description="Build the bars coverage manifest from the download JSONL")
+    ap.add_argument("jsonl", nargs="?", type=Path)
+    ap.add_argument("--out", type=Path, help="Coverage manifest path (default: bars_coverage_manifest.json next to the JSONL)")
+    ap.add_argument("--rebuild", action="store_true", help="Ignore the existing output and rebuild from the whole JSONL")
+    ap.add_argument("--strict", action="store_true", help="Fail (without writing) if any line was skipped")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.jsonl is None:
+        ap.error("jsonl is required")
+
+    out = args.out or args.jsonl.with_name("bars_coverage_manifest.json")
+    previous = None
+    if out.exists() and not args.rebuild:
+        try:
+            previous = load_json(out)
+        except ValueError:
+            previous = None
+    try:
+        manifest, stats = build_coverage(args.jsonl.resolve(), previous)
+    except ValidationError as e:
+        print(f"ERROR: {e}")
+        return 2
+    if args.strict and stats.skipped:
+        shown = ", ".join(map(str, stats.skipped_lines)) + (", ..." if stats.skipped > len(stats.skipped_lines) else "")
+        print(f"ERROR: {stats.skipped} line(s) skipped (not JSON objects, missing fields or date, or rejected by the coverage schema): line {shown}")
+        return 1
+    dump_json(out, manifest)
+    print(
+        f"{stats.mode}: {stats.lines} lines, {stats.records} records, {stats.days_added} days added, "
+        f"{stats.days_replaced} replaced, {stats.skipped} skipped; {len(manifest['entries'])} entries -> {out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Audit bars coverage manifests against the bundled exchange calendar.
+
+For every (symbol, bar_size) entry of a coverage manifest this reports:
+
+- missing sessions: exchange sessions inside the audit window with no day
+  (as inclusive first/last runs over consecutive sessions);
+- non-session days: days on a weekend or exchange holiday;
+- out-of-window days: days outside the entry's declared ``total`` range, or
+  outside ``--start/--end`` when an explicit window is given;
+- outside-calendar days: days inside the window but before the calendar's
+  first or after its last session. The calendar cannot say whether these are
+  sessions, so they are listed as a warning rather than an issue;
+- duplicate days: the same date listed more than once;
+- overlapping days: a day whose ``time_end`` runs past the next day's
+  ``time_start``;
+- shared files: one ``path`` claimed by more than one day.
+
+All entries are flattened into one set of numpy arrays. The checks are then
+vectorized over every day at once: ``np.is_busday`` against the calendar's
+``busdaycalendar``, ``searchsorted`` into the session array, and ``lexsort``
+plus ``diff`` for duplicates and runs. Thousands of symbols take one pass
+instead of a Python loop per symbol.
+
+Calendars are offline JSON files in contracts/calendars/ (weekmask plus
+holiday exceptions). The calendar id defaults to the data collection
+policy's ``calendar_id``.
+"""
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from validation_lib import ValidationError, load_json
+
+np = None  # imported on first use (_require_numpy)
+
+BASE = Path(__file__).resolve().parent.parent
+CALENDAR_DIR = BASE / "contracts" / "calendars"
+POLICY_PATH = BASE / "contracts" / "policies" / "data_collection_policy_v1.json"
+_DAY_OFFSET = 1 << 31  # keeps day numbers (days since 1970) non-negative in the sort key
+_ENTRY_STRIDE = 1 << 33
+
+
+def _require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise ValidationError("coverage audits require numpy") from e
+        np = numpy
+
+
+class TradingCalendar:
+    """Sessions = weekmask days minus holidays, between first_session and last_session."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        _require_numpy()
+        self.calendar_id = spec["calendar_id"]
+        self.timezone = spec.get("timezone")
+        self.first = np.datetime64(spec["first_session"], "D")
+        self.last = np.datetime64(spec["last_session"], "D")
+        self.holidays = np.array(sorted(spec.get("holidays", {})), dtype="datetime64[D]")
+        self.early_closes = dict(spec.get("early_closes", {}))
+        self.busdaycal = np.busdaycalendar(weekmask=spec.get("weekmask", "1111100"), holidays=self.holidays)
+        days = np.arange(self.first, self.last + 1, dtype="datetime64[D]")
+        self.sessions = days[np.is_busday(days, busdaycal=self.busdaycal)]
+
+    @classmethod
+    def load(cls, calendar_id: str, directory: Path = CALENDAR_DIR) -> "TradingCalendar":
+        path = Path(directory) / f"{calendar_id}.json"
+        if not path.exists():
+            raise ValidationError(f"no bundled calendar '{calendar_id}' in {directory}")
+        return cls(load_json(path))
+
+    def is_session(self, days: Any) -> Any:
+        days = np.asarray(days, dtype="datetime64[D]")
+        return np.is_busday(days, busdaycal=self.busdaycal) & (days >= self.first) & (days <= self.last)
+
+    def sessions_between(self, start: Any, end: Any) -> Any:
+        lo = np.searchsorted(self.sessions, np.datetime64(start, "D"))
+        hi = np.searchsorted(self.sessions, np.datetime64(end, "D"), "right")
+        return self.sessions[lo:hi]
+
+
+@dataclass
+class EntryIssues:
+    symbol: str
+    bar_size: str
+    window: Tuple[str, str]
+    expected_sessions: int
+    covered_sessions: int
+    missing: List[Tuple[str, str]] = field(default_factory=list)
+    non_session_days: List[str] = field(default_factory=list)
+    out_of_window_days: List[str] = field(default_factory=list)
+    outside_calendar: List[str] = field(default_factory=list)
+    duplicate_days: List[str] = field(default_factory=list)
+    overlapping_days: List[str] = field(default_factory=list)
+    shared_files: List[str] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return not (self.missing or self.non_session_days or self.out_of_window_days
+                    or self.duplicate_days or self.overlapping_days or self.shared_files)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _timestamps(values: List[Optional[str]]) -> Any:
+    # Coverage timestamps are naive wall-clock (or carry an offset we drop):
+    # only ordering within one symbol matters here.
+    return np.array([v[:19] if v else "NaT" for v in values], dtype="datetime64[s]")
+
+
+def _per_entry(ufunc: Any, values: Any, entry_ids: Any, n: int) -> Any:
+    """``ufunc``-reduce ``values`` per entry id (NaT for entries without values)."""
+    out = np.full(n, np.datetime64("NaT"), dtype=values.dtype)
+    has = np.zeros(n, dtype=bool)
+    has[entry_ids] = True
+    init = np.full(n, values.max() if ufunc is np.minimum else values.min(), dtype=values.dtype)
+    ufunc.at(init, entry_ids, values)
+    out[has] = init[has]
+    return out
+
+
+def _group_lists(entry_ids: Any, values: Any, mask: Any, n: int) -> List[List[str]]:
+    out: List[List[str]] = [[] for _ in range(n)]
+    for e, v in zip(entry_ids[mask].tolist(), values[mask].tolist()):
+        out[e].append(v)
+    return out
+
+
+def audit_coverage(
+    manifest: Dict[str, Any],
+    calendar: TradingCalendar,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> List[EntryIssues]:
+    """Audit every entry of ``manifest``; returns one EntryIssues per entry, in entry order."""
+    _require_numpy()
+    entries = manifest.get("entries", [])
+    n = len(entries)
+    counts = [len(e.get("days", [])) for e in entries]
+    days = [d for e in entries for d in e.get("days", [])]
+    eid = np.repeat(np.arange(n, dtype=np.int64), counts)
+    # One pass over the JSON; everything after this is array arithmetic.
+    date_l = [d["date"] for d in days]
+    path_l = [d.get("path") or "" for d in days]
+    start_l = [d.get("time_start") or "" for d in days]
+    end_l = [d.get("time_end") or "" for d in days]
+    date = np.array(date_l, dtype="datetime64[D]")
+    date_str = np.array(date_l, dtype=object)
+
+    # Audit window per entry: explicit start/end where given, else the declared
+    # total range (else the span of the entry's own days). Sessions are only
+    # expected inside the calendar, so the window is clipped to it afterwards.
+    w_lo = np.array([e.get("total", {}).get("date_start") or "NaT" for e in entries], dtype="datetime64[D]")
+    w_hi = np.array([e.get("total", {}).get("date_end") or "NaT" for e in entries], dtype="datetime64[D]")
+    if len(date) and (np.isnat(w_lo).any() or np.isnat(w_hi).any()):
+        w_lo = np.where(np.isnat(w_lo), _per_entry(np.minimum, date, eid, n), w_lo)
+        w_hi = np.where(np.isnat(w_hi), _per_entry(np.maximum, date, eid, n), w_hi)
+    if start is not None:
+        w_lo = np.full(n, np.datetime64(start, "D"))
+    if end is not None:
+        w_hi = np.full(n, np.datetime64(end, "D"))
+    in_window = (date >= w_lo[eid]) & (date <= w_hi[eid])
+    w_lo = np.maximum(w_lo, calendar.first)
+    w_hi = np.minimum(w_hi, calendar.last)
+
+    is_session = calendar.is_session(date)
+    out_of_window = ~in_window
+    outside_calendar = in_window & ((date < calendar.first) | (date > calendar.last))
+    non_session = ~is_session & in_window & ~outside_calendar
+
+    # Sort once by (entry, date) through a single int64 key; manifests written
+    # by build_coverage are already in that order, so usually no sort happens.
+    key = eid * _ENTRY_STRIDE + (date.astype(np.int64) + _DAY_OFFSET)
+    if len(key) > 1 and bool((key[1:] < key[:-1]).any()):
+        order = np.argsort(key, kind="stable")
+    else:
+        order = np.arange(len(key))
+    k_sorted, e_sorted = key[order], eid[order]
+
+    # Duplicates: same (entry, date) as the previous item in sorted order.
+    duplicate = np.zeros(len(order), dtype=bool)
+    duplicate[order[1:]] = k_sorted[1:] == k_sorted[:-1]
+
+    # Overlaps: only a day whose time_end falls after its own date can reach
+    # into the next day, so only those are parsed and compared.
+    overlapping = np.zeros(len(order), dtype=bool)
+    if len(order) > 1:
+        spills = (np.array(end_l, dtype="U10") > np.array(date_l, dtype="U10"))[order[:-1]]
+        nxt = (e_sorted[1:] == e_sorted[:-1]) & (k_sorted[1:] != k_sorted[:-1]) & spills
+        pos = np.nonzero(nxt)[0]
+        if len(pos):
+            t_end = _timestamps([end_l[i] for i in order[pos]])
+            t_next = _timestamps([start_l[i] for i in order[pos + 1]])
+            overlapping[order[pos[t_end > t_next]]] = True  # NaT compares False
+
+    # Shared files: a path claimed by more than one day (across all entries).
+    shared = np.zeros(len(path_l), dtype=bool)
+    if len(set(path_l)) < len(path_l):
+        seen = Counter(path_l)
+        shared = np.fromiter((seen[p] > 1 and p != "" for p in path_l), dtype=bool, count=len(path_l))
+    paths = np.array(path_l, dtype=object)
+
+    # Missing sessions: index covered sessions into calendar.sessions and look
+    # for holes between consecutive indices of an entry and at its window ends.
+    sessions = calendar.sessions
+    lo_idx = np.searchsorted(sessions, w_lo)
+    hi_idx = np.searchsorted(sessions, w_hi, "right")  # exclusive
+    expected = np.maximum(hi_idx - lo_idx, 0)
+    keep = (in_window & is_session & ~duplicate)[order]
+    k_e = e_sorted[keep]
+    k_idx = np.searchsorted(sessions, date[order][keep])
+    covered = np.bincount(k_e, minlength=n)
+    # Sentinels (entry, lo - 1) and (entry, hi) bracket each entry's covered indices.
+    starts = np.searchsorted(k_e, np.arange(n))
+    all_e = np.insert(np.insert(k_e, starts, np.arange(n)), starts + covered + np.arange(1, n + 1), np.arange(n))
+    all_i = np.insert(np.insert(k_idx, starts, lo_idx - 1), starts + covered + np.arange(1, n + 1), hi_idx)
+    hole = (all_e[1:] == all_e[:-1]) & (np.diff(all_i) > 1)
+    hole_e = all_e[1:][hole]
+    hole_first = sessions[all_i[:-1][hole] + 1]
+    hole_last = sessions[all_i[1:][hole] - 1]
+    missing: List[List[Tuple[str, str]]] = [[] for _ in range(n)]
+    for e, a, b in zip(hole_e.tolist(), hole_first.astype(str).tolist(), hole_last.astype(str).tolist()):
+        missing[e].append((a, b))
+
+    non_session_l = _group_lists(eid, date_str, non_session, n)
+    out_l = _group_lists(eid, date_str, out_of_window, n)
+    outside_l = _group_lists(eid, date_str, outside_calendar, n)
+    dup_l = _group_lists(eid, date_str, duplicate, n)
+    overlap_l = _group_lists(eid, date_str, overlapping, n)
+    shared_l = _group_lists(eid, paths, shared, n)
+
+    results = []
+    for i, entry in enumerate(entries):
+        results.append(EntryIssues(
+            symbol=entry.get("symbol", ""),
+            bar_size=entry.get("bar_size", ""),
+            window=(str(w_lo[i]), str(w_hi[i])),
+            expected_sessions=int(expected[i]),
+            covered_sessions=int(covered[i]),
+            missing=missing[i],
+            non_session_days=non_session_l[i],
+            out_of_window_days=out_l[i],
+            outside_calendar=outside_l[i],
+            duplicate_days=sorted(set(dup_l[i])),
+            overlapping_days=overlap_l[i],
+            shared_files=sorted(set(shared_l[i])),
+        ))
+    return results
+
+
+def summarize(results: List[EntryIssues], calendar: TradingCalendar) -> Dict[str, Any]:
+    return {
+        "calendar": calendar.calendar_id,
+        "entries": len(results),
+        "entries_with_issues": sum(1 for r in results if not r.clean),
+        "sessions_expected": sum(r.expected_sessions for r in results),
+        "sessions_missing": sum(r.expected_sessions - r.covered_sessions for r in results),
+        "non_session_days": sum(len(r.non_session_days) for r in results),
+        "out_of_window_days": sum(len(r.out_of_window_days) for r in results),
+        "outside_calendar_days": sum(len(r.outside_calendar) for r in results),
+        "duplicate_days": sum(len(r.duplicate_days) for r in results),
+        "overlapping_days": sum(len(r.overlapping_days) for r in results),
+        "shared_files": sum(len(r.shared_files) for r in results),
+        "issues": [r.to_dict() for r in results if not r.clean],
+        "warnings": [
+            {"symbol": r.symbol, "bar_size": r.bar_size, "outside_calendar": r.outside_calendar}
+            for r in results if r.outside_calendar
+        ],
+    }
+
+
+def policy_calendar_id(policy_path: Path = POLICY_PATH) -> str:
+    return load_json(policy_path).get("calendar_id", "XNYS")
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "coverage_audit",
+        "description": "Check a bars coverage manifest against the bundled exchange calendar: missing sessions, non-session, out-of-window, duplicate and overlapping days, shared files; warns about days outside the calendar's range.",
+        "inputs": {"coverage": "bars_coverage_manifest.json", "flags": ["--calendar", "--policy", "--start", "--end", "--out", "--describe"]},
+        "outputs": {"stdout": "summary line, per-entry issues and outside-calendar warnings", "artifact": "--out JSON report"},
+        "examples": [
+            "python tools/coverage_audit.py bars_coverage_manifest.json",
+            "python tools/coverage_audit.py bars_coverage_manifest.json --start 2024-01-02 --end 2024-12-31 --out coverage_audit.json",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Audit bars coverage against the exchange calendar")
+    ap.add_argument("coverage", nargs="?", type=Path)
+    ap.add_argument("--calendar", help="Calendar id in contracts/calendars/ (default: the policy's calendar_id)")
+    ap.add_argument("--policy", type=Path, default=POLICY_PATH, help="Data collection policy supplying calendar_id")
+    ap.add_argument("--start", help="Audit window start (YYYY-MM-DD); default: each entry's total.date_start")
+    ap.add_argument("--end", help="Audit window end (YYYY-MM-DD); default: each entry's total.date_end")
+    ap.add_argument("--out", type=Path, help="Write the full JSON report here")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.coverage is None:
+        ap.error("coverage is required")
+
+    try:
+        calendar = TradingCalendar.load(args.calendar or policy_calendar_id(args.policy))
+        report = summarize(audit_coverage(load_json(args.coverage), calendar, args.start, args.end), calendar)
+    except (ValidationError, ValueError, OSError) as e:
+        print(f"ERROR: {e}")
+        return 2
+    if args.out:
+        from validation_lib import dump_json
+
+        dump_json(args.out, report)
+    for warning in report["warnings"]:
+        days = warning["outside_calendar"]
+        print(f"WARNING {warning['symbol']} {warning['bar_size']}: {len(days)} days outside the {report['calendar']} "
+              f"calendar ({min(days)}..{max(days)}), not audited")
+    for issue in report["issues"]:
+        parts = [f"{k}={len(issue[k])}" for k in ("missing", "non_session_days", "out_of_window_days", "duplicate_days", "overlapping_days", "shared_files") if issue[k]]
+        print(f"ISSUES {issue['symbol']} {issue['bar_size']}: " + ", ".join(parts))
+    print(
+        f"{report['entries']} entries ({report['calendar']}): {report['entries_with_issues']} with issues, "
+        f"{report['sessions_missing']}/{report['sessions_expected']} sessions missing"
+    )
+    return 1 if report["issues"] else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
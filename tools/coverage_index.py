@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Indexed availability queries over a bars coverage manifest.
+
+Window planners ask "which days of AAPL 1 sec bars exist between X and Y"
+thousands of times per plan; scanning ``entries[].days`` for each question is
+O(days). ``CoverageIndex`` loads the manifest once into a dict keyed by
+(symbol, bar_size) whose values are sorted ``array('i')`` of date ordinals
+(plus a parallel row-count array), so a range query is two bisects and a
+slice.
+
+``CoverageIndex.load`` keeps a compact binary sidecar (``<manifest>.idx``)
+next to the manifest, stamped with the manifest's size and mtime_ns; later
+loads read the sidecar instead of parsing the JSON while the stamp matches.
+Arrays are stored in native byte order: the sidecar is a local cache, not an
+exchange format.
+"""
+from __future__ import annotations
+
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from validation_lib import load_json
+
+SIDECAR_SUFFIX = ".idx"
+_MAGIC = b"BCOVIDX1"
+_HEADER = struct.Struct("<8sqqI")  # magic, manifest size, manifest mtime_ns, key count
+_KEY = struct.Struct("<HHI")  # symbol bytes, bar_size bytes, day count
+
+DateLike = date | str
+Key = Tuple[str, str]  # (symbol, bar_size)
+
+
+def _as_date(d: DateLike) -> date:
+    return date.fromisoformat(d[:10]) if isinstance(d, str) else d
+
+
+def _ordinal(d: DateLike) -> int:
+    return _as_date(d).toordinal()
+
+
+def _iso(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _runs(ordinals: Sequence[int]) -> List[Tuple[str, str]]:
+    """Collapse sorted ordinals into inclusive (first, last) runs of consecutive values."""
+    runs: List[Tuple[str, str]] = []
+    start = prev = None
+    for o in ordinals:
+        if prev is not None and o == prev + 1:
+            prev = o
+            continue
+        if start is not None:
+            runs.append((_iso(start), _iso(prev)))
+        start = prev = o
+    if start is not None:
+        runs.append((_iso(start), _iso(prev)))
+    return runs
+
+
+class CoverageIndex:
+    """(symbol, bar_size) -> sorted date ordinals and row counts."""
+
+    def __init__(self, days: Optional[Dict[Key, Tuple[array, array]]] = None):
+        self._days: Dict[Key, Tuple[array, array]] = days or {}
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any]) -> "CoverageIndex":
+        days: Dict[Key, Tuple[array, array]] = {}
+        for entry in manifest.get("entries", []):
+            pairs = sorted((_ordinal(d["date"]), int(d.get("rows", 0))) for d in entry.get("days", []))
+            key = (entry["symbol"], entry["bar_size"])
+            if key in days:  # tolerate split entries: merge and re-sort
+                pairs = sorted(set(pairs) | set(zip(*days[key])))
+            days[key] = (array("i", (p[0] for p in pairs)), array("q", (p[1] for p in pairs)))
+        return cls(days)
+
+    @classmethod
+    def load(cls, manifest_path: Path | str, sidecar: bool = True) -> "CoverageIndex":
+        """Load from the binary sidecar when it is current, else from JSON (refreshing the sidecar)."""
+        manifest_path = Path(manifest_path)
+        if not sidecar:
+            return cls.from_manifest(load_json(manifest_path))
+        idx_path = manifest_path.with_name(manifest_path.name + SIDECAR_SUFFIX)
+        st = manifest_path.stat()
+        index = cls.read_sidecar(idx_path, st.st_size, st.st_mtime_ns)
+        if index is None:
+            index = cls.from_manifest(load_json(manifest_path))
+            try:
+                index.write_sidecar(idx_path, st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass  # read-only location: the JSON path still works
+        return index
+
+    # -- binary sidecar --------------------------------------------------
+
+    def write_sidecar(self, path: Path | str, manifest_size: int, manifest_mtime_ns: int) -> None:
+        parts = [_HEADER.pack(_MAGIC, manifest_size, manifest_mtime_ns, len(self._days))]
+        for (symbol, bar_size), (ordinals, rows) in sorted(self._days.items()):
+            sym, bar = symbol.encode("utf-8"), bar_size.encode("utf-8")
+            parts += [_KEY.pack(len(sym), len(bar), len(ordinals)), sym, bar, ordinals.tobytes(), rows.tobytes()]
+        tmp = Path(str(path) + ".tmp")
+        tmp.write_bytes(b"".join(parts))
+        tmp.replace(path)
+
+    @classmethod
+    def read_sidecar(cls, path: Path | str, manifest_size: int, manifest_mtime_ns: int) -> Optional["CoverageIndex"]:
+        """Return the index stored in ``path``, or None if missing, corrupt or stale."""
+        try:
+            buf = Path(path).read_bytes()
+            magic, size, mtime_ns, nkeys = _HEADER.unpack_from(buf, 0)
+            if magic != _MAGIC or (size, mtime_ns) != (manifest_size, manifest_mtime_ns):
+                return None
+            pos = _HEADER.size
+            days: Dict[Key, Tuple[array, array]] = {}
+            for _ in range(nkeys):
+                nsym, nbar, n = _KEY.unpack_from(buf, pos)
+                pos += _KEY.size
+                symbol = buf[pos:pos + nsym].decode("utf-8")
+                pos += nsym
+                bar_size = buf[pos:pos + nbar].decode("utf-8")
+                pos += nbar
+                ordinals, rows = array("i"), array("q")
+                ordinals.frombytes(buf[pos:pos + 4 * n])
+                pos += 4 * n
+                rows.frombytes(buf[pos:pos + 8 * n])
+                pos += 8 * n
+                if len(ordinals) != n or len(rows) != n:
+                    return None
+                days[(symbol, bar_size)] = (ordinals, rows)
+            return cls(days) if pos == len(buf) else None
+        except (OSError, struct.error, UnicodeDecodeError, ValueError):
+            return None
+
+    # -- queries ---------------------------------------------------------
+
+    def keys(self) -> List[Key]:
+        return sorted(self._days)
+
+    def symbols(self, bar_size: Optional[str] = None) -> List[str]:
+        return sorted({s for s, b in self._days if bar_size is None or b == bar_size})
+
+    def _slice(self, symbol: str, bar_size: str, start: Optional[DateLike], end: Optional[DateLike]) -> Tuple[array, int, int]:
+        ordinals = self._days.get((symbol, bar_size), (array("i"), array("q")))[0]
+        lo = 0 if start is None else bisect_left(ordinals, _ordinal(start))
+        hi = len(ordinals) if end is None else bisect_right(ordinals, _ordinal(end))
+        return ordinals, lo, hi
+
+    def has_day(self, symbol: str, bar_size: str, day: DateLike) -> bool:
+        ordinals, lo, hi = self._slice(symbol, bar_size, day, day)
+        return hi > lo
+
+    def days(self, symbol: str, bar_size: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[str]:
+        """Covered dates in ``[start, end]`` (inclusive, either bound optional), ascending."""
+        ordinals, lo, hi = self._slice(symbol, bar_size, start, end)
+        return [_iso(o) for o in ordinals[lo:hi]]
+
+    def count(self, symbol: str, bar_size: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> int:
+        _, lo, hi = self._slice(symbol, bar_size, start, end)
+        return hi - lo
+
+    def rows(self, symbol: str, bar_size: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> int:
+        """Total bar rows across the covered days in the range."""
+        _, lo, hi = self._slice(symbol, bar_size, start, end)
+        return sum(self._days[(symbol, bar_size)][1][lo:hi]) if hi > lo else 0
+
+    def bounds(self, symbol: str, bar_size: str) -> Optional[Tuple[str, str]]:
+        ordinals = self._days.get((symbol, bar_size), (array("i"),))[0]
+        return (_iso(ordinals[0]), _iso(ordinals[-1])) if ordinals else None
+
+    def intervals(self, symbol: str, bar_size: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[Tuple[str, str]]:
+        """Covered dates as inclusive runs of consecutive calendar days."""
+        ordinals, lo, hi = self._slice(symbol, bar_size, start, end)
+        return _runs(ordinals[lo:hi])
+
+    def gaps(
+        self,
+        symbol: str,
+        bar_size: str,
+        start: DateLike,
+        end: DateLike,
+        expected: Optional[Iterable[DateLike]] = None,
+    ) -> List[Tuple[str, str]]:
+        """Missing days in ``[start, end]`` as inclusive (first, last) runs.
+
+        ``expected`` lists the days that should exist (e.g. exchange sessions);
+        by default every Monday-Friday in the range. A run spans consecutive
+        expected days, so a weekend between two missing days does not split it.
+        """
+        lo_o, hi_o = _ordinal(start), _ordinal(end)
+        if expected is None:
+            wanted = [o for o in range(lo_o, hi_o + 1) if date.fromordinal(o).weekday() < 5]
+        else:
+            wanted = sorted(o for o in map(_ordinal, expected) if lo_o <= o <= hi_o)
+        ordinals, lo, hi = self._slice(symbol, bar_size, start, end)
+        have = set(ordinals[lo:hi])
+        runs: List[Tuple[str, str]] = []
+        first = last = None
+        for o in wanted:
+            if o in have:
+                if first is not None:
+                    runs.append((_iso(first), _iso(last)))
+                    first = None
+                continue
+            if first is None:
+                first = o
+            last = o
+        if first is not None:
+            runs.append((_iso(first), _iso(last)))
+        return runs
+
+    def query_many(
+        self,
+        symbols: Iterable[str],
+        bar_size: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> Dict[str, List[str]]:
+        """``days`` for several symbols at once; bounds are parsed a single time."""
+        start = None if start is None else _as_date(start)
+        end = None if end is None else _as_date(end)
+        return {s: self.days(s, bar_size, start, end) for s in symbols}
+
+    def counts(
+        self,
+        symbols: Iterable[str],
+        bar_size: str,
+        start: DateLike,
+        end: DateLike,
+    ) -> Dict[str, int]:
+        """Covered-day count per symbol in ``[start, end]``, for ranking candidates."""
+        start, end = _as_date(start), _as_date(end)
+        return {s: self.count(s, bar_size, start, end) for s in symbols}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "coverage_index",
+        "description": "Query a bars coverage manifest by symbol/bar size/date range (days, runs, gaps) through a bisect index with a binary sidecar cache.",
+        "inputs": {"coverage": "bars_coverage_manifest.json", "flags": ["--symbol", "--bar-size", "--start", "--end", "--gaps", "--no-sidecar", "--describe"]},
+        "outputs": {"stdout": "JSON: covered days (or missing runs with --gaps) per symbol"},
+        "examples": [
+            "python tools/coverage_index.py bars_coverage_manifest.json --symbol AAPL --bar-size '1 sec' --start 2025-01-01 --end 2025-06-30",
+            "python tools/coverage_index.py bars_coverage_manifest.json --symbol AAPL --symbol MSFT --bar-size '1 min' --start 2025-01-01 --end 2025-06-30 --gaps",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import json
+    ap = argparse.ArgumentParser(description="Query bars coverage by symbol and date range")
+    ap.add_argument("coverage", nargs="?", type=Path)
+    ap.add_argument("--symbol", action="append", help="Symbol to query (repeatable; default: all for the bar size)")
+    ap.add_argument("--bar-size", default="1 min", choices=["1 hour", "1 min", "1 sec"])
+    ap.add_argument("--start", help="First date (YYYY-MM-DD), inclusive")
+    ap.add_argument("--end", help="Last date (YYYY-MM-DD), inclusive")
+    ap.add_argument("--gaps", action="store_true", help="List missing weekday runs instead of covered days (needs --start/--end)")
+    ap.add_argument("--no-sidecar", action="store_true", help="Neither read nor write the binary .idx sidecar")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.coverage is None:
+        ap.error("coverage is required")
+    if args.gaps and not (args.start and args.end):
+        ap.error("--gaps needs --start and --end")
+
+    try:
+        index = CoverageIndex.load(args.coverage, sidecar=not args.no_sidecar)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"ERROR: cannot load {args.coverage}: {e}")
+        return 2
+    symbols = args.symbol or index.symbols(args.bar_size)
+    if args.gaps:
+        result: Dict[str, Any] = {s: index.gaps(s, args.bar_size, args.start, args.end) for s in symbols}
+    else:
+        result = index.query_many(symbols, args.bar_size, args.start, args.end)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Canonical content hash for parquet/feather dataset bundles (``data_hash`` / ``dataset_hash``).
+
+The hash identifies dataset *contents*, not bytes on disk. Following the
+same principle as ``validation_lib.canonicalize`` (key order must not change
+a hash), it is independent of:
+
+  * file discovery order - files are Merkle leaves sorted by relative path;
+  * column order - columns are hashed separately and combined sorted by name;
+  * physical layout - row-group/batch boundaries, compression, encoding,
+    dictionary encoding and file metadata;
+  * NaN payloads - every NaN is hashed as the canonical quiet NaN.
+
+Row order within a file *is* content (bars are time series). Column types are
+part of the hash (large/small string, binary and list variants are unified).
+
+Algorithm ``merkle-sha256/v2``:
+
+  column digest = sha256(name, type, rows, sha256(values), sha256(null row
+                  indices)[, sha256(value lengths)] for variable-width types
+                  [, child column digests] for list/struct types)
+  file digest   = sha256(version tag, rows, sorted (name, column digest))
+  leaf          = sha256(0x00 || relpath || 0x00 || file digest)
+  node          = sha256(0x01 || left || right); an odd node is promoted.
+
+List columns (the Level2 depth arrays) hash their per-row lengths and recurse
+into the flattened child array; struct columns recurse into each field. So
+nested data stays columnar and NaNs at any depth get the canonical payload.
+v1 hashed nested values as per-row JSON; v2 digests of nested columns differ.
+
+Files are streamed one row group (or IPC batch) at a time and hashed in a
+process pool, so memory is bounded by the largest row group. Per-file
+digests are kept in a SQLite leaf cache (see leaf_cache.py), so re-hashing a
+bundle only reads files whose stat signature changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import struct
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from leaf_cache import DEFAULT_CACHE_PATH, LeafCache, stat_key
+from validate_parquet import iter_column_chunks, read_schema, require_pyarrow
+from validation_lib import ValidationError
+
+np = pa = pc = None  # imported on first use by _require_arrow
+
+ALGORITHM = "merkle-sha256/v2"
+DEFAULT_EXTENSIONS = (".parquet", ".ftr")
+_CANONICAL_NAN = struct.unpack("<d", bytes.fromhex("000000000000f87f"))[0]
+
+
+@dataclass
+class FileDigest:
+    path: str
+    rows: int
+    sha256: str
+
+
+@dataclass
+class BundleHash:
+    root: str
+    algorithm: str = ALGORITHM
+    files: int = 0
+    rows: int = 0
+    cached: int = 0  # leaves taken from the leaf cache without re-reading
+    verified: int = 0  # cache hits re-hashed by --verify
+    stale: List[str] = field(default_factory=list)  # verified hits whose digest had changed
+    purged: int = 0  # cache rows dropped for files no longer under the root
+    leaves: List[FileDigest] = field(default_factory=list)
+
+    def to_dict(self, leaves: bool = False) -> Dict[str, Any]:
+        data = asdict(self)
+        if not leaves:
+            data.pop("leaves")
+        return data
+
+
+def _require_arrow() -> None:
+    global np, pa, pc
+    if np is None:
+        try:
+            import numpy  # type: ignore
+        except ImportError as e:  # pragma: no cover
+            raise ValidationError("numpy is required for dataset hashing") from e
+        np = numpy
+    if pa is None:
+        pa = require_pyarrow()
+        import pyarrow.compute  # type: ignore
+
+        pc = pyarrow.compute
+
+
+def canonical_type(arrow_type: Any) -> str:
+    """Type string with offset-width variants (large_string, large_list, ...) unified."""
+    t = pa.types
+    if t.is_dictionary(arrow_type):
+        return canonical_type(arrow_type.value_type)
+    if t.is_large_string(arrow_type):
+        return "string"
+    if t.is_large_binary(arrow_type):
+        return "binary"
+    if t.is_large_list(arrow_type) or t.is_list(arrow_type):
+        return f"list<{canonical_type(arrow_type.value_type)}>"
+    if t.is_struct(arrow_type):
+        fields = (arrow_type.field(i) for i in range(arrow_type.num_fields))
+        return "struct<" + ", ".join(f"{f.name}: {canonical_type(f.type)}" for f in fields) + ">"
+    return str(arrow_type)
+
+
+def _is_list(arrow_type: Any) -> bool:
+    t = pa.types
+    return (t.is_list(arrow_type) or t.is_large_list(arrow_type) or t.is_fixed_size_list(arrow_type)) and not t.is_map(arrow_type)
+
+
+class ColumnHasher:
+    """Streams one column's chunks into layout-independent digests."""
+
+    def __init__(self, name: str, arrow_type: Any):
+        self.name = name
+        self.type = canonical_type(arrow_type)
+        self.rows = 0
+        self.values = hashlib.sha256()
+        self.nulls = hashlib.sha256()
+        self.lengths: Optional[Any] = None
+        self.children: List["ColumnHasher"] = []
+        if _is_list(arrow_type):
+            self.children = [ColumnHasher("[]", arrow_type.value_type)]
+        elif pa.types.is_struct(arrow_type):
+            self.children = [ColumnHasher(f.name, f.type) for f in arrow_type]
+
+    def update(self, column: Any) -> None:
+        chunks = column.chunks if hasattr(column, "chunks") else [column]
+        for arr in chunks:
+            if pa.types.is_dictionary(arr.type):
+                arr = arr.dictionary_decode()
+            if arr.null_count:
+                idx = np.flatnonzero(arr.is_null().to_numpy(zero_copy_only=False)) + self.rows
+                self.nulls.update(idx.astype("<i8").tobytes())
+            self._update_values(arr)
+            self.rows += len(arr)
+
+    def _update_values(self, arr: Any) -> None:
+        t = pa.types
+        typ = arr.type
+        if t.is_string(typ) or t.is_large_string(typ) or t.is_binary(typ) or t.is_large_binary(typ):
+            arr = pc.fill_null(arr.cast(pa.large_binary()), b"")
+            offsets = np.frombuffer(arr.buffers()[1], dtype="<i8")[arr.offset:arr.offset + len(arr) + 1]
+            if self.lengths is None:
+                self.lengths = hashlib.sha256()
+            self.lengths.update(np.diff(offsets).astype("<i8").tobytes())
+            data = arr.buffers()[2]
+            if data is not None and len(offsets):
+                self.values.update(memoryview(data)[int(offsets[0]):int(offsets[-1])])
+            return
+        if _is_list(typ):
+            # Row lengths (0 for null rows) plus the flattened values; flatten()
+            # drops anything stored under null slots, so layout cannot leak in.
+            if self.lengths is None:
+                self.lengths = hashlib.sha256()
+            lengths = pc.fill_null(pc.list_value_length(arr), 0).to_numpy(zero_copy_only=False)
+            self.lengths.update(lengths.astype("<i8").tobytes())
+            self.children[0].update(arr.flatten())
+            return
+        if t.is_struct(typ):
+            # flatten() applies the slice offset and merges the struct's nulls into each field.
+            for child, values in zip(self.children, arr.flatten()):
+                child.update(values)
+            return
+        if t.is_boolean(typ):
+            self.values.update(pc.fill_null(arr, False).to_numpy(zero_copy_only=False).astype("u1").tobytes())
+            return
+        if t.is_integer(typ) or t.is_floating(typ) or t.is_temporal(typ):
+            if t.is_temporal(typ):
+                storage = pa.int32() if typ.bit_width == 32 else pa.int64()
+                arr = arr.view(storage) if hasattr(arr, "view") else arr.cast(storage)
+            values = pc.fill_null(arr, 0).to_numpy(zero_copy_only=False)
+            if values.dtype.kind == "f":
+                values = np.where(np.isnan(values), _CANONICAL_NAN, values)
+            self.values.update(values.astype(values.dtype.newbyteorder("<")).tobytes())
+            return
+        # Decimal/other: length-prefixed canonical JSON per value (slow path).
+        if self.lengths is None:
+            self.lengths = hashlib.sha256()
+        for value in arr.to_pylist():
+            blob = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+            self.lengths.update(struct.pack("<q", len(blob)))
+            self.values.update(blob)
+
+    def hexdigest(self) -> str:
+        h = hashlib.sha256()
+        h.update(json.dumps([self.name, self.type, self.rows], separators=(",", ":")).encode("utf-8"))
+        h.update(self.values.digest())
+        h.update(self.nulls.digest())
+        if self.lengths is not None:
+            h.update(self.lengths.digest())
+        for child in self.children:
+            h.update(bytes.fromhex(child.hexdigest()))
+        return h.hexdigest()
+
+
+def hash_file(path: Path | str) -> Tuple[int, str]:
+    """Return (rows, canonical content sha256) for one parquet/feather file."""
+    _require_arrow()
+    schema, _, _ = read_schema(path)
+    names = sorted(schema.names)
+    if len(set(names)) != len(names):
+        raise ValidationError(f"{path}: duplicate column names cannot be hashed canonically")
+    hashers = {n: ColumnHasher(n, schema.field(n).type) for n in names}
+    rows = 0
+    for table in iter_column_chunks(path, names):
+        rows += table.num_rows
+        for n in names:
+            hashers[n].update(table.column(n))
+    h = hashlib.sha256()
+    h.update(f"{ALGORITHM}\n{rows}\n".encode("utf-8"))
+    for n in names:
+        h.update(n.encode("utf-8") + b"\x00" + bytes.fromhex(hashers[n].hexdigest()))
+    return rows, h.hexdigest()
+
+
+def merkle_root(leaves: Mapping[str, str]) -> str:
+    """Combine ``{relpath: file sha256}`` into a root independent of mapping order."""
+    level = [
+        hashlib.sha256(b"\x00" + rel.encode("utf-8") + b"\x00" + bytes.fromhex(digest)).digest()
+        for rel, digest in sorted(leaves.items())
+    ]
+    if not level:
+        return hashlib.sha256(b"\x00").hexdigest()
+    while len(level) > 1:
+        nxt = [hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return level[0].hex()
+
+
+def bundle_files(root: Path | str, extensions: Sequence[str] = DEFAULT_EXTENSIONS) -> List[Path]:
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        files.extend(Path(dirpath) / n for n in sorted(filenames) if Path(n).suffix.lower() in extensions)
+    return files
+
+
+def _relpath(path: Path, root: Path) -> str:
+    return path.name if root.is_file() else path.relative_to(root).as_posix()
+
+
+def hash_paths(paths: Sequence[Path], jobs: int = 0) -> List[Tuple[int, str]]:
+    """Hash ``paths`` (in order) across a process pool; ``jobs`` <= 0 uses every CPU, 1 runs in-process."""
+    workers = min(jobs if jobs > 0 else (os.cpu_count() or 1), len(paths))
+    if workers <= 1:
+        return [hash_file(p) for p in paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(hash_file, [str(p) for p in paths], chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def hash_bundle(
+    root: Path | str,
+    jobs: int = 0,
+    files: Optional[Iterable[Path]] = None,
+    cache: Optional[LeafCache] = None,
+    verify: int = 0,
+    seed: Optional[int] = None,
+) -> BundleHash:
+    """Hash every data file under ``root`` (or the given ``files``) into a Merkle root.
+
+    With a ``cache``, files whose (size, mtime_ns, inode) match a stored leaf
+    are not re-read. ``verify`` re-hashes that many randomly chosen cache hits;
+    mismatching entries are replaced and reported in ``stale``. When the whole
+    directory was walked (no ``files``), cache rows for paths under it that no
+    longer exist are purged.
+
+    Leaves are named by each file's own path relative to ``root``. Symlinked
+    files are followed: the link is a leaf under its own name, hashed from its
+    target (which is also the cache key, so a target is read at most once).
+    Symlinked directories are not walked.
+    """
+    root = Path(root)
+    if not root.exists():
+        raise ValidationError(f"dataset path not found: {root}")
+    paths = list(files) if files is not None else bundle_files(root)
+    base = Path(os.path.abspath(root))
+    named = []
+    for p in paths:
+        try:
+            name = _relpath(Path(os.path.abspath(p)), base)
+        except ValueError:
+            raise ValidationError(f"{p} is not inside the dataset path {root}") from None
+        named.append((name, str(Path(p).resolve())))
+    repeated = sorted(n for n, c in Counter(n for n, _ in named).items() if c > 1)
+    if repeated:
+        raise ValidationError(f"files listed more than once: {', '.join(repeated)}")
+    resolved_root = root.resolve()
+    absolute = list(dict.fromkeys(a for _, a in named))
+    keys = {a: stat_key(a) for a in absolute}
+    hits = cache.lookup(keys) if cache is not None else {}
+
+    recheck = random.Random(seed).sample(sorted(hits), min(verify, len(hits))) if verify > 0 else []
+    todo = [a for a in absolute if a not in hits] + recheck
+    digests = dict(zip(todo, hash_paths([Path(a) for a in todo], jobs)))
+    stale = sorted(n for n, a in named if a in recheck and digests[a] != hits[a])
+    if cache is not None:
+        cache.put_many((a, keys[a], rows, d) for a, (rows, d) in digests.items() if a not in hits or digests[a] != hits[a])
+    purged = 0
+    if cache is not None and files is None and resolved_root.is_dir():
+        gone = [p for p in cache.paths_under(str(resolved_root)) if p not in keys]
+        cache.discard(gone)
+        purged = len(gone)
+
+    leaves = []
+    for name, a in named:
+        rows, digest = digests.get(a) or hits[a]
+        leaves.append(FileDigest(path=name, rows=rows, sha256=digest))
+    leaves.sort(key=lambda leaf: leaf.path)
+    return BundleHash(
+        root=merkle_root({leaf.path: leaf.sha256 for leaf in leaves}),
+        files=len(leaves),
+        rows=sum(leaf.rows for leaf in leaves),
+        cached=len(hits) - len(recheck),
+        verified=len(recheck),
+        stale=stale,
+        purged=purged,
+        leaves=leaves,
+    )
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "dataset_hash",
+        "description": "Canonical, layout-independent content hash (merkle-sha256/v2) of a parquet/feather bundle for manifest data_hash/dataset_hash.",
+        "inputs": {"path": "Dataset directory or single file", "flags": ["--jobs", "--leaves", "--cache", "--no-cache", "--verify", "--describe"]},
+        "outputs": {"stdout": "JSON with the Merkle root, file and row counts (plus per-file leaves with --leaves)"},
+        "examples": [
+            "python tools/dataset_hash.py Stocks_clean_v1/",
+            "python tools/dataset_hash.py Stocks_clean_v1/Seconds --jobs 8 --leaves",
+            "python tools/dataset_hash.py Stocks_clean_v1/ --verify 50",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Compute the canonical content hash of a dataset bundle")
+    ap.add_argument("path", nargs="?", type=Path)
+    ap.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = all CPUs, 1 = in-process)")
+    ap.add_argument("--leaves", action="store_true", help="Include per-file digests in the output")
+    ap.add_argument("--cache", type=Path, default=DEFAULT_CACHE_PATH, help="SQLite leaf-hash cache")
+    ap.add_argument("--no-cache", action="store_true", help="Hash every file and leave the cache untouched")
+    ap.add_argument("--verify", type=int, default=0, metavar="N", help="Re-hash N random cache hits to detect stale entries")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.path is None:
+        ap.error("path is required")
+    cache = None if args.no_cache else LeafCache(args.cache, algorithm=ALGORITHM)
+    try:
+        result = hash_bundle(args.path, jobs=args.jobs, cache=cache, verify=args.verify)
+    except ValidationError as e:
+        print(f"ERROR: {e}")
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+    print(json.dumps(result.to_dict(leaves=args.leaves), indent=2))
+    return 1 if result.stale else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Compute and verify manifest ``feature_hash`` values.
+
+``feature_hash`` is the sha256 of the feature-set definition serialised
+canonically: ``validation_lib.canonicalize`` (recursively key-sorted), then
+compact JSON (``separators=(",", ":")``) encoded as UTF-8 - the same recipe
+export_manifest_hash.py uses for the manifest schema, so key order and
+whitespace in the definition file never change the hash.
+
+Definition hashes are memoised by file content, so verifying thousands of
+archived manifests that share a handful of definitions parses and hashes
+each definition once.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from validation_lib import canonicalize, json_loads, load_json
+
+MIN_PREFIX = 8  # manifest schema: feature_hash minLength
+
+
+def compute_feature_hash(definition: Any) -> str:
+    payload = json.dumps(canonicalize(definition), separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+_BY_STAT: Dict[Tuple[str, int, int], str] = {}
+_BY_CONTENT: Dict[bytes, str] = {}
+
+
+def feature_hash_for_file(path: Path | str) -> str:
+    """``compute_feature_hash`` of a definition file, memoised by (path, stat) and by content."""
+    path = Path(path)
+    st = path.stat()
+    stat_key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    cached = _BY_STAT.get(stat_key)
+    if cached is not None:
+        return cached
+    raw = path.read_bytes()
+    content_key = hashlib.sha256(raw).digest()
+    digest = _BY_CONTENT.get(content_key)
+    if digest is None:
+        digest = _BY_CONTENT[content_key] = compute_feature_hash(json_loads(raw))
+    _BY_STAT[stat_key] = digest
+    return digest
+
+
+def clear_cache() -> None:
+    _BY_STAT.clear()
+    _BY_CONTENT.clear()
+
+
+def hash_matches(stored: Any, expected: str) -> bool:
+    """True only when ``stored`` is the full 64-character hash (case-insensitive)."""
+    return isinstance(stored, str) and stored.lower() == expected
+
+
+def match_status(stored: Any, expected: str) -> str:
+    """``ok`` for the full hash, ``prefix`` for a shorter stored prefix (>= MIN_PREFIX chars), else ``mismatch``.
+
+    The manifest schema admits abbreviated hashes, but an 8-character prefix
+    is only 32 bits of evidence, so it is reported separately from ``ok``.
+    """
+    if hash_matches(stored, expected):
+        return "ok"
+    if isinstance(stored, str) and len(stored) >= MIN_PREFIX and expected.startswith(stored.lower()):
+        return "prefix"
+    return "mismatch"
+
+
+def index_definitions(directory: Path | str) -> Dict[str, Path]:
+    """Map feature_set_version -> definition file for every ``*.json`` in ``directory``.
+
+    The key is the definition's own ``feature_set_version`` (or ``version``)
+    field when present, else the file stem.
+    """
+    index: Dict[str, Path] = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        try:
+            data = load_json(path)
+        except ValueError:
+            continue
+        version = (data.get("feature_set_version") or data.get("version")) if isinstance(data, dict) else None
+        index[str(version or path.stem)] = path
+    return index
+
+
+@dataclass
+class FeatureHashCheck:
+    manifest: str
+    status: str  # ok | prefix | mismatch | no-definition | invalid
+    feature_set_version: Optional[str] = None
+    stored: Optional[str] = None
+    expected: Optional[str] = None
+    detail: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def verify_manifest(
+    manifest_path: Path | str,
+    definitions: Optional[Dict[str, Path]] = None,
+    definition: Optional[Path] = None,
+) -> FeatureHashCheck:
+    """Check one manifest's ``feature_hash`` against a fixed ``definition`` or the ``definitions`` index."""
+    check = FeatureHashCheck(manifest=str(manifest_path), status="invalid")
+    try:
+        manifest = load_json(manifest_path)
+    except (OSError, ValueError) as e:
+        check.detail = str(e)
+        return check
+    if not isinstance(manifest, dict):
+        check.detail = "manifest is not a JSON object"
+        return check
+    check.feature_set_version = manifest.get("feature_set_version")
+    check.stored = manifest.get("feature_hash")
+    source = definition
+    if source is None:
+        source = (definitions or {}).get(str(check.feature_set_version))
+        if source is None:
+            check.status = "no-definition"
+            check.detail = f"no definition for feature_set_version {check.feature_set_version!r}"
+            return check
+    try:
+        check.expected = feature_hash_for_file(source)
+    except (OSError, ValueError) as e:
+        check.detail = f"{source}: {e}"
+        return check
+    check.status = match_status(check.stored, check.expected)
+    return check
+
+
+def iter_manifest_paths(targets: Iterable[Path]) -> Iterable[Path]:
+    for target in targets:
+        if target.is_dir():
+            for dirpath, dirnames, filenames in os.walk(target):
+                dirnames.sort()
+                yield from (Path(dirpath) / n for n in sorted(filenames) if n.endswith(".json"))
+        else:
+            yield target
+
+
+def verify_batch(
+    manifests: Iterable[Path],
+    definitions_dir: Optional[Path] = None,
+    definition: Optional[Path] = None,
+) -> List[FeatureHashCheck]:
+    index = index_definitions(definitions_dir) if definitions_dir is not None else None
+    return [verify_manifest(m, index, definition) for m in iter_manifest_paths(manifests)]
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "feature_hash",
+        "description": "Compute the canonical feature_hash of feature-set definitions and batch-verify archived manifests against them.",
+        "inputs": {
+            "compute": "Definition JSON file(s)",
+            "verify": "Manifest files/directories plus --definitions DIR or --definition FILE",
+            "flags": ["--definitions", "--definition", "--json", "--allow-prefix", "--describe"],
+        },
+        "outputs": {"stdout": "hash per definition, or PREFIX/MISMATCH/... lines per manifest with a summary"},
+        "examples": [
+            "python tools/feature_hash.py compute features/fs_v3.json",
+            "python tools/feature_hash.py verify --definitions features/ archive/manifests/",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Compute or verify manifest feature_hash values")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    sub = ap.add_subparsers(dest="command")
+    comp = sub.add_parser("compute", help="Print the feature_hash of definition files")
+    comp.add_argument("definitions", nargs="+", type=Path)
+    ver = sub.add_parser("verify", help="Verify manifests' feature_hash against their definitions")
+    ver.add_argument("manifests", nargs="+", type=Path, help="Manifest files or directories (searched for *.json)")
+    src = ver.add_mutually_exclusive_group(required=True)
+    src.add_argument("--definitions", type=Path, help="Directory of definitions, matched by feature_set_version")
+    src.add_argument("--definition", type=Path, help="Single definition every manifest must match")
+    ver.add_argument("--json", action="store_true", help="Print JSON results instead of text lines")
+    ver.add_argument("--allow-prefix", action="store_true", help="Accept abbreviated stored hashes that prefix the expected one")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.command is None:
+        ap.error("a command (compute or verify) is required")
+
+    if args.command == "compute":
+        for path in args.definitions:
+            print(f"{feature_hash_for_file(path)}  {path}")
+        return 0
+
+    results = verify_batch(args.manifests, args.definitions, args.definition)
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        for r in results:
+            if r.status != "ok":
+                print(f"{r.status.upper()} {r.manifest}" + (f": {r.detail}" if r.detail else f" (stored {r.stored}, expected {r.expected})"))
+        counts = {s: sum(1 for r in results if r.status == s) for s in ("ok", "prefix", "mismatch", "no-definition", "invalid")}
+        print(f"{len(results)} manifests: " + ", ".join(f"{n} {s}" for s, n in counts.items()))
+    accepted = {"ok", "prefix"} if args.allow_prefix else {"ok"}
+    return 0 if all(r.status in accepted for r in results) else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+"""Checkpoint sidecars for append-only JSONL logs.
+
+bars_download_manifest.jsonl is append-only by contract, so once a prefix has
+been processed it never needs processing again. A checkpoint records the byte
+offset and line/record counts reached plus a sha256 of the processed prefix;
+later runs re-hash the prefix (cheap, I/O bound) to prove it is unchanged and
+then only process the appended tail. A rewritten or truncated file fails that
+check and callers fall back to a full run.
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from jsonl_io import DEFAULT_BUFFER_SIZE
+from validation_lib import dump_json, load_json
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class Checkpoint:
+    offset: int
+    lines: int
+    records: int
+    prefix_sha256: str
+    schema_hash: str
+    version: int = CHECKPOINT_VERSION
+
+
+def default_checkpoint_path(jsonl_path: Path | str) -> Path:
+    jsonl_path = Path(jsonl_path)
+    return jsonl_path.with_name(jsonl_path.name + ".checkpoint.json")
+
+
+def hash_range(path: Path | str, start: int, end: int, hasher=None):
+    """Feed bytes ``[start, end)`` of ``path`` into ``hasher`` (new sha256 if None)."""
+    hasher = hasher or hashlib.sha256()
+    remaining = end - start
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        while remaining > 0:
+            chunk = fh.read(min(DEFAULT_BUFFER_SIZE, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher
+
+
+def last_line_end(path: Path | str, start: int, end: int) -> int:
+    """Return the offset just past the last newline in ``[start, end)`` (or ``start``)."""
+    pos = end
+    with open(path, "rb") as fh:
+        while pos > start:
+            step = min(DEFAULT_BUFFER_SIZE, pos - start)
+            fh.seek(pos - step)
+            chunk = fh.read(step)
+            idx = chunk.rfind(b"\n")
+            if idx >= 0:
+                return pos - step + idx + 1
+            pos -= step
+    return start
+
+
+def load_checkpoint(path: Path | str) -> Optional[Checkpoint]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        data = load_json(path)
+        if data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return Checkpoint(**data)
+    except (ValueError, TypeError):
+        return None
+
+
+def save_checkpoint(path: Path | str, checkpoint: Checkpoint) -> None:
+    dump_json(Path(path), asdict(checkpoint))
+
+
+def verify_prefix(jsonl_path: Path | str, checkpoint: Checkpoint, schema_hash: str):
+    """Return a sha256 hasher primed with the verified prefix, or None if it changed.
+
+    The returned hasher can be extended with the tail to produce the next
+    checkpoint's ``prefix_sha256`` without reading the prefix twice.
+    """
+    if checkpoint.schema_hash != schema_hash:
+        return None
+    if Path(jsonl_path).stat().st_size < checkpoint.offset:
+        return None
+    hasher = hash_range(jsonl_path, 0, checkpoint.offset)
+    if hasher.hexdigest() != checkpoint.prefix_sha256:
+        return None
+    return hasher
+
+
+__all__ = [
+    "Checkpoint",
+    "default_checkpoint_path",
+    "hash_range",
+    "last_line_end",
+    "load_checkpoint",
+    "save_checkpoint",
+    "verify_prefix",
+]
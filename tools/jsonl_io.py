@@ -0,0 +1,103 @@
+"""Streaming readers for JSON Lines audit logs.
+
+bars_download_manifest.jsonl is append-only and can grow to many GB, so the
+validators never materialise it in memory. ``open_jsonl`` returns a buffered
+binary stream (transparently decompressing ``.gz`` and ``.zst``) whose lines
+can be iterated with a fixed-size read buffer, keeping peak memory bounded by
+the longest line rather than the file size.
+"""
+from __future__ import annotations
+
+import gzip
+import io
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Tuple
+
+from validation_lib import ValidationError
+
+DEFAULT_BUFFER_SIZE = 1 << 20  # 1 MiB read buffer
+COMPRESSED_SUFFIXES = {".gz", ".zst"}
+
+
+def is_compressed(path: Path | str) -> bool:
+    return Path(path).suffix.lower() in COMPRESSED_SUFFIXES
+
+
+def _open_zstd(path: Path, buffer_size: int) -> BinaryIO:
+    try:  # Python 3.14+ ships zstd in the stdlib
+        from compression import zstd  # type: ignore
+
+        return io.BufferedReader(zstd.open(path, "rb"), buffer_size)  # type: ignore[arg-type]
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore
+    except ImportError as e:
+        raise ValidationError(f"reading {path.name} requires the 'zstandard' package") from e
+    raw = path.open("rb")
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, read_size=buffer_size, closefd=True)
+    return io.BufferedReader(reader, buffer_size)
+
+
+def open_jsonl(path: Path | str, buffer_size: int = DEFAULT_BUFFER_SIZE) -> BinaryIO:
+    """Open a ``.jsonl``, ``.jsonl.gz`` or ``.jsonl.zst`` file for streaming binary reads.
+
+    Decompression happens on the fly; nothing is written to disk.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        return io.BufferedReader(gzip.open(path, "rb"), buffer_size)  # type: ignore[arg-type]
+    if suffix == ".zst":
+        return _open_zstd(path, buffer_size)
+    return open(path, "rb", buffering=buffer_size)
+
+
+def shard_ranges(path: Path | str, shards: int, start: int = 0, end: int | None = None) -> List[Tuple[int, int]]:
+    """Split bytes ``[start, end)`` of an uncompressed JSONL file into ``shards`` ranges.
+
+    ``start`` must sit on a line start. Every returned ``(start, end)`` begins at
+    the start of a line; ranges are contiguous, non-empty and cover the span.
+    """
+    path = Path(path)
+    if end is None:
+        end = path.stat().st_size
+    size = end - start
+    if size <= 0:
+        return []
+    shards = max(1, min(shards, size))
+    bounds = [start]
+    with path.open("rb") as fh:
+        for k in range(1, shards):
+            target = start + size * k // shards
+            if target <= bounds[-1]:
+                continue
+            # Step back one byte so a target sitting exactly on a line start is kept.
+            fh.seek(target - 1)
+            fh.readline()
+            pos = fh.tell()
+            if bounds[-1] < pos < end:
+                bounds.append(pos)
+    bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def iter_range(path: Path | str, start: int, end: int, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[bytes]:
+    """Yield the raw lines of an uncompressed file that start within ``[start, end)``."""
+    with open(path, "rb", buffering=buffer_size) as fh:
+        fh.seek(start)
+        pos = start
+        for raw in fh:
+            if pos >= end:
+                break
+            pos += len(raw)
+            yield raw
+
+
+__all__ = [
+    "DEFAULT_BUFFER_SIZE",
+    "is_compressed",
+    "open_jsonl",
+    "shard_ranges",
+    "iter_range",
+]
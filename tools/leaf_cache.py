@@ -0,0 +1,111 @@
+"""Persistent per-file leaf-hash cache for dataset_hash.
+
+Hashing a multi-TB mirror is I/O bound, yet between exports only a handful
+of files change. This SQLite sidecar remembers each file's canonical digest
+keyed by (absolute path, size, mtime_ns, inode, algorithm); a file whose
+stat signature still matches is not re-read and only the Merkle combine
+(32-byte hashes, negligible) is redone.
+
+A stat signature can lie (a same-size rewrite within mtime granularity,
+restored backups), so callers can re-hash a random sample of hits to detect
+stale entries (``dataset_hash.py --verify N``). Rows for files that no longer
+exist under a hashed bundle root are purged after each full-bundle hash, so
+deleted or renamed files do not accumulate.
+"""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ml_contracts" / "leaf_hashes.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leaves (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    hashed_at REAL NOT NULL
+)
+"""
+
+StatKey = Tuple[int, int, int]  # (size, mtime_ns, inode)
+
+
+def stat_key(path: Path | str) -> StatKey:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class LeafCache:
+    """(path, size, mtime_ns, inode, algorithm) -> (rows, sha256), stored in SQLite."""
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, algorithm: str = ""):
+        self.path = Path(path)
+        self.algorithm = algorithm
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        import sqlite3
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "LeafCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, path: str, key: StatKey) -> Optional[Tuple[int, str]]:
+        row = self._conn.execute(
+            "SELECT rows, sha256 FROM leaves WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ? AND algorithm = ?",
+            (path, *key, self.algorithm),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def lookup(self, entries: Dict[str, StatKey]) -> Dict[str, Tuple[int, str]]:
+        """Bulk ``get``: return the hits among ``{path: stat key}``."""
+        hits = {}
+        for path, key in entries.items():
+            hit = self.get(path, key)
+            if hit is not None:
+                hits[path] = hit
+        return hits
+
+    def put_many(self, rows: Iterable[Tuple[str, StatKey, int, str]]) -> None:
+        """Store ``(path, stat key, rows, sha256)`` tuples in one transaction."""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO leaves (path, size, mtime_ns, inode, algorithm, rows, sha256, hashed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(p, *key, self.algorithm, n, digest, now) for p, key, n, digest in rows],
+            )
+
+    def discard(self, paths: Iterable[str]) -> None:
+        with self._conn:
+            self._conn.executemany("DELETE FROM leaves WHERE path = ?", [(p,) for p in paths])
+
+    def paths_under(self, directory: str) -> List[str]:
+        """Cached paths below ``directory`` (an absolute path, any algorithm)."""
+        prefix = directory.rstrip(os.sep) + os.sep
+        # Range scan on the primary key: every string starting with prefix sorts in [prefix, prefix + U+10FFFF).
+        rows = self._conn.execute(
+            "SELECT path FROM leaves WHERE path >= ? AND path < ?", (prefix, prefix + "\U0010ffff")
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM leaves").fetchone()[0]
+
+
+__all__ = ["DEFAULT_CACHE_PATH", "LeafCache", "StatKey", "stat_key"]
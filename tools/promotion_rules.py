@@ -5,12 +5,18 @@ Also audits that all metric variable references exist in the provided schema.
 """
 from __future__ import annotations
 
+import copy
 import json
+import numbers
+import operator
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
-from validation_lib import load_json
+from validation_lib import PathIndex, get_path_index, load_json
+
+np = None  # imported on first vectorized call (_require_numpy)
 
 RULE_PATH = Path(__file__).resolve().parent.parent / "rules" / "promotion.rule.json"
 MANIFEST_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schemas" / "manifest.schema.json"
@@ -22,8 +28,11 @@ class RuleError(Exception):
 
 def _collect_vars(node: Any, acc: Set[str]) -> None:
     if isinstance(node, dict):
-        if "var" in node and isinstance(node["var"], str):
-            acc.add(node["var"])
+        if "var" in node:
+            var = node["var"]
+            path = var[0] if isinstance(var, list) and var else var
+            if isinstance(path, str) and path:
+                acc.add(path)
         for v in node.values():
             _collect_vars(v, acc)
     elif isinstance(node, list):
@@ -37,38 +46,22 @@ def referenced_variables(rule: Dict[str, Any]) -> Set[str]:
     return vars
 
 
-def _section_properties(schema: Dict[str, Any], key: str) -> Set[str]:
-    return set((schema.get("properties", {})
-                .get(key, {})
-                .get("properties", {}))
-               .keys())
+def unknown_variables(rule: Dict[str, Any], index: PathIndex) -> List[str]:
+    """Referenced ``var`` paths that do not exist in the schema path index."""
+    return sorted(ref for ref in referenced_variables(rule) if not index.has_path(ref))
 
 
 def audit_rule_against_schema(rule: Dict[str, Any], manifest_schema: Dict[str, Any]) -> Dict[str, Any]:
-    refs = referenced_variables(rule)
-    sections: Dict[str, Set[str]] = defaultdict(set)
-    for ref in refs:
-        parts = ref.split(".")
-        if not parts:
-            continue
-        root = parts[0]
-        if len(parts) > 1:
-            sections[root].add(parts[1])
-        else:
-            sections[root].add("")
-
-    missing: List[str] = []
-    coverage: Dict[str, List[str]] = {}
-    for root, names in sections.items():
-        available = _section_properties(manifest_schema, root)
-        if not available:
-            coverage[root] = []
-            continue
-        missing_names = sorted(n for n in names if n and n not in available)
-        if missing_names:
-            missing.extend(f"{root}.{n}" for n in missing_names)
-        coverage[root] = sorted(available)
+    """Check every rule ``var`` path against the fully resolved manifest schema.
 
+    Paths are verified end to end (``$ref``/``allOf``/``oneOf`` followed), so a
+    typo in the leaf (``metrics.sharpe_sim.valu``) is caught, not just in the
+    metric name.
+    """
+    index = get_path_index(manifest_schema)
+    refs = referenced_variables(rule)
+    coverage = {root: index.children(root) for root in sorted({r.split(".")[0] for r in refs})}
+    missing = unknown_variables(rule, index)
     return {
         "referenced_vars": sorted(refs),
         "section_properties": coverage,
@@ -77,80 +70,627 @@ def audit_rule_against_schema(rule: Dict[str, Any], manifest_schema: Dict[str, A
     }
 
 
-def evaluate_rule(rule: Dict[str, Any], manifest: Dict[str, Any]) -> bool:
-    """Evaluate a very small subset of JSON Logic used in promotion rule.
+_COMPARATORS = {">=": operator.ge, ">": operator.gt, "<=": operator.le, "<": operator.lt}
+_EQUALITY = ("==", "!=", "===", "!==")
+LOGIC_OPERATORS = ("and", "or", "!", "!!", "if", "in") + _EQUALITY + tuple(_COMPARATORS)
+_MISSING = object()
+
+
+@dataclass
+class RuleResult:
+    passed: bool
+    failed_clause: Optional[int] = None  # index into the top-level ``and`` (0 for a single clause)
+    clause: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _is_number(x: Any) -> bool:
+    return type(x) in (float, int) or isinstance(x, numbers.Real)
+
+
+def _truthy(x: Any) -> bool:
+    """JSON-Logic truthiness: 0, "", [], null, false and NaN are falsy."""
+    if isinstance(x, float) and x != x:
+        return False
+    return bool(x)
+
+
+def _strict_equal(a: Any, b: Any) -> bool:
+    if _is_number(a) and _is_number(b) and not isinstance(a, bool) and not isinstance(b, bool):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def _var_spec(arg: Any) -> Tuple[str, Any]:
+    """Split a ``var`` argument into (path, default); default is _MISSING if absent."""
+    if isinstance(arg, list):
+        if not 1 <= len(arg) <= 2:
+            raise RuleError("var expects a path or [path, default]")
+        return ("" if arg[0] is None else str(arg[0])), (arg[1] if len(arg) == 2 else _MISSING)
+    return ("" if arg is None else str(arg)), _MISSING
+
+
+def _manifest_var(path: str, default: Any = _MISSING) -> Callable[[Any], Any]:
+    """Getter for a dotted ``var`` path, split once at compile time."""
+    parts = tuple(path.split(".")) if path else ()
+
+    def missing() -> Any:
+        if default is _MISSING:
+            raise RuleError(f"Variable path not found: {path}")
+        return default
+
+    def get(data: Any) -> Any:
+        cur = data
+        for p in parts:
+            try:
+                cur = cur[p]
+            except (KeyError, IndexError):
+                return missing()
+            except TypeError:
+                if isinstance(cur, list) and p.isdigit() and int(p) < len(cur):
+                    cur = cur[int(p)]
+                else:
+                    return missing()
+        return cur
+
+    return get
+
+
+def _column_var(columns: Mapping[str, Sequence[Any]]) -> Callable[..., Callable[[int], Any]]:
+    """Var factory for columnar input: columns are keyed by var path, data is a row index."""
+    def factory(path: str, default: Any = _MISSING) -> Callable[[int], Any]:
+        if path not in columns:
+            if default is _MISSING:
+                raise RuleError(f"Variable path not found in columns: {path}")
+            return lambda i: default
+        col = columns[path]
+        return col.__getitem__
+
+    return factory
+
+
+def _node_cost(node: Any) -> int:
+    """Static evaluation cost estimate: operator nodes plus var path segments."""
+    if isinstance(node, dict):
+        if "var" in node:
+            path, _ = _var_spec(node["var"])
+            return 1 + path.count(".")
+        return 1 + sum(_node_cost(v) for v in node.values())
+    if isinstance(node, list):
+        return sum(_node_cost(v) for v in node)
+    return 0
+
+
+class _Junction:
+    """A compiled ``and``/``or`` whose evaluation order can be tuned by profiling.
 
-    Supported operators: and, >=, >, <=, <.
+    Children are commutative, so the order only changes how soon evaluation
+    short-circuits (and which failure ``explain`` sees first), never the
+    outcome for inputs where every child evaluates cleanly.
     """
-    if not isinstance(rule, dict) or not rule:
-        raise RuleError("Rule must be non-empty object")
-    if "and" in rule:
-        return all(evaluate_rule(r, manifest) for r in rule["and"])
-    # Comparison ops have form {">=": [ {"var": "metrics.sharpe"}, 1.0 ]}
-    for op in (">=", ">", "<=", "<"):
-        if op in rule:
-            arr = rule[op]
-            if not (isinstance(arr, list) and len(arr) == 2):
-                raise RuleError(f"Operator {op} expects 2-element list")
-            left = _resolve_var(arr[0], manifest)
-            right = _resolve_var(arr[1], manifest)
-            if not isinstance(left, (int, float)) or not isinstance(right, (int, float)):
+
+    def __init__(self, op: str, fns: List[Callable[[Any], Any]], nodes: List[Any]):
+        self.op = op
+        self.fns = fns
+        self.costs = [_node_cost(n) for n in nodes]
+        self.order = list(range(len(fns)))
+
+    def __call__(self, data: Any) -> Any:
+        fns = self.fns
+        value: Any = self.op == "and"
+        if self.op == "and":
+            for i in self.order:
+                value = fns[i](data)
+                if not _truthy(value):
+                    return value
+        else:
+            for i in self.order:
+                value = fns[i](data)
+                if _truthy(value):
+                    return value
+        return value
+
+    def reorder(self, short_circuit_rates: Sequence[float]) -> None:
+        """Cheapest-per-expected-exit first: sort by cost / P(child short-circuits)."""
+        self.order = sorted(
+            range(len(self.fns)),
+            key=lambda i: (self.costs[i] / max(short_circuit_rates[i], 1e-9), i),
+        )
+
+
+def _operands(node: Dict[str, Any], op: str) -> List[Any]:
+    arr = node[op]
+    return arr if isinstance(arr, list) else [arr]
+
+
+def _compile_node(
+    node: Any,
+    var: Callable[..., Callable[[Any], Any]],
+    junctions: Optional[List[_Junction]] = None,
+) -> Callable[[Any], Any]:
+    if isinstance(node, list):
+        fns = [_compile_node(n, var, junctions) for n in node]
+        return lambda data: [f(data) for f in fns]
+    if not isinstance(node, dict):
+        return lambda data: node
+    if len(node) != 1:
+        raise RuleError(f"Unsupported rule segment: {node}")
+    op = next(iter(node))
+    if op == "var":
+        return var(*_var_spec(node["var"]))
+    args = _operands(node, op)
+    fns = [_compile_node(a, var, junctions) for a in args]
+
+    if op in ("and", "or"):
+        junction = _Junction(op, fns, args)
+        if junctions is not None:
+            junctions.append(junction)
+        return junction
+    if op in ("!", "!!"):
+        if len(fns) != 1:
+            raise RuleError(f"Operator {op} expects 1 argument")
+        arg = fns[0]
+        if op == "!":
+            return lambda data: not _truthy(arg(data))
+        return lambda data: _truthy(arg(data))
+    if op == "if":
+        if not fns:
+            raise RuleError("Operator if expects at least 1 argument")
+        pairs = [(fns[i], fns[i + 1]) for i in range(0, len(fns) - 1, 2)]
+        otherwise = fns[-1] if len(fns) % 2 else (lambda data: None)
+
+        def branch(data: Any) -> Any:
+            for cond, then in pairs:
+                if _truthy(cond(data)):
+                    return then(data)
+            return otherwise(data)
+
+        return branch
+    if op == "in":
+        if len(fns) != 2:
+            raise RuleError("Operator in expects 2-element list")
+        needle, haystack = fns
+
+        def contains(data: Any) -> bool:
+            h = haystack(data)
+            if not isinstance(h, (list, str)):
+                raise RuleError("Operator in expects a list or string as second operand")
+            try:
+                return needle(data) in h
+            except TypeError:
+                raise RuleError("Operator in: operand types do not match") from None
+
+        return contains
+    if op in _EQUALITY:
+        if len(fns) != 2:
+            raise RuleError(f"Operator {op} expects 2-element list")
+        left, right = fns
+        eq = _strict_equal if op in ("===", "!==") else operator.eq
+        if op.startswith("!"):
+            return lambda data: not eq(left(data), right(data))
+        return lambda data: eq(left(data), right(data))
+    if op in _COMPARATORS:
+        cmp = _COMPARATORS[op]
+        if not (len(fns) == 2 or (len(fns) == 3 and op in ("<", "<="))):
+            raise RuleError(f"Operator {op} expects 2-element list" + (" (or 3 for between)" if op in ("<", "<=") else ""))
+
+        def compare(data: Any) -> bool:
+            values = [f(data) for f in fns]
+            if not all(_is_number(v) for v in values):
                 raise RuleError("Comparison operands must be numbers")
-            if op == ">=":
-                return left >= right
-            if op == ">":
-                return left > right
-            if op == "<=":
-                return left <= right
-            if op == "<":
-                return left < right
-    raise RuleError(f"Unsupported rule segment: {rule}")
-
-
-def _resolve_var(node: Any, manifest: Dict[str, Any]) -> Any:
-    if isinstance(node, dict) and "var" in node:
-        path = node["var"].split(".")
-        cur: Any = manifest
-        for p in path:
-            if not isinstance(cur, dict) or p not in cur:
-                raise RuleError(f"Variable path not found: {node['var']}")
-            cur = cur[p]
-        return cur
+            return all(cmp(a, b) for a, b in zip(values, values[1:]))
+
+        return compare
+    raise RuleError(f"Unsupported rule segment: {node}")
+
+
+def _require_object(node: Any) -> Dict[str, Any]:
+    if not isinstance(node, dict) or not node:
+        raise RuleError("Rule must be non-empty object")
     return node
 
 
-def main() -> int:
+class CompiledRule:
+    """A promotion rule compiled once into closures with pre-split ``var`` paths.
+
+    The top-level ``and`` is kept as a clause list so ``explain`` can report
+    which clause failed first. ``optimize`` reorders every ``and``/``or``
+    (including the top level) by selectivity measured on sample inputs.
+    """
+
+    def __init__(self, rule: Dict[str, Any]):
+        self.rule = _require_object(rule)
+        self.clauses: List[Dict[str, Any]] = (
+            [_require_object(c) for c in _operands(rule, "and")] if set(rule) == {"and"} else [rule]
+        )
+        self.clause_order: List[int] = list(range(len(self.clauses)))
+        self._junction_orders: Optional[List[List[int]]] = None
+        self._fns, self._junctions = self._compile(_manifest_var)
+
+    def _compile(self, var: Callable[..., Callable[[Any], Any]]) -> Tuple[List[Callable[[Any], Any]], List[_Junction]]:
+        junctions: List[_Junction] = []
+        fns = [_compile_node(c, var, junctions) for c in self.clauses]
+        if self._junction_orders is not None:
+            for junction, order in zip(junctions, self._junction_orders):
+                junction.order = list(order)
+        return fns, junctions
+
+    def _run(self, fns: List[Callable[[Any], Any]], data: Any) -> RuleResult:
+        for i in self.clause_order:
+            if not _truthy(fns[i](data)):
+                return RuleResult(passed=False, failed_clause=i, clause=self.clauses[i])
+        return RuleResult(passed=True)
+
+    def unknown_variables(self, index: PathIndex) -> List[str]:
+        """``var`` paths this rule reads that the schema index does not declare."""
+        return unknown_variables(self.rule, index)
+
+    def evaluate(self, manifest: Dict[str, Any]) -> bool:
+        fns = self._fns
+        return all(_truthy(fns[i](manifest)) for i in self.clause_order)
+
+    def explain(self, manifest: Dict[str, Any]) -> RuleResult:
+        """Pass/fail plus the first failing clause; raises RuleError on bad input."""
+        return self._run(self._fns, manifest)
+
+    def optimize(self, samples: Iterable[Dict[str, Any]]) -> "CompiledRule":
+        """Reorder commutative ``and``/``or`` children so likely short-circuits run first.
+
+        Every child of every junction is evaluated on each sample (a child that
+        raises counts as short-circuiting its ``and``). Opt-in: after
+        reordering, ``explain`` reports the first failure in the new order.
+        """
+        samples = list(samples)
+        if not samples:
+            return self
+
+        def rates(fns: List[Callable[[Any], Any]], want: bool) -> List[float]:
+            hits = [0] * len(fns)
+            for data in samples:
+                for i, fn in enumerate(fns):
+                    try:
+                        hit = _truthy(fn(data)) == want
+                    except RuleError:
+                        hit = not want
+                    hits[i] += hit
+            return [h / len(samples) for h in hits]
+
+        top = _Junction("and", self._fns, self.clauses)
+        top.reorder(rates(self._fns, False))
+        self.clause_order = top.order
+        for junction in self._junctions:
+            junction.reorder(rates(junction.fns, junction.op == "or"))
+        self._junction_orders = [list(j.order) for j in self._junctions]
+        return self
+
+    def evaluate_batch(self, manifests: Iterable[Dict[str, Any]]) -> List[RuleResult]:
+        """Score many manifests; a RuleError fails that manifest instead of the batch."""
+        results = []
+        for m in manifests:
+            try:
+                results.append(self._run(self._fns, m))
+            except RuleError as e:
+                results.append(RuleResult(passed=False, error=str(e)))
+        return results
+
+    def evaluate_columns(self, columns: Mapping[str, Sequence[Any]]) -> List[RuleResult]:
+        """Score a columnar table whose columns are keyed by ``var`` path (one row per candidate)."""
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise RuleError("Metric columns must all have the same length")
+        fns, _ = self._compile(_column_var(columns))
+        results = []
+        for i in range(lengths.pop() if lengths else 0):
+            try:
+                results.append(self._run(fns, i))
+            except RuleError as e:
+                results.append(RuleResult(passed=False, error=str(e)))
+        return results
+
+    def evaluate_table(self, table: Any, column_map: Optional[Mapping[str, str]] = None) -> "TableResult":
+        """Vectorized scoring of a metrics table (see ``evaluate_table``)."""
+        _require_numpy()
+        resolve = _table_resolver(table, column_map or {})
+        n = _table_rows(table)
+        passed = np.ones(n, dtype=bool)
+        failed = np.full(n, -1, dtype=np.int64)
+        for i in self.clause_order:
+            mask = np.broadcast_to(_vector_bool(_vector_node(self.clauses[i], resolve)), (n,))
+            failed[(failed < 0) & ~mask] = i
+            passed &= mask
+        return TableResult(passed=passed, failed_clause=failed, clauses=self.clauses)
+
+
+def compile_rule(
+    rule: Dict[str, Any] | CompiledRule,
+    samples: Optional[Iterable[Dict[str, Any]]] = None,
+) -> CompiledRule:
+    """Compile ``rule``; with ``samples``, also reorder junctions by measured selectivity."""
+    compiled = rule if isinstance(rule, CompiledRule) else CompiledRule(rule)
+    return compiled.optimize(samples) if samples is not None else compiled
+
+
+@lru_cache(maxsize=64)
+def _compiled_from_json(rule_json: str) -> CompiledRule:
+    return CompiledRule(json.loads(rule_json))
+
+
+_BY_ID_MAX = 64
+_by_id: Dict[int, Tuple[Dict[str, Any], Dict[str, Any], CompiledRule]] = {}
+
+
+def _cached_compile(rule: Dict[str, Any]) -> CompiledRule:
+    """Compiled form of ``rule``, looked up by identity before falling back to its JSON text.
+
+    The identity entry keeps a reference to ``rule`` (so its id cannot be
+    reused) and a deep copy of it; a rule mutated in place no longer equals its
+    copy and is recompiled through the structural cache.
+    """
+    hit = _by_id.get(id(rule))
+    if hit is not None and hit[0] is rule and hit[1] == rule:
+        return hit[2]
+    compiled = _compiled_from_json(json.dumps(rule, sort_keys=True))
+    if len(_by_id) >= _BY_ID_MAX:
+        del _by_id[next(iter(_by_id))]
+    _by_id[id(rule)] = (rule, copy.deepcopy(rule), compiled)
+    return compiled
+
+
+def evaluate_rule(rule: Dict[str, Any] | CompiledRule, manifest: Dict[str, Any]) -> bool:
+    """Evaluate the JSON-Logic subset used by promotion rules.
+
+    Supported operators: var (with ``[path, default]``), and, or, !, !!, if,
+    in, ==, !=, ===, !==, >=, >, <=, < (``<``/``<=`` also take 3 operands as
+    a between test). Comparisons require numbers; a missing ``var`` without a
+    default raises RuleError. Rule dicts are compiled once and cached (by
+    identity, then by content); hot loops should call ``compile_rule`` and
+    pass the CompiledRule, which skips the lookup entirely.
+    """
+    if isinstance(rule, CompiledRule):
+        return _truthy(rule.evaluate(manifest))
+    if not isinstance(rule, dict) or not rule:
+        raise RuleError("Rule must be non-empty object")
+    return _truthy(_cached_compile(rule).evaluate(manifest))
+
+
+def evaluate_batch(rule: Dict[str, Any] | CompiledRule, manifests: Iterable[Dict[str, Any]]) -> List[RuleResult]:
+    return compile_rule(rule).evaluate_batch(manifests)
+
+
+def evaluate_columns(rule: Dict[str, Any] | CompiledRule, columns: Mapping[str, Sequence[Any]]) -> List[RuleResult]:
+    return compile_rule(rule).evaluate_columns(columns)
+
+
+@dataclass
+class TableResult:
+    passed: Any  # numpy bool array, one entry per row
+    failed_clause: Any  # numpy int64 array; -1 where the row passed
+    clauses: List[Dict[str, Any]]
+
+    def failures_by_clause(self) -> Dict[int, int]:
+        idx, counts = np.unique(self.failed_clause[self.failed_clause >= 0], return_counts=True)
+        return {int(i): int(c) for i, c in zip(idx, counts)}
+
+
+def _require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy  # type: ignore
+        except ImportError as e:  # pragma: no cover
+            raise RuleError("numpy is required for vectorized rule evaluation") from e
+        np = numpy
+
+
+def _table_rows(table: Any) -> int:
+    if hasattr(table, "num_rows"):  # pyarrow Table / RecordBatch
+        return table.num_rows
+    if getattr(getattr(table, "dtype", None), "names", None):  # numpy structured array
+        return len(table)
+    return len(next(iter(table.values()))) if table else 0
+
+
+def _table_names(table: Any) -> Sequence[str]:
+    if hasattr(table, "column_names"):
+        return table.column_names
+    if getattr(getattr(table, "dtype", None), "names", None):
+        return table.dtype.names
+    return list(table.keys())
+
+
+def _table_resolver(table: Any, column_map: Mapping[str, str]) -> Callable[..., Any]:
+    """Map a ``var`` path to a float64 column.
+
+    Lookup order: ``column_map[path]``, a column named exactly ``path``, then
+    the metric name for ``<section>.<metric>.value`` paths (so leaderboard
+    columns such as ``sharpe_sim`` or ``p95_ms`` work unmapped). A missing
+    column falls back to the var default when one is given.
+    """
+    names = set(_table_names(table))
+    cache: Dict[str, Any] = {}
+
+    def resolve(path: str, default: Any = _MISSING) -> Any:
+        if path in cache:
+            return cache[path]
+        parts = path.split(".")
+        candidates = [column_map.get(path), path]
+        if len(parts) == 3 and parts[2] == "value":
+            candidates.append(parts[1])
+        name = next((c for c in candidates if c and c in names), None)
+        if name is None:
+            if default is _MISSING:
+                raise RuleError(f"Variable path not found in table: {path}")
+            return default
+        col = table.column(name).to_numpy() if hasattr(table, "column_names") else table[name]
+        try:
+            cache[path] = np.asarray(col, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise RuleError(f"Column '{name}' for {path} is not numeric") from None
+        return cache[path]
+
+    return resolve
+
+
+def _vector_bool(value: Any) -> Any:
+    """Elementwise JSON-Logic truthiness (NaN and 0 are falsy)."""
+    arr = np.asarray(value)
+    if arr.dtype == bool:
+        return arr
+    if arr.dtype.kind in "fiu":
+        return (arr != 0) & ~np.isnan(arr) if arr.dtype.kind == "f" else arr != 0
+    raise RuleError("Vectorized evaluation supports numeric and boolean values only")
+
+
+def _vector_node(node: Any, resolve: Callable[..., Any]) -> Any:
+    """Evaluate a rule node over whole columns.
+
+    Logic operators work in boolean context (``and``/``or`` yield masks rather
+    than JSON-Logic's last-evaluated value) and ``in`` needs a literal numeric
+    list; anything else raises RuleError so callers can fall back to
+    ``evaluate_columns``.
+    """
+    if not isinstance(node, dict):
+        if node is None or not _is_number(node):
+            raise RuleError(f"Vectorized evaluation does not support literal {node!r}")
+        return node
+    if len(node) != 1:
+        raise RuleError(f"Unsupported rule segment: {node}")
+    op = next(iter(node))
+    if op == "var":
+        return resolve(*_var_spec(node["var"]))
+    args = _operands(node, op)
+    if op in ("and", "or"):
+        masks = [_vector_bool(_vector_node(a, resolve)) for a in args]
+        if not masks:
+            return op == "and"
+        return np.logical_and.reduce(masks) if op == "and" else np.logical_or.reduce(masks)
+    if op in ("!", "!!"):
+        if len(args) != 1:
+            raise RuleError(f"Operator {op} expects 1 argument")
+        mask = _vector_bool(_vector_node(args[0], resolve))
+        return ~mask if op == "!" else mask
+    if op == "if":
+        if not args:
+            raise RuleError("Operator if expects at least 1 argument")
+        conds = [_vector_bool(_vector_node(args[i], resolve)) for i in range(0, len(args) - 1, 2)]
+        values = [_vector_node(args[i + 1], resolve) for i in range(0, len(args) - 1, 2)]
+        if len(args) % 2 == 0:
+            raise RuleError("Vectorized if needs an else branch")
+        return np.select(conds, values, default=_vector_node(args[-1], resolve)) if conds else _vector_node(args[-1], resolve)
+    if op == "in":
+        if len(args) != 2 or not isinstance(args[1], list) or not all(_is_number(x) for x in args[1]):
+            raise RuleError("Vectorized in needs a literal list of numbers")
+        return np.isin(_vector_node(args[0], resolve), args[1])
+    if op in _EQUALITY:
+        if len(args) != 2:
+            raise RuleError(f"Operator {op} expects 2-element list")
+        left, right = (_vector_node(a, resolve) for a in args)
+        return np.equal(left, right) if op in ("==", "===") else np.not_equal(left, right)
+    if op in _COMPARATORS:
+        if not (len(args) == 2 or (len(args) == 3 and op in ("<", "<="))):
+            raise RuleError(f"Operator {op} expects 2-element list")
+        values = [_vector_node(a, resolve) for a in args]
+        cmp = _COMPARATORS[op]
+        return np.logical_and.reduce([np.asarray(cmp(a, b)) for a, b in zip(values, values[1:])])
+    raise RuleError(f"Unsupported rule segment: {node}")
+
+
+def evaluate_table(
+    rule: Dict[str, Any] | CompiledRule,
+    table: Any,
+    column_map: Optional[Mapping[str, str]] = None,
+) -> TableResult:
+    """Gate every row of a metrics table at once with NumPy boolean masks.
+
+    ``table`` is a pyarrow Table/RecordBatch, a numpy structured array or a
+    mapping of column name to array. Missing values (null/NaN) fail their
+    comparison rather than raising, so one incomplete sweep run does not
+    abort the leaderboard.
+    """
+    return compile_rule(rule).evaluate_table(table, column_map)
+
+
+def _read_table(path: Path) -> Any:
+    try:
+        import pyarrow.csv as pacsv  # type: ignore
+        import pyarrow.feather as feather  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as e:  # pragma: no cover
+        raise RuleError("reading a metrics table requires pyarrow") from e
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pacsv.read_csv(path)
+    if suffix in (".feather", ".ftr", ".arrow"):
+        return feather.read_table(path)
+    return pq.read_table(path)
+
+
+def main(argv: list[str] | None = None) -> int:
     import argparse
     ap = argparse.ArgumentParser(description="Evaluate promotion rule against manifest JSON")
-    ap.add_argument("manifest", type=Path, help="Path to manifest JSON to evaluate")
+    ap.add_argument("manifest", type=Path, nargs="*", help="Manifest JSON file(s) to evaluate")
+    ap.add_argument("--table", type=Path, help="Metrics table (.parquet/.feather/.csv) to gate row-wise, vectorized")
     ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if args.describe:
         desc = {
             "name": "promotion_rules",
-            "description": "Evaluate promotion rule JSON Logic against a manifest file.",
-            "inputs": {"manifest": "Path to manifest JSON file"},
-            "outputs": {"stdout": "PASS/FAIL line and JSON audit"},
-            "examples": ["python tools/promotion_rules.py fixtures/model_manifest_valid.json"]
+            "description": "Evaluate promotion rule JSON Logic against one or more manifest files.",
+            "inputs": {"manifest": "Path(s) to manifest JSON files; several are scored in one batch"},
+            "outputs": {"stdout": "PASS/FAIL line (per manifest with the first failing clause in batch mode) and JSON audit"},
+            "examples": [
+                "python tools/promotion_rules.py fixtures/model_manifest_valid.json",
+                "python tools/promotion_rules.py sweep/*/manifest.json",
+                "python tools/promotion_rules.py --table sweep_leaderboard.parquet",
+            ]
         }
         print(json.dumps(desc, indent=2))
         return 0
+    if not args.manifest and args.table is None:
+        ap.error("at least one manifest (or --table) is required")
 
-    manifest = load_json(args.manifest)
     rule = load_json(RULE_PATH)
     schema = load_json(MANIFEST_SCHEMA_PATH)
     audit = audit_rule_against_schema(rule, schema)
     if not audit["valid"]:
         print(json.dumps({"error": "missing metrics", **audit}, indent=2))
         return 2
-    try:
-        passed = evaluate_rule(rule, manifest)
-    except RuleError as e:
-        print(json.dumps({"error": str(e)}, indent=2))
+    if args.table is not None:
+        try:
+            result = evaluate_table(rule, _read_table(args.table))
+        except RuleError as e:
+            print(json.dumps({"error": str(e)}, indent=2))
+            return 3
+        print(json.dumps({
+            "rows": int(result.passed.size),
+            "passed": int(result.passed.sum()),
+            "failed_by_clause": {json.dumps(result.clauses[i]): n for i, n in result.failures_by_clause().items()},
+        }, indent=2))
+        return 0 if result.passed.all() else 1
+    if len(args.manifest) == 1:
+        try:
+            passed = evaluate_rule(rule, load_json(args.manifest[0]))
+        except RuleError as e:
+            print(json.dumps({"error": str(e)}, indent=2))
+            return 3
+        print("PASS" if passed else "FAIL")
+        return 0 if passed else 1
+
+    results = evaluate_batch(rule, (load_json(p) for p in args.manifest))
+    for path, r in zip(args.manifest, results):
+        if r.error:
+            print(f"ERROR {path}: {r.error}")
+        elif r.passed:
+            print(f"PASS {path}")
+        else:
+            print(f"FAIL {path} clause {r.failed_clause}: {json.dumps(r.clause)}")
+    if any(r.error for r in results):
         return 3
-    print("PASS" if passed else "FAIL")
-    return 0 if passed else 1
+    return 0 if all(r.passed for r in results) else 1
 
 
 if __name__ == "__main__":  # pragma: no cover
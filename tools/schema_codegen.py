@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Compile flat draft-07 record schemas into specialised Python validators.
+
+bars_download_manifest.schema.json describes a flat record (required keys,
+string patterns, an enum, integer minimums, an array of strings). Walking
+that schema generically for every JSONL line is the dominant validation cost,
+so this module generates straight-line Python for it: direct key lookups,
+``isinstance`` checks and module-level precompiled regexes.
+
+Only a conservative keyword subset is compiled. Anything else raises
+UnsupportedSchema and callers fall back to jsonschema. Type semantics follow
+jsonschema's draft-07 type checker (bool is not a number, 1.0 is an integer).
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from validation_lib import ValidationError, compute_structural_hash, json_loads, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+DEFAULT_SCHEMA = BASE / "schemas" / "bars_download_manifest.schema.json"
+DEFAULT_SAMPLE = BASE / "contracts" / "fixtures" / "bars_download_manifest.sample.jsonl"
+
+_ANNOTATIONS = {"title", "description", "$comment", "examples", "default", "format"}
+_ROOT_KEYS = _ANNOTATIONS | {"$schema", "$id", "$defs", "definitions", "type", "required", "properties", "additionalProperties"}
+_VALUE_KEYS = _ANNOTATIONS | {
+    "type", "const", "enum", "minLength", "maxLength", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "minItems", "maxItems", "items",
+}
+_TYPE_TESTS = {
+    "string": "isinstance({v}, str)",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "array": "isinstance({v}, list)",
+    "object": "isinstance({v}, dict)",
+    "null": "{v} is None",
+}
+_NUMBER = "(isinstance({v}, (int, float)) and not isinstance({v}, bool))"
+
+
+class UnsupportedSchema(Exception):
+    pass
+
+
+class FastValidator:
+    """Validator-compatible wrapper around a generated ``check`` function."""
+
+    def __init__(self, check: Callable[[Any], Optional[str]], source: str):
+        self.check = check
+        self.source = source
+
+    def validate(self, instance: Any) -> None:
+        msg = self.check(instance)
+        if msg is not None:
+            raise ValidationError(msg)
+
+    def is_valid(self, instance: Any) -> bool:
+        return self.check(instance) is None
+
+
+class _Emitter:
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.lines: List[str] = []
+        self.consts: Dict[str, Any] = {}
+        self._tmp = 0
+
+    def const(self, value: Any) -> str:
+        name = f"_C{len(self.consts)}"
+        self.consts[name] = value
+        return name
+
+    def tmp(self) -> str:
+        self._tmp += 1
+        return f"_v{self._tmp}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def resolve(self, node: Any) -> Dict[str, Any]:
+        if not isinstance(node, dict):
+            raise UnsupportedSchema(f"non-object subschema: {node!r}")
+        if "$ref" in node:
+            # draft-07: keywords beside $ref are ignored.
+            ref = node["$ref"]
+            m = re.fullmatch(r"#/(\$defs|definitions)/([^/~]+)", ref) if isinstance(ref, str) else None
+            if not m or m.group(2) not in (self.schema.get(m.group(1)) or {}):
+                raise UnsupportedSchema(f"unsupported $ref: {ref!r}")
+            target = self.schema[m.group(1)][m.group(2)]
+            if isinstance(target, dict) and "$ref" in target:
+                raise UnsupportedSchema(f"chained $ref: {ref!r}")
+            return target
+        return node
+
+    def value_checks(self, node: Any, var: str, where: str, indent: int) -> None:
+        node = self.resolve(node)
+        unknown = set(node) - _VALUE_KEYS
+        if unknown:
+            raise UnsupportedSchema(f"{where}: unsupported keywords {sorted(unknown)}")
+        fail = lambda msg: self.emit(indent + 1, f"return {where!r} + ': ' + {msg}")  # noqa: E731
+
+        typ = node.get("type")
+        if typ is not None:
+            if not isinstance(typ, str) or typ not in _TYPE_TESTS:
+                raise UnsupportedSchema(f"{where}: unsupported type {typ!r}")
+            self.emit(indent, f"if not {_TYPE_TESTS[typ].format(v=var)}:")
+            fail(f"repr({var}) + {' is not of type ' + repr(typ)!r}")
+        if "const" in node:
+            if not isinstance(node["const"], str):
+                raise UnsupportedSchema(f"{where}: only string const is compiled")
+            c = self.const(node["const"])
+            self.emit(indent, f"if not (isinstance({var}, str) and {var} == {c}):")
+            fail(f"repr({c}) + ' was expected'")
+        if "enum" in node:
+            values = node["enum"]
+            if not (isinstance(values, list) and all(isinstance(x, str) for x in values)):
+                raise UnsupportedSchema(f"{where}: only string enums are compiled")
+            c = self.const(frozenset(values))
+            shown = self.const(repr(values))
+            self.emit(indent, f"if not (isinstance({var}, str) and {var} in {c}):")
+            fail(f"repr({var}) + ' is not one of ' + {shown}")
+        for key, op in (("minLength", "<"), ("maxLength", ">")):
+            if key in node:
+                n = int(node[key])
+                self.emit(indent, f"if isinstance({var}, str) and len({var}) {op} {n}:")
+                fail(f"repr({var}) + {' violates ' + key + ' ' + str(n)!r}")
+        if "pattern" in node:
+            c = self.const(re.compile(node["pattern"]))
+            self.emit(indent, f"if isinstance({var}, str) and not {c}.search({var}):")
+            fail(f"repr({var}) + ' does not match ' + repr({c}.pattern)")
+        for key, op in (("minimum", "<"), ("maximum", ">"), ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if key in node:
+                bound = node[key]
+                if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+                    raise UnsupportedSchema(f"{where}: non-numeric {key}")
+                self.emit(indent, f"if {_NUMBER.format(v=var)} and {var} {op} {bound!r}:")
+                fail(f"repr({var}) + {' violates ' + key + ' ' + repr(bound)!r}")
+        for key, op in (("minItems", "<"), ("maxItems", ">")):
+            if key in node:
+                n = int(node[key])
+                self.emit(indent, f"if isinstance({var}, list) and len({var}) {op} {n}:")
+                fail(f"'array' + {' violates ' + key + ' ' + str(n)!r}")
+        if "items" in node:
+            if not isinstance(node["items"], dict):
+                raise UnsupportedSchema(f"{where}: tuple-form items")
+            item = self.tmp()
+            self.emit(indent, f"if isinstance({var}, list):")
+            self.emit(indent + 1, f"for {item} in {var}:")
+            before = len(self.lines)
+            self.value_checks(node["items"], item, f"{where}[]", indent + 2)
+            if len(self.lines) == before:
+                self.emit(indent + 2, "pass")
+
+    def root(self) -> None:
+        schema = self.schema
+        unknown = set(schema) - _ROOT_KEYS
+        if unknown:
+            raise UnsupportedSchema(f"unsupported root keywords {sorted(unknown)}")
+        if schema.get("type") != "object":
+            raise UnsupportedSchema("root must be type=object")
+        if schema.get("additionalProperties", True) is not True:
+            raise UnsupportedSchema("additionalProperties must be true")
+        self.emit(0, "def check(obj):")
+        self.emit(1, "if not isinstance(obj, dict):")
+        self.emit(2, "return repr(obj) + \" is not of type 'object'\"")
+        for key in schema.get("required", []) or []:
+            self.emit(1, f"if {key!r} not in obj:")
+            self.emit(2, f"return {repr(key) + ' is a required property'!r}")
+        for key, sub in (schema.get("properties") or {}).items():
+            var = self.tmp()
+            self.emit(1, f"{var} = obj.get({key!r}, _MISSING)")
+            self.emit(1, f"if {var} is not _MISSING:")
+            before = len(self.lines)
+            self.value_checks(sub, var, key, 2)
+            if len(self.lines) == before:
+                self.emit(2, "pass")
+        self.emit(1, "return None")
+
+
+def _emit(schema: Dict[str, Any]) -> _Emitter:
+    em = _Emitter(schema)
+    em.root()
+    return em
+
+
+def generate_source(schema: Dict[str, Any]) -> str:
+    """Return Python source defining ``check(obj) -> Optional[str]`` for ``schema``."""
+    return "\n".join(_emit(schema).lines) + "\n"
+
+
+def compile_schema(schema: Dict[str, Any]) -> FastValidator:
+    """Compile ``schema`` into a FastValidator or raise UnsupportedSchema."""
+    em = _emit(schema)
+    source = "\n".join(em.lines) + "\n"
+    namespace: Dict[str, Any] = {"_MISSING": object(), **em.consts}
+    exec(compile(source, "<schema_codegen>", "exec"), namespace)
+    return FastValidator(namespace["check"], source)
+
+
+_LOCK = threading.Lock()
+_COMPILED: Dict[str, Optional[FastValidator]] = {}
+
+
+def get_fast_validator(schema: Dict[str, Any]) -> Optional[FastValidator]:
+    """Return a cached FastValidator for ``schema``, or None if it cannot be compiled."""
+    key = compute_structural_hash(schema)
+    with _LOCK:
+        if key in _COMPILED:
+            return _COMPILED[key]
+    try:
+        compiled: Optional[FastValidator] = compile_schema(schema)
+    except UnsupportedSchema:
+        compiled = None
+    with _LOCK:
+        return _COMPILED.setdefault(key, compiled)
+
+
+def record_mutations(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield edge-case variants of a valid record for cross-checking against jsonschema."""
+    probes = [None, True, 0, -1, 1.0, 1.5, "", "x", "1 min", "2025-09-15T09:30:00Z", "2025-09-15", [], [""], ["a"], [1], {}]
+    for key in list(record):
+        dropped = dict(record)
+        del dropped[key]
+        yield dropped
+        for probe in probes:
+            yield {**record, key: probe}
+    yield {**record, "extra_field": "allowed"}
+
+
+def check_against_jsonschema(schema: Dict[str, Any], records: List[Dict[str, Any]]) -> List[str]:
+    """Return disagreements between the compiled validator and jsonschema."""
+    from validator_registry import get_validator
+
+    fast = compile_schema(schema)
+    reference = get_validator(schema)
+    mismatches: List[str] = []
+    for rec in records:
+        for candidate in [rec, *record_mutations(rec)]:
+            if fast.is_valid(candidate) != reference.is_valid(candidate):
+                mismatches.append(json.dumps(candidate, sort_keys=True))
+    return mismatches
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "schema_codegen",
+        "description": "Compile flat draft-07 record schemas into specialised Python validators and cross-check them against jsonschema.",
+        "inputs": {"schema": "Schema path (defaults to schemas/bars_download_manifest.schema.json)", "flags": ["--describe", "--emit", "--check <jsonl>"]},
+        "outputs": {"stdout": "Generated source (--emit) or cross-check result"},
+        "examples": [
+            "python tools/schema_codegen.py --emit",
+            "python tools/schema_codegen.py --check contracts/fixtures/bars_download_manifest.sample.jsonl",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate and cross-check fast-path schema validators")
+    ap.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA)
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    ap.add_argument("--emit", action="store_true", help="Print the generated validator source")
+    ap.add_argument("--check", type=Path, nargs="?", const=DEFAULT_SAMPLE, help="Cross-check against jsonschema on a JSONL sample")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+
+    schema = load_json(args.schema)
+    try:
+        source = generate_source(schema)
+    except UnsupportedSchema as e:
+        print(f"UNSUPPORTED: {e}", file=sys.stderr)
+        return 2
+    if args.emit:
+        print(source, end="")
+    if args.check:
+        records = [json_loads(line) for line in args.check.read_bytes().splitlines() if line.strip()]
+        mismatches = check_against_jsonschema(schema, records)
+        for m in mismatches:
+            print(f"MISMATCH {m}")
+        if mismatches:
+            return 1
+        print(f"Cross-check: PASS (records={len(records)})")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
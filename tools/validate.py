@@ -1,10 +1,27 @@
+import hashlib
 import json
+import os
 import pathlib
 import sys
-from jsonschema import Draft202012Validator, Draft7Validator
+
+from jsonl_checkpoint import (
+    Checkpoint,
+    default_checkpoint_path,
+    hash_range,
+    last_line_end,
+    load_checkpoint,
+    save_checkpoint,
+    verify_prefix,
+)
+from jsonl_io import is_compressed, iter_range, open_jsonl, shard_ranges
+from schema_codegen import get_fast_validator
+from validation_lib import compute_structural_hash, json_loads, load_json
+from validator_registry import get_validator
+
+DEFAULT_PROGRESS_EVERY = 100_000
 
 def _load(p):
-    return json.loads(pathlib.Path(p).read_text())
+    return load_json(pathlib.Path(p))
 
 def _load_text(p: pathlib.Path) -> str:
     return pathlib.Path(p).read_text()
@@ -37,22 +54,8 @@ def _resolve_manifest_schema_path(manifest: dict, schema_path: pathlib.Path) ->
     return schema_path
 
 
-def _choose_validator(schema: dict):
-    """Pick a jsonschema Validator based on $schema meta.
-    Defaults to Draft202012Validator; supports draft-07 for bars schemas.
-    """
-    meta = (schema.get("$schema") or "").lower()
-    if "draft-07" in meta:
-        Draft7Validator.check_schema(schema)
-        return Draft7Validator
-    # Fallback to 2020-12
-    Draft202012Validator.check_schema(schema)
-    return Draft202012Validator
-
-
 def _validate_instance(instance: dict, schema: dict):
-    Validator = _choose_validator(schema)
-    Validator(schema=schema).validate(instance)
+    get_validator(schema).validate(instance)
     return True
 
 
@@ -69,106 +72,483 @@ def validate_manifest(manifest_path, schema_path):
     return True
 
 
-def validate_jsonl_per_line(jsonl_path: str, schema_path: str):
-    """Validate a JSON Lines file where each line is a JSON object matching schema.
-    Returns (ok: bool, count: int). Prints first error details to stdout on failure.
-    """
-    s = _load(schema_path)
-    Validator = _choose_validator(s)
+def _validate_lines(lines, validator, collect_all=False, progress_every=0):
+    """Validate an iterable of raw JSONL lines.
 
+    Returns (count, errors, lines_seen) where errors is a list of
+    (line_number, message) tuples numbered from 1 within ``lines``.
+    Stops at the first error unless ``collect_all`` is set.
+    """
     count = 0
-    for i, raw in enumerate(pathlib.Path(jsonl_path).read_text().splitlines(), start=1):
+    nbytes = 0
+    errors = []
+    i = 0
+    for i, raw in enumerate(lines, start=1):
+        nbytes += len(raw)
         line = raw.strip()
         if not line:
             continue
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError as e:
-            print(f"ERROR: line {i} is not valid JSON: {e}")
-            return False, count
+            obj = json_loads(line)
+        except ValueError as e:
+            errors.append((i, f"is not valid JSON: {e}"))
+            if not collect_all:
+                break
+            continue
         try:
-            Validator(schema=s).validate(obj)
+            validator.validate(obj)
         except Exception as e:
-            print(f"ERROR: line {i} failed schema validation: {e}")
-            return False, count
+            errors.append((i, f"failed schema validation: {e}"))
+            if not collect_all:
+                break
+            continue
         count += 1
-    return True, count
+        if progress_every and count % progress_every == 0:
+            print(f"PROGRESS records={count} bytes={nbytes}", file=sys.stderr)
+    return count, errors, i
+
+
+def _jsonl_validator(schema_path, fast=False, announce=False):
+    """Return the compiled fast-path validator when requested and possible, else jsonschema's."""
+    schema = _load(schema_path)
+    if fast:
+        compiled = get_fast_validator(schema)
+        if compiled is not None:
+            return compiled
+        if announce:
+            print("NOTE: schema not supported by the fast path; using jsonschema", file=sys.stderr)
+    return get_validator(schema)
+
+
+def _print_errors(errors, line_offset=0):
+    for lineno, msg in errors:
+        print(f"ERROR: line {lineno + line_offset} {msg}")
+
+
+def validate_jsonl_per_line(
+    jsonl_path: str, schema_path: str, progress_every: int = 0, collect_all: bool = False, fast: bool = False
+):
+    """Validate a JSON Lines file where each line is a JSON object matching schema.
+    Returns (ok: bool, count: int). Prints first error details to stdout on failure
+    (every error when ``collect_all`` is set; count is then the number of valid records).
+
+    The file is streamed through a bounded read buffer (``.jsonl.gz`` and
+    ``.jsonl.zst`` are decompressed on the fly), so memory stays flat regardless
+    of file size. When ``progress_every`` > 0 a PROGRESS line is written to
+    stderr after every ``progress_every`` valid records. ``fast`` selects the
+    generated validator from schema_codegen, falling back to jsonschema for
+    schemas it cannot compile.
+    """
+    validator = _jsonl_validator(schema_path, fast, announce=True)
+    with open_jsonl(jsonl_path) as fh:
+        count, errors, _ = _validate_lines(fh, validator, collect_all, progress_every)
+    _print_errors(errors)
+    return not errors, count
+
+
+def _validate_jsonl_shard(jsonl_path: str, schema_path: str, start: int, end: int, collect_all: bool, fast: bool = False):
+    """Process-pool worker: validate the lines in byte range [start, end)."""
+    validator = _jsonl_validator(schema_path, fast)
+    return _validate_lines(iter_range(jsonl_path, start, end), validator, collect_all)
+
+
+def _validate_jsonl_range(
+    jsonl_path: str, schema_path: str, start: int, end: int, jobs: int, collect_all: bool, fast: bool = False
+):
+    """Validate byte range [start, end) of an uncompressed JSONL file.
+
+    The range is split into up to ``jobs`` newline-aligned shards validated in a
+    process pool. Returns (count, errors, lines) with error line numbers relative
+    to ``start``; ``lines`` is the number of lines consumed.
+    """
+    ranges = shard_ranges(jsonl_path, jobs, start, end)
+    if len(ranges) <= 1:
+        return _validate_jsonl_shard(jsonl_path, schema_path, start, end, collect_all, fast)
+
+    count = 0
+    line_offset = 0
+    all_errors = []
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [
+            pool.submit(_validate_jsonl_shard, jsonl_path, schema_path, lo, hi, collect_all, fast)
+            for lo, hi in ranges
+        ]
+        for fut in futures:
+            shard_count, errors, shard_lines = fut.result()
+            count += shard_count
+            all_errors.extend((lineno + line_offset, msg) for lineno, msg in errors)
+            if errors and not collect_all:
+                for pending in futures:
+                    pending.cancel()
+                break
+            line_offset += shard_lines
+    return count, all_errors, line_offset
+
+
+def validate_jsonl_sharded(
+    jsonl_path: str, schema_path: str, jobs: int = 0, collect_all: bool = False, fast: bool = False
+):
+    """Validate a JSONL file in parallel byte-range shards across a process pool.
+
+    Same (ok, count) contract and error output as validate_jsonl_per_line;
+    reported line numbers are global. ``jobs`` <= 0 uses every CPU.
+    Compressed inputs cannot be split by offset and are validated serially.
+    """
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    if jobs == 1 or is_compressed(jsonl_path):
+        return validate_jsonl_per_line(jsonl_path, schema_path, collect_all=collect_all, fast=fast)
+    if fast:
+        _jsonl_validator(schema_path, fast, announce=True)
+    size = pathlib.Path(jsonl_path).stat().st_size
+    count, errors, _ = _validate_jsonl_range(jsonl_path, schema_path, 0, size, jobs, collect_all, fast)
+    _print_errors(errors)
+    return not errors, count
+
+
+def validate_jsonl_incremental(
+    jsonl_path: str,
+    schema_path: str,
+    checkpoint_path: str | None = None,
+    jobs: int = 1,
+    collect_all: bool = False,
+    fast: bool = False,
+):
+    """Validate only the tail appended since the last checkpointed run.
+
+    The checkpoint sidecar (default ``<jsonl>.checkpoint.json``) stores the
+    validated byte offset, line/record counts and a sha256 of the validated
+    prefix. If the prefix hash or schema changed, the whole file is validated
+    again. Returns (ok, count) where count includes previously validated
+    records. The checkpoint only advances on success and only up to the last
+    complete (newline-terminated) line, so a partially written record is
+    re-checked next time.
+    """
+    if is_compressed(jsonl_path):
+        print("NOTE: checkpoints need an uncompressed file; validating in full", file=sys.stderr)
+        return validate_jsonl_per_line(jsonl_path, schema_path, collect_all=collect_all, fast=fast)
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    checkpoint_path = pathlib.Path(checkpoint_path) if checkpoint_path else default_checkpoint_path(jsonl_path)
+    schema_hash = compute_structural_hash(_load(schema_path))
+
+    previous = load_checkpoint(checkpoint_path)
+    hasher = verify_prefix(jsonl_path, previous, schema_hash) if previous else None
+    if hasher is not None:
+        base = previous
+        print(f"NOTE: resuming after line {base.lines} (offset {base.offset})", file=sys.stderr)
+    else:
+        if previous is not None:
+            print("NOTE: checkpoint does not match file prefix or schema; validating in full", file=sys.stderr)
+        base = Checkpoint(offset=0, lines=0, records=0, prefix_sha256="", schema_hash=schema_hash)
+        hasher = hashlib.sha256()
+
+    end = pathlib.Path(jsonl_path).stat().st_size
+    if fast:
+        _jsonl_validator(schema_path, fast, announce=True)
+    count, errors, lines = _validate_jsonl_range(jsonl_path, schema_path, base.offset, end, jobs, collect_all, fast)
+    _print_errors(errors, line_offset=base.lines)
+    if errors:
+        return False, base.records + count
+
+    # Exclude a trailing line without newline (possibly still being written).
+    checkpoint_lines, checkpoint_records = lines, count
+    new_offset = last_line_end(jsonl_path, base.offset, end)
+    if new_offset < end:
+        checkpoint_lines -= 1
+        with open(jsonl_path, "rb") as fh:
+            fh.seek(new_offset)
+            if fh.read().strip():
+                checkpoint_records -= 1
+    hash_range(jsonl_path, base.offset, new_offset, hasher)
+    save_checkpoint(
+        checkpoint_path,
+        Checkpoint(
+            offset=new_offset,
+            lines=base.lines + checkpoint_lines,
+            records=base.records + checkpoint_records,
+            prefix_sha256=hasher.hexdigest(),
+            schema_hash=schema_hash,
+        ),
+    )
+    return True, base.records + count
 
 def load_policy(policy_path):
     """Load data collection policy JSON."""
     return _load(policy_path)
 
+# (manifest data_collection field, path into the policy, warning label)
+POLICY_FIELDS = (
+    ("policy_version", ("policy_version",), "policy_version"),
+    ("session_timezone", ("session_timezone",), "session_timezone"),
+    ("l2_window", ("l2_window_default",), "l2_window vs policy l2_window_default"),
+    ("bar_lookbacks", ("recommended_bar_lookbacks",), "bar_lookbacks vs policy recommended_bar_lookbacks"),
+    ("symbol_policy_version", ("symbol_policy", "version"), "symbol_policy_version"),
+)
+NO_DATA_COLLECTION = "data_collection"  # field key for manifests without the block
+
+
+class PolicyExpectations(tuple):
+    """Normalized policy: ((field, label, expected value), ...) for the fields the policy sets."""
+
+
+def normalize_policy(policy):
+    """Reduce a data_collection_policy document (dict or path) to the values manifests are compared against.
+
+    Batch callers normalize once and pass the result to compare_data_collection.
+    """
+    if isinstance(policy, PolicyExpectations):
+        return policy
+    if not isinstance(policy, dict):
+        policy = _load(policy)
+    expected = []
+    for field, path, label in POLICY_FIELDS:
+        value = policy
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            expected.append((field, label, value))
+    return PolicyExpectations(expected)
+
+
+def policy_differences(manifest: dict, policy):
+    """Return [(field, warning)] for ``manifest`` against a policy dict/path or PolicyExpectations.
+
+    Raises ValueError when ``export_manifest`` or its ``data_collection`` is present but not an object.
+    """
+    dc = manifest
+    for key in ("export_manifest", "data_collection"):
+        dc = dc.get(key, {})
+        if not isinstance(dc, dict):
+            raise ValueError(f"{key} is not a JSON object")
+    if not dc:
+        return [(NO_DATA_COLLECTION, "manifest has no export_manifest.data_collection block; cannot compare to policy")]
+    out = []
+    for field, label, policy_val in normalize_policy(policy):
+        manifest_val = dc.get(field)
+        if manifest_val is not None and manifest_val != policy_val:
+            out.append((field, f"data_collection.{label} differs from policy (manifest={manifest_val} policy={policy_val})"))
+    return out
+
+
 def compare_manifest_to_policy(manifest_path, policy_path):
     """
     Compare export_manifest.data_collection fields in manifest to canonical policy.
     Returns a list of human-readable warnings for any differences. Does not fail.
+    ``manifest_path`` and ``policy_path`` may also be already-parsed dicts;
+    ``policy_path`` may also be a PolicyExpectations from normalize_policy.
     """
-    m = _load(manifest_path)
-    policy = _load(policy_path)
-    dc = (
-        m.get("export_manifest", {})
-         .get("data_collection", {})
-    )
-    warnings = []
-    if not dc:
-        warnings.append("manifest has no export_manifest.data_collection block; cannot compare to policy")
-        return warnings
-
-    # Field mappings: manifest -> policy
-    checks = [
-        (dc.get("policy_version"), policy.get("policy_version"), "policy_version"),
-        (dc.get("session_timezone"), policy.get("session_timezone"), "session_timezone"),
-        (dc.get("l2_window"), policy.get("l2_window_default"), "l2_window vs policy l2_window_default"),
-        (dc.get("bar_lookbacks"), policy.get("recommended_bar_lookbacks"), "bar_lookbacks vs policy recommended_bar_lookbacks"),
-        (dc.get("symbol_policy_version"), policy.get("symbol_policy", {}).get("version"), "symbol_policy_version"),
-    ]
-    for manifest_val, policy_val, name in checks:
-        if manifest_val is None or policy_val is None:
-            continue
-        if manifest_val != policy_val:
-            warnings.append(f"data_collection.{name} differs from policy (manifest={manifest_val} policy={policy_val})")
+    manifest = manifest_path if isinstance(manifest_path, dict) else _load(manifest_path)
+    return compare_data_collection(manifest, policy_path)
 
-    return warnings
 
-def main(argv=None):
-    argv = list(argv or sys.argv[1:])
-    if not argv or argv[0] in {"-h", "--help"}:
+def compare_data_collection(manifest: dict, policy):
+    """Pure core of compare_manifest_to_policy over an already-parsed manifest."""
+    return [w for _, w in policy_differences(manifest, policy)]
+
+
+def expand_manifest_paths(target):
+    """Manifest files for policy-batch: every *.json under a directory, or a glob's matches."""
+    import glob
+
+    target = str(target)
+    if os.path.isdir(target):
+        return sorted(pathlib.Path(target).rglob("*.json"))
+    return sorted(pathlib.Path(p) for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+
+
+def compare_policy_batch(manifests, policy, jobs=0):
+    """Compare many manifests (paths or dicts) against one policy, concurrently.
+
+    The policy is loaded and normalized once. Returns an aggregated report:
+    per-manifest warnings (or load error), and per-field warning counts.
+    Unreadable or malformed manifests are reported under ``errors`` and do not stop the batch.
+    """
+    expected = normalize_policy(policy)
+    items = list(manifests)
+
+    def one(item):
+        name = "<dict>" if isinstance(item, dict) else str(item)
+        try:
+            manifest = item if isinstance(item, dict) else _load(item)
+            if not isinstance(manifest, dict):
+                raise ValueError("manifest is not a JSON object")
+            diffs = policy_differences(manifest, expected)
+        except (OSError, ValueError) as e:
+            return {"manifest": name, "error": str(e), "warnings": [], "fields": []}
+        return {"manifest": name, "error": None, "warnings": [w for _, w in diffs], "fields": [f for f, _ in diffs]}
+
+    jobs = jobs if jobs > 0 else min(32, (os.cpu_count() or 1) + 4)
+    if jobs == 1 or len(items) <= 1:
+        results = [one(item) for item in items]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(one, items))
+
+    field_counts = {}
+    for r in results:
+        for field in r.pop("fields"):
+            field_counts[field] = field_counts.get(field, 0) + 1
+    return {
+        "manifests": len(results),
+        "with_warnings": sum(1 for r in results if r["warnings"]),
+        "errors": sum(1 for r in results if r["error"]),
+        "field_counts": dict(sorted(field_counts.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "results": results,
+    }
+
+
+def _run_policy_batch(opts):
+    paths = expand_manifest_paths(opts["target"])
+    if not paths:
+        print(f"ERROR: no manifests match {opts['target']}", file=sys.stderr)
+        return 2
+    report = compare_policy_batch(paths, opts["policy_path"], jobs=opts["jobs"] or 0)
+    if opts["json"]:
+        print(json.dumps(report, indent=2))
+    else:
+        for r in report["results"]:
+            if r["error"]:
+                print(f"ERROR: {r['manifest']}: {r['error']}")
+            for w in r["warnings"]:
+                print(f"WARNING: {r['manifest']}: {w}")
+        for field, n in report["field_counts"].items():
+            print(f"FIELD: {field} {n}")
         print(
-            "Usage:\n"
-            "  Export manifest: validate.py [--manifest <manifest.json>] [--policy <policy.json>] [schema=schemas/manifest.schema.json]\n"
-            "  Bars JSONL:      validate.py bars-jsonl <bars_download_manifest.jsonl> [schema=schemas/bars_download_manifest.schema.json]\n"
-            "  Bars coverage:   validate.py bars-coverage <bars_coverage_manifest.json> [schema=schemas/bars_coverage_manifest.schema.json]",
-            file=sys.stderr,
+            f"Policy batch: {report['manifests']} manifests, {report['with_warnings']} with warnings, "
+            f"{report['errors']} unreadable"
         )
-        return 2
-    # Subcommands for bars schemas
+    return 1 if report["errors"] else 0
+
+def describe() -> dict:
+    return {
+        "name": "validate",
+        "description": "Validate an export manifest (optionally against the data-collection policy), a bars download JSONL, or a bars coverage manifest.",
+        "inputs": {
+            "manifest": "--manifest <manifest.json> [--policy <policy.json>] [schema=...]",
+            "bars-jsonl": "bars_download_manifest.jsonl[.gz|.zst] [--progress[=N]] [--jobs N] [--all-errors] [--checkpoint[=<path>]] [--fast]",
+            "bars-coverage": "bars_coverage_manifest.json [schema=...]",
+            "policy-batch": "<dir|glob> --policy <policy.json> [--jobs N] [--json]",
+        },
+        "outputs": {"stdout": "OK/ERROR lines; exit 0 when valid, 1 on validation errors, 2 on usage errors"},
+        "examples": [
+            "python tools/validate.py --manifest manifest.json --policy data_collection_policy.json",
+            "python tools/validate.py bars-jsonl bars_download_manifest.jsonl --jobs 8",
+            "python tools/validate.py policy-batch 'registry/**/export_manifest.json' --policy data_collection_policy.json --json",
+        ],
+    }
+
+
+USAGE = (
+    "Usage:\n"
+    "  Export manifest: validate.py [--manifest <manifest.json>] [--policy <policy.json>] [schema=schemas/manifest.schema.json]\n"
+    "  Bars JSONL:      validate.py bars-jsonl <bars_download_manifest.jsonl[.gz|.zst]> [schema=schemas/bars_download_manifest.schema.json] [--progress[=N]] [--jobs N] [--all-errors] [--checkpoint[=<path>]] [--fast]\n"
+    "  Bars coverage:   validate.py bars-coverage <bars_coverage_manifest.json> [schema=schemas/bars_coverage_manifest.schema.json]\n"
+    "  Policy batch:    validate.py policy-batch <dir|glob> --policy <policy.json> [--jobs N] [--json]"
+)
+
+
+class UsageError(ValueError):
+    """Bad command line; main() reports it and exits 2."""
+
+
+def _int_arg(value, flag, minimum):
+    """Parse an integer option value, raising UsageError (exit 2) instead of ValueError."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise UsageError(f"{flag} requires an integer") from None
+    if n < minimum:
+        raise UsageError(f"{flag} must be >= {minimum}")
+    return n
+
+
+def parse_args(argv):
+    """Parse validate.py's command line into a dict with a ``mode`` key.
+
+    Shared with validate_client.py so both accept exactly the same arguments.
+    Raises UsageError on malformed input.
+    """
     if argv[0] == "bars-jsonl":
         if len(argv) < 2:
-            print("ERROR: missing JSONL path", file=sys.stderr)
-            return 2
-        jsonl_path = pathlib.Path(argv[1])
-        schema_path = pathlib.Path("schemas/bars_download_manifest.schema.json")
-        for arg in argv[2:]:
+            raise UsageError("missing JSONL path")
+        opts = {
+            "mode": "bars-jsonl",
+            "jsonl_path": pathlib.Path(argv[1]),
+            "schema_path": pathlib.Path("schemas/bars_download_manifest.schema.json"),
+            "progress_every": 0,
+            "jobs": None,
+            "collect_all": False,
+            "checkpoint": None,
+            "fast": False,
+        }
+        i = 2
+        while i < len(argv):
+            arg = argv[i]
             if arg.startswith("schema="):
-                schema_path = pathlib.Path(arg.split("=", 1)[1])
-        ok, n = validate_jsonl_per_line(str(jsonl_path), str(schema_path))
-        if not ok:
-            return 1
-        print(f"Schema validation: PASS (records={n})")
-        return 0
+                opts["schema_path"] = pathlib.Path(arg.split("=", 1)[1])
+            elif arg == "--progress":
+                opts["progress_every"] = DEFAULT_PROGRESS_EVERY
+            elif arg.startswith("--progress="):
+                opts["progress_every"] = _int_arg(arg.split("=", 1)[1], "--progress", 0)
+            elif arg == "--jobs":
+                i += 1
+                if i >= len(argv):
+                    raise UsageError("--jobs requires a number")
+                opts["jobs"] = _int_arg(argv[i], "--jobs", 1)
+            elif arg.startswith("--jobs="):
+                opts["jobs"] = _int_arg(arg.split("=", 1)[1], "--jobs", 1)
+            elif arg == "--all-errors":
+                opts["collect_all"] = True
+            elif arg == "--fast":
+                opts["fast"] = True
+            elif arg == "--checkpoint":
+                opts["checkpoint"] = ""
+            elif arg.startswith("--checkpoint="):
+                opts["checkpoint"] = arg.split("=", 1)[1]
+            else:
+                raise UsageError(f"unexpected argument '{arg}'")
+            i += 1
+        return opts
 
     if argv[0] == "bars-coverage":
         if len(argv) < 2:
-            print("ERROR: missing coverage JSON path", file=sys.stderr)
-            return 2
-        coverage_path = pathlib.Path(argv[1])
+            raise UsageError("missing coverage JSON path")
         schema_path = pathlib.Path("schemas/bars_coverage_manifest.schema.json")
         for arg in argv[2:]:
             if arg.startswith("schema="):
                 schema_path = pathlib.Path(arg.split("=", 1)[1])
-        validate_manifest(str(coverage_path), str(schema_path))
-        print("Schema validation: PASS")
-        return 0
+        return {"mode": "bars-coverage", "coverage_path": pathlib.Path(argv[1]), "schema_path": schema_path}
+
+    if argv[0] == "policy-batch":
+        if len(argv) < 2:
+            raise UsageError("missing manifest directory or glob")
+        opts = {"mode": "policy-batch", "target": argv[1], "policy_path": None, "jobs": None, "json": False}
+        i = 2
+        while i < len(argv):
+            arg = argv[i]
+            if arg in ("--policy", "--jobs"):
+                i += 1
+                if i >= len(argv):
+                    raise UsageError(f"{arg} requires a value")
+                if arg == "--policy":
+                    opts["policy_path"] = pathlib.Path(argv[i])
+                else:
+                    opts["jobs"] = _int_arg(argv[i], "--jobs", 1)
+            elif arg.startswith("--policy="):
+                opts["policy_path"] = pathlib.Path(arg.split("=", 1)[1])
+            elif arg.startswith("--jobs="):
+                opts["jobs"] = _int_arg(arg.split("=", 1)[1], "--jobs", 1)
+            elif arg == "--json":
+                opts["json"] = True
+            else:
+                raise UsageError(f"unexpected argument '{arg}'")
+            i += 1
+        if opts["policy_path"] is None:
+            raise UsageError("policy-batch requires --policy <policy.json>")
+        return opts
 
     # Default path: export manifest validation (with optional policy compare)
     manifest_path = None
@@ -181,14 +561,12 @@ def main(argv=None):
         if arg == "--manifest":
             i += 1
             if i >= len(argv):
-                print("ERROR: --manifest requires a path", file=sys.stderr)
-                return 2
+                raise UsageError("--manifest requires a path")
             manifest_path = pathlib.Path(argv[i])
         elif arg == "--policy":
             i += 1
             if i >= len(argv):
-                print("ERROR: --policy requires a path", file=sys.stderr)
-                return 2
+                raise UsageError("--policy requires a path")
             policy_path = pathlib.Path(argv[i])
         elif arg.startswith("--schema="):
             schema_path = pathlib.Path(arg.split("=", 1)[1])
@@ -199,15 +577,60 @@ def main(argv=None):
         elif policy_path is None:
             policy_path = pathlib.Path(arg)
         else:
-            print(f"ERROR: unexpected argument '{arg}'", file=sys.stderr)
-            return 2
+            raise UsageError(f"unexpected argument '{arg}'")
         i += 1
 
     if manifest_path is None:
-        print("ERROR: missing manifest path (use --manifest <path>)", file=sys.stderr)
+        raise UsageError("missing manifest path (use --manifest <path>)")
+    return {"mode": "manifest", "manifest_path": manifest_path, "policy_path": policy_path, "schema_path": schema_path}
+
+
+def main(argv=None):
+    argv = list(argv or sys.argv[1:])
+    if argv and argv[0] == "--describe":
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if not argv or argv[0] in {"-h", "--help"}:
+        print(USAGE, file=sys.stderr)
         return 2
+    try:
+        opts = parse_args(argv)
+    except UsageError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if opts["mode"] == "bars-jsonl":
+        jsonl_path, schema_path = str(opts["jsonl_path"]), str(opts["schema_path"])
+        jobs, collect_all, fast = opts["jobs"], opts["collect_all"], opts["fast"]
+        if opts["checkpoint"] is not None:
+            ok, n = validate_jsonl_incremental(
+                jsonl_path, schema_path, opts["checkpoint"] or None, jobs=jobs or 1, collect_all=collect_all, fast=fast
+            )
+        elif jobs is None:
+            ok, n = validate_jsonl_per_line(
+                jsonl_path, schema_path, progress_every=opts["progress_every"], collect_all=collect_all, fast=fast
+            )
+        else:
+            ok, n = validate_jsonl_sharded(jsonl_path, schema_path, jobs=jobs, collect_all=collect_all, fast=fast)
+        if not ok:
+            return 1
+        print(f"Schema validation: PASS (records={n})")
+        return 0
+
+    if opts["mode"] == "policy-batch":
+        try:
+            return _run_policy_batch(opts)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: cannot load policy {opts['policy_path']}: {e}", file=sys.stderr)
+            return 2
+
+    if opts["mode"] == "bars-coverage":
+        validate_manifest(str(opts["coverage_path"]), str(opts["schema_path"]))
+        print("Schema validation: PASS")
+        return 0
 
-    validate_manifest(str(manifest_path), str(schema_path))
+    manifest_path, policy_path = opts["manifest_path"], opts["policy_path"]
+    validate_manifest(str(manifest_path), str(opts["schema_path"]))
     print("Schema validation: PASS")
 
     if policy_path and policy_path.exists():
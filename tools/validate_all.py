@@ -1,44 +1,82 @@
 #!/usr/bin/env python3
 """Run all contract validations and emit unified SUMMARY line.
 
-SUMMARY {"schemas":N,"fixtures":M,"drift":D,"rule_errors":R,"invalid_examples":K,"duration_sec":X.Y}
+SUMMARY {"schemas":N,"fixtures":M,"drift":D,"rule_errors":R,"invalid_examples":K,"duration_sec":X.Y,"stage_timings_sec":{...}}
 Exit non-zero if drift>0 or rule_errors>0.
+
+Stages run in this process (no interpreter start-up or re-import per stage)
+on a thread pool, sharing one SchemaCache so each schema is parsed once.
 """
 from __future__ import annotations
 
 import json
-import subprocess
 import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import validate_fixtures
+import validate_schemas
 from promotion_rules import audit_rule_against_schema, RULE_PATH, MANIFEST_SCHEMA_PATH
-from validation_lib import load_json
+from validation_lib import SchemaCache
 
 BASE = Path(__file__).resolve().parent.parent
 OUT_DIR = BASE / "validation"
 
 
-def run_cmd(cmd):
-    return subprocess.run(cmd, capture_output=True, text=True)
+def _timed(fn: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, round(time.perf_counter() - start, 3)
+
+
+def run_stages(cache: SchemaCache, jobs: int = 3) -> Dict[str, Tuple[Dict[str, Any], float]]:
+    """Run the independent stages concurrently; returns {stage: (audit, seconds)}."""
+    stages: Dict[str, Callable[[], Dict[str, Any]]] = {
+        "schemas": lambda: validate_schemas.audit_schemas(cache=cache),
+        "fixtures": lambda: validate_fixtures.audit_fixtures(cache=cache),
+        "promotion_rule": lambda: audit_rule_against_schema(cache.load(RULE_PATH), cache.load(MANIFEST_SCHEMA_PATH)),
+    }
+    if jobs <= 1:
+        return {name: _timed(fn) for name, fn in stages.items()}
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(stages))) as pool:
+        futures = {name: pool.submit(_timed, fn) for name, fn in stages.items()}
+        return {name: f.result() for name, f in futures.items()}
 
 
-def main() -> int:
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_all",
+        "description": "Run schema, fixture and promotion-rule validations in one process and print a SUMMARY line.",
+        "inputs": {"flags": ["--serial", "--describe"]},
+        "outputs": {"artifacts": "validation/*.json, validation/summary.json", "stdout": "SUMMARY {...}"},
+        "examples": ["python tools/validate_all.py"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Run all contract validations")
+    ap.add_argument("--serial", action="store_true", help="Run stages one after another (for profiling)")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+
     start = time.time()
     OUT_DIR.mkdir(exist_ok=True)
-    # Schemas
-    run_cmd(["python3", "tools/validate_schemas.py"])
-    schema_audit = json.loads((OUT_DIR / "schema_audit.json").read_text())
-    drift = schema_audit.get("drift_count", 0)
+    results = run_stages(SchemaCache(), jobs=1 if args.serial else 3)
+    schema_audit, _ = results["schemas"]
+    fixtures_audit, _ = results["fixtures"]
+    rule_audit, _ = results["promotion_rule"]
 
-    # Fixtures
-    run_cmd(["python3", "tools/validate_fixtures.py"])
-    fixtures_audit = json.loads((OUT_DIR / "fixtures_audit.json").read_text())
-    invalid_examples = fixtures_audit.get("invalid_examples", 0)
-
-    # Promotion rule audit
-    rule = load_json(RULE_PATH)
-    schema = load_json(MANIFEST_SCHEMA_PATH)
-    rule_audit = audit_rule_against_schema(rule, schema)
+    validate_schemas.write_audit(schema_audit, OUT_DIR)
+    validate_fixtures.write_audit(fixtures_audit, OUT_DIR)
     (OUT_DIR / "promotion_rule_audit.json").write_text(json.dumps(rule_audit, indent=2) + "\n")
+    drift = schema_audit.get("drift_count", 0)
+    invalid_examples = fixtures_audit.get("invalid_examples", 0)
     rule_errors = 0 if rule_audit.get("valid") else 1
 
     summary = {
@@ -47,7 +85,8 @@ def main() -> int:
         "drift": drift,
         "rule_errors": rule_errors,
         "invalid_examples": invalid_examples,
-        "duration_sec": round(time.time() - start, 3)
+        "duration_sec": round(time.time() - start, 3),
+        "stage_timings_sec": {name: seconds for name, (_, seconds) in results.items()},
     }
     (OUT_DIR / "summary.json").write_text(json.dumps(summary, indent=2) + "\n")
     print("SUMMARY " + json.dumps(summary, separators=(",", ":")))
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Thin client for validate_server.py with validate.py's command line and exit codes.
+
+    validate_client.py [--socket PATH] [--no-fallback] <validate.py arguments>
+    validate_client.py [--socket PATH] promotion <manifest.json>
+
+Prints the same PASS/ERROR/WARNING lines and returns the same exit codes as
+validate.py (0 ok, 1 validation failure, 2 usage error) and, for
+``promotion``, as promotion_rules.py (0 pass, 1 fail, 3 rule error). Bars
+JSONL files are streamed to the server in chunks of lines.
+
+When no server is listening the request runs in-process via validate.main
+(unless ``--no-fallback``, which exits 2), as do the file-level bars-jsonl
+options the server does not offer (--jobs, --checkpoint, --progress). Once a
+request has been sent there is no fallback: a lost connection exits 2 rather
+than re-running the work and repeating output already printed.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from validate import USAGE, UsageError, parse_args
+
+DEFAULT_SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", "/tmp")) / "ml_contracts_validate.sock"
+CHUNK_LINES = 10_000
+
+
+class ServerUnavailable(Exception):
+    """No server answered before any request was sent; safe to run in-process instead."""
+
+
+class ConnectionLost(Exception):
+    """The server went away after requests were sent; output may be partial, so never fall back."""
+
+
+class Client:
+    """One connection to the server; ``call`` sends a request and waits for its response."""
+
+    def __init__(self, socket_path: Path | str = DEFAULT_SOCKET_PATH, timeout: Optional[float] = None):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(str(socket_path))
+        except OSError as e:
+            self._sock.close()
+            raise ServerUnavailable(f"{socket_path}: {e}") from e
+        self._file = self._sock.makefile("rwb")
+        self.sent = False
+
+    def call(self, op: str, **params: Any) -> Dict[str, Any]:
+        try:
+            self._file.write(json.dumps({"op": op, **params}).encode("utf-8") + b"\n")
+            self._file.flush()
+            self.sent = True
+            line = self._file.readline()
+        except OSError as e:
+            raise (ConnectionLost if self.sent else ServerUnavailable)(str(e)) from e
+        if not line:
+            raise ConnectionLost("server closed the connection")
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _abs(path: Optional[Path]) -> Optional[str]:
+    return str(path.resolve()) if path is not None else None
+
+
+def _chunks(path: Path, size: int = CHUNK_LINES) -> Iterator[List[str]]:
+    from jsonl_io import open_jsonl
+
+    chunk: List[str] = []
+    with open_jsonl(path) as fh:
+        for raw in fh:
+            chunk.append(raw.decode("utf-8", errors="replace"))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run_bars_jsonl(client: Client, opts: Dict[str, Any]) -> int:
+    offset = records = 0
+    failed = False
+    for chunk in _chunks(opts["jsonl_path"]):
+        r = client.call(
+            "validate-jsonl-chunk", lines=chunk, schema_path=_abs(opts["schema_path"]),
+            line_offset=offset, all_errors=opts["collect_all"], fast=opts["fast"],
+        )
+        if r["exit_code"] == 2:
+            print(f"ERROR: {r['error']}", file=sys.stderr)
+            return 2
+        for e in r["errors"]:
+            print(f"ERROR: line {e['line']} {e['message']}")
+        records += r["records"]
+        offset += len(chunk)
+        if r["errors"]:
+            failed = True
+            if not opts["collect_all"]:
+                break
+    if failed:
+        return 1
+    print(f"Schema validation: PASS (records={records})")
+    return 0
+
+
+def _run_manifest(client: Client, manifest_path: Path, schema_path: Path, policy_path: Optional[Path] = None) -> int:
+    r = client.call(
+        "validate-manifest", manifest_path=_abs(manifest_path), schema_path=_abs(schema_path),
+        policy_path=_abs(policy_path) if policy_path and policy_path.exists() else None,
+    )
+    if r["exit_code"] == 2:
+        print(f"ERROR: {r['error']}", file=sys.stderr)
+        return 2
+    if not r["ok"]:
+        for e in r["errors"]:
+            print(f"ERROR: {e}")
+        return 1
+    print("Schema validation: PASS")
+    if "warnings" in r:
+        for w in r["warnings"]:
+            print(f"WARNING: {w}")
+        if not r["warnings"]:
+            print("Policy comparison: OK (no differences)")
+    return 0
+
+
+def _run_promotion(client: Client, manifest_path: Path) -> int:
+    r = client.call("evaluate-promotion", manifest_path=_abs(manifest_path))
+    if r.get("error"):
+        print(json.dumps({"error": r["error"]}, indent=2))
+        return r["exit_code"]
+    print("PASS" if r["passed"] else "FAIL")
+    return r["exit_code"]
+
+
+def run(client: Client, argv: List[str]) -> int:
+    if argv[0] == "promotion":
+        if len(argv) != 2:
+            raise UsageError("promotion takes exactly one manifest path")
+        return _run_promotion(client, Path(argv[1]))
+    opts = parse_args(argv)
+    if opts["mode"] == "bars-jsonl":
+        return _run_bars_jsonl(client, opts)
+    if opts["mode"] == "bars-coverage":
+        return _run_manifest(client, opts["coverage_path"], opts["schema_path"])
+    return _run_manifest(client, opts["manifest_path"], opts["schema_path"], opts["policy_path"])
+
+
+def _local(argv: List[str]) -> int:
+    if argv[0] == "promotion":
+        import promotion_rules
+
+        return promotion_rules.main(argv[1:])
+    import validate
+
+    return validate.main(argv) or 0
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_client",
+        "description": "Send validate.py-style requests to a running validate_server; same output and exit codes, in-process fallback when no server is up.",
+        "inputs": {"args": "validate.py arguments, or: promotion <manifest.json>", "flags": ["--socket", "--no-fallback", "--describe"]},
+        "outputs": {"stdout": "Same lines as validate.py / promotion_rules.py"},
+        "examples": [
+            "python tools/validate_client.py --manifest manifest.json --policy contracts/policies/data_collection_policy_v1.json",
+            "python tools/validate_client.py bars-jsonl bars_download_manifest.jsonl.gz --all-errors",
+            "python tools/validate_client.py promotion manifest.json",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = list(argv if argv is not None else sys.argv[1:])
+    socket_path: Path = DEFAULT_SOCKET_PATH
+    fallback = True
+    while argv and (argv[0] in {"--socket", "--no-fallback", "--describe"} or argv[0].startswith("--socket=")):
+        arg = argv.pop(0)
+        if arg == "--describe":
+            print(json.dumps(describe(), indent=2))
+            return 0
+        if arg == "--no-fallback":
+            fallback = False
+        elif arg == "--socket":
+            if not argv:
+                print("ERROR: --socket requires a path", file=sys.stderr)
+                return 2
+            socket_path = Path(argv.pop(0))
+        else:
+            socket_path = Path(arg.split("=", 1)[1])
+    if not argv or argv[0] in {"-h", "--help"}:
+        print("Usage: validate_client.py [--socket PATH] [--no-fallback] <validate.py arguments>\n"
+              "       validate_client.py [--socket PATH] promotion <manifest.json>\n\n" + USAGE, file=sys.stderr)
+        return 2
+    # Already-parallel bars-jsonl runs and policy batches gain nothing from the server.
+    local_only = argv[0] == "policy-batch" or (argv[0] == "bars-jsonl" and any(
+        a.split("=", 1)[0] in {"--jobs", "--checkpoint", "--progress"} for a in argv[2:]
+    ))
+
+    if not local_only:
+        try:
+            with Client(socket_path) as client:
+                return run(client, argv)
+        except UsageError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+        except ConnectionLost as e:
+            print(f"ERROR: validation server connection lost ({e})", file=sys.stderr)
+            return 2
+        except ServerUnavailable as e:
+            if not fallback:
+                print(f"ERROR: validation server unavailable ({e})", file=sys.stderr)
+                return 2
+    return _local(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
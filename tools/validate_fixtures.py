@@ -7,20 +7,13 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from validation_lib import load_json
+from validation_lib import SchemaCache, load_json
+from validator_registry import get_validator
 
-try:  # pragma: no cover - import guard
-    import jsonschema  # type: ignore
-except ImportError:  # pragma: no cover
-    jsonschema = None
-try:  # pragma: no cover - optional
-    import pyarrow as pa  # type: ignore
-    import pyarrow.parquet as pq  # type: ignore
-    import pyarrow.csv as pacsv  # type: ignore
-except ImportError:  # pragma: no cover
-    pa = pq = pacsv = None
+# jsonschema and pyarrow are imported on the code paths that need them, so
+# --describe/--help do not pay for them.
 
 BASE = Path(__file__).resolve().parent.parent
 SCHEMA_PATH = BASE / "schemas" / "manifest.schema.json"
@@ -46,24 +39,16 @@ def describe() -> Dict[str, Any]:
 
 def validate_manifest(schema: Dict[str, Any], manifest: Dict[str, Any]) -> List[str]:
     errors: List[str] = []
-    if jsonschema is None:
+    try:
+        validator = get_validator(schema)
+    except ImportError:
         return ["jsonschema library not installed"]
-    validator = jsonschema.Draft7Validator(schema)  # type: ignore[attr-defined]
     for err in validator.iter_errors(manifest):
         errors.append(err.message)
     return errors
 
 
-def main() -> int:
-    import argparse
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--describe", action="store_true")
-    args = ap.parse_args()
-    if args.describe:
-        print(json.dumps(describe(), indent=2))
-        return 0
-
-    schema = load_json(SCHEMA_PATH)
+def fixture_results(schema: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
     results: List[Dict[str, Any]] = []
     invalid_examples = 0
     for fx in FIXTURES:
@@ -77,38 +62,63 @@ def main() -> int:
         if not ok:
             invalid_examples += 1
         results.append({"fixture": fx.name, "valid": ok, "errors": errs})
+    return results, invalid_examples
+
+
+def dataset_stats() -> Dict[str, Any]:
+    try:  # pragma: no cover - optional
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError:  # pragma: no cover
+        pq = None
+    if not (pq and L2_PARQUET.exists()):
+        return {"warning": "pyarrow not available or parquet missing"}
+    try:
+        table = pq.read_table(L2_PARQUET)
+        cols = table.schema
+        stats: Dict[str, Any] = {
+            "parquet_file": L2_PARQUET.name,
+            "row_count": table.num_rows,
+            "column_count": table.num_columns,
+            "columns": [
+                {"name": name, "type": str(cols.field(i).type)} for i, name in enumerate(table.column_names)
+            ],
+        }
+        # CSV cross-check
+        if L2_CSV.exists():
+            import pyarrow.csv as pacsv  # type: ignore
+
+            csv_table = pacsv.read_csv(L2_CSV)
+            stats["csv_row_count"] = csv_table.num_rows
+            stats["csv_column_count"] = csv_table.num_columns
+        return stats
+    except Exception as e:  # pragma: no cover
+        return {"error": str(e)}
+
+
+def audit_fixtures(cache: Optional[SchemaCache] = None) -> Dict[str, Any]:
+    """Validate the manifest fixtures and L2 dataset; returns the fixtures_audit.json payload."""
+    schema = (cache or SchemaCache()).load(SCHEMA_PATH)
+    results, invalid_examples = fixture_results(schema)
+    return {"fixtures": results, "invalid_examples": invalid_examples, "dataset": dataset_stats()}
+
+
+def write_audit(audit: Dict[str, Any], out_dir: Path = OUT_DIR) -> None:
+    out_dir.mkdir(exist_ok=True)
+    (out_dir / "fixtures_audit.json").write_text(json.dumps(audit, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--describe", action="store_true")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
 
-    dataset_stats: Optional[Dict[str, Any]] = None
-    if pa and pq and L2_PARQUET.exists():
-        try:
-            table = pq.read_table(L2_PARQUET)
-            cols = table.schema
-            dataset_stats = {
-                "parquet_file": L2_PARQUET.name,
-                "row_count": table.num_rows,
-                "column_count": table.num_columns,
-                "columns": [
-                    {"name": name, "type": str(cols.field(i).type)} for i, name in enumerate(table.column_names)
-                ],
-            }
-            # CSV cross-check
-            if pacsv and L2_CSV.exists():
-                csv_table = pacsv.read_csv(L2_CSV)
-                dataset_stats["csv_row_count"] = csv_table.num_rows
-                dataset_stats["csv_column_count"] = csv_table.num_columns
-        except Exception as e:  # pragma: no cover
-            dataset_stats = {"error": str(e)}
-    else:
-        dataset_stats = {"warning": "pyarrow not available or parquet missing"}
-
-    OUT_DIR.mkdir(exist_ok=True)
-    (OUT_DIR / "fixtures_audit.json").write_text(
-        json.dumps({
-            "fixtures": results,
-            "invalid_examples": invalid_examples,
-            "dataset": dataset_stats,
-        }, indent=2) + "\n", encoding="utf-8")
-    if invalid_examples:
+    audit = audit_fixtures()
+    write_audit(audit)
+    if audit["invalid_examples"]:
         return 1  # Non-zero signals presence of expected invalids; caller may treat separately
     return 0
 
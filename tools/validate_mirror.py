@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Validate a whole enriched mirror root (e.g. Stocks_clean_v1/) against the data-format contract.
+
+Walks the tree for contract extensions, infers each file's frequency from its
+path (a ``Seconds``/``Hourly``/``Minutes``/``Level2`` directory or filename
+token) or, failing that, from its column set, and runs the
+validate_parquet quality gates in a process pool.
+
+Results are cached per file keyed by (path, size, mtime_ns, contract hash,
+tier, requested frequency), so re-running over a mostly unchanged mirror only
+opens new or modified files. The audit is written to
+validation/mirror_audit.json in the same shape as fixtures_audit.json.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from validate_parquet import CONTRACT_PATH, TIERS, GateReport, load_quality_gates, read_schema, validate_file
+from validation_lib import ValidationError, canonicalize, dump_json, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE / "validation"
+DEFAULT_AUDIT_PATH = OUT_DIR / "mirror_audit.json"
+DEFAULT_CACHE_PATH = OUT_DIR / "mirror_cache.json"
+DEFAULT_EXTENSIONS = (".parquet", ".ftr")
+CACHE_VERSION = 1
+
+FREQUENCY_ALIASES = {
+    "seconds": "Seconds", "second": "Seconds", "secs": "Seconds", "sec": "Seconds", "1s": "Seconds",
+    "hourly": "Hourly", "hours": "Hourly", "hour": "Hourly", "1h": "Hourly",
+    "minutes": "Minutes", "minute": "Minutes", "mins": "Minutes", "min": "Minutes", "1m": "Minutes",
+    "level2": "Level2", "l2": "Level2", "mbp": "Level2",
+}
+_TOKEN_RE = re.compile(r"[^0-9A-Za-z]+")
+
+
+def contract_hash(contract: Dict[str, Any]) -> str:
+    payload = json.dumps(canonicalize(contract), separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def contract_extensions(contract: Dict[str, Any]) -> Tuple[str, ...]:
+    exts = contract.get("common_expectations", {}).get("extensions")
+    return tuple(e.lower() for e in exts) if exts else DEFAULT_EXTENSIONS
+
+
+def iter_mirror_files(root: Path, extensions: Sequence[str]) -> Iterator[Path]:
+    """Yield data files under ``root`` in a stable (sorted) order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if Path(name).suffix.lower() in extensions:
+                yield Path(dirpath) / name
+
+
+def frequency_from_path(path: Path, root: Optional[Path] = None) -> Optional[str]:
+    """Infer frequency from the nearest directory name, then filename tokens."""
+    rel = path.relative_to(root) if root is not None and path.is_relative_to(root) else path
+    for part in reversed(rel.parts[:-1]):
+        freq = FREQUENCY_ALIASES.get(part.lower())
+        if freq:
+            return freq
+    for token in _TOKEN_RE.split(path.stem):
+        freq = FREQUENCY_ALIASES.get(token.lower())
+        if freq:
+            return freq
+    return None
+
+
+def frequency_from_columns(contract: Dict[str, Any], names: Sequence[str]) -> Optional[str]:
+    """Return the only frequency whose contract column set equals ``names`` (else None).
+
+    Seconds and Hourly share a layout, so those files need a path hint.
+    """
+    present = set(names)
+    matches = [f for f, spec in contract.get("frequencies", {}).items() if set(spec.get("columns", {})) == present]
+    return matches[0] if len(matches) == 1 else None
+
+
+@lru_cache(maxsize=None)
+def _contract(contract_path: str) -> Dict[str, Any]:
+    return load_json(contract_path)
+
+
+@lru_cache(maxsize=None)
+def _gates(contract_path: str, frequency: str):
+    return load_quality_gates(_contract(contract_path), frequency)
+
+
+def validate_mirror_file(path: str, frequency: Optional[str], contract_path: str, tier: str) -> Dict[str, Any]:
+    """Validate one file, inferring its frequency from columns when ``frequency`` is None.
+
+    Top-level so it can run in a worker process; returns a ``GateReport`` dict.
+    An exception from the gates becomes an invalid report flagged ``crashed``,
+    which is never cached: the cause may be transient or a bug, not the file.
+    """
+    if frequency is None:
+        try:
+            schema, _, _ = read_schema(path)
+        except Exception as e:  # unreadable file: report it rather than kill the pool
+            return GateReport(path=path, frequency="unknown", valid=False, errors=[str(e)]).to_dict()
+        frequency = frequency_from_columns(_contract(contract_path), schema.names)
+        if frequency is None:
+            return GateReport(
+                path=path, frequency="unknown", valid=False,
+                errors=["cannot infer frequency from path or columns"],
+            ).to_dict()
+    try:
+        return validate_file(path, _gates(contract_path, frequency), tier=tier).to_dict()
+    except Exception as e:  # one bad file must not abort the whole mirror run
+        report = GateReport(path=path, frequency=frequency, valid=False, errors=[f"validation crashed: {e}"])
+        return dict(report.to_dict(), crashed=True)
+
+
+def load_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        data = load_json(path)
+    except ValueError:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_cache(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    dump_json(path, {"version": CACHE_VERSION, "entries": entries})
+
+
+def _cache_key(path: Path, digest: str, tier: str, frequency: Optional[str]) -> Dict[str, Any]:
+    st = path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "contract_hash": digest, "tier": tier, "frequency": frequency}
+
+
+def validate_mirror(
+    root: Path | str,
+    contract_path: Path | str = CONTRACT_PATH,
+    tier: str = "auto",
+    jobs: int = 0,
+    frequency: Optional[str] = None,
+    cache_path: Optional[Path | str] = DEFAULT_CACHE_PATH,
+) -> Dict[str, Any]:
+    """Validate every data file under ``root`` and return the audit dict.
+
+    ``frequency`` forces one frequency for all files; otherwise it is inferred
+    per file. ``jobs`` <= 0 uses every CPU, 1 runs in-process. Passing
+    ``cache_path=None`` disables the result cache.
+    """
+    if tier not in TIERS:
+        raise ValidationError(f"unknown tier '{tier}' (expected one of {', '.join(TIERS)})")
+    root = Path(root).resolve()
+    if not root.is_dir():
+        raise ValidationError(f"mirror root not found: {root}")
+    contract_path = str(Path(contract_path).resolve())
+    contract = _contract(contract_path)
+    digest = contract_hash(contract)
+    cache = load_cache(Path(cache_path)) if cache_path else {}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    keys: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, Optional[str], str, str]] = []
+    for path in iter_mirror_files(root, contract_extensions(contract)):
+        key = str(path)
+        freq = frequency or frequency_from_path(path, root)
+        keys[key] = _cache_key(path, digest, tier, frequency)
+        hit = cache.get(key)
+        if hit is not None and hit.get("key") == keys[key]:
+            results[key] = dict(hit["report"], cached=True)
+        else:
+            pending.append((key, freq, contract_path, tier))
+
+    if pending:
+        workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+        workers = min(workers, len(pending))
+        if workers <= 1:
+            reports = [validate_mirror_file(*task) for task in pending]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                reports = list(pool.map(validate_mirror_file, *zip(*pending), chunksize=max(1, len(pending) // (workers * 4))))
+        for (key, *_), report in zip(pending, reports):
+            results[key] = dict(report, cached=False)
+
+    if cache_path:
+        # Drop entries for files that vanished from this root; keep other roots.
+        prefix = str(root) + os.sep
+        kept = {k: v for k, v in cache.items() if not k.startswith(prefix)}
+        for key, report in results.items():
+            if report.get("crashed"):
+                continue
+            stored = {k: v for k, v in report.items() if k != "cached"}
+            kept[key] = {"key": keys[key], "report": stored}
+        save_cache(Path(cache_path), kept)
+
+    files = []
+    for key in sorted(results):
+        r = results[key]
+        files.append({
+            "file": Path(key).relative_to(root).as_posix(),
+            "frequency": r["frequency"],
+            "valid": r["valid"],
+            "errors": r["errors"],
+            "undecided": r["undecided"],
+            "rows": r["rows"],
+            "cached": r["cached"],
+            **({"crashed": True} if r.get("crashed") else {}),
+        })
+    return {
+        "mirror_root": str(root),
+        "contract": Path(contract_path).name,
+        "contract_hash": digest,
+        "tier": tier,
+        "files": files,
+        "invalid_files": sum(1 for f in files if f["valid"] is False),
+        "undecided_files": sum(1 for f in files if f["valid"] is None),
+        "cached_files": sum(1 for f in files if f["cached"]),
+        "crashed_files": sum(1 for f in files if f.get("crashed")),
+    }
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_mirror",
+        "description": "Validate every parquet/feather file under a mirror root against enriched_market_data_v1, in parallel, with a per-file result cache.",
+        "inputs": {"root": "Mirror root directory", "flags": ["--contract", "--frequency", "--tier", "--jobs", "--cache", "--no-cache", "--out", "--describe"]},
+        "outputs": {"artifact": "validation/mirror_audit.json", "stdout": "FAIL/UNDECIDED lines and a summary"},
+        "examples": [
+            "python tools/validate_mirror.py Stocks_clean_v1/",
+            "python tools/validate_mirror.py Stocks_clean_v1/ --tier footer --jobs 8",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Validate a mirror root against the enriched data-format quality gates")
+    ap.add_argument("root", nargs="?", type=Path)
+    ap.add_argument("--contract", type=Path, default=CONTRACT_PATH)
+    ap.add_argument("--frequency", choices=["Seconds", "Hourly", "Minutes", "Level2"], help="Force one frequency instead of inferring per file")
+    ap.add_argument("--tier", choices=TIERS, default="auto")
+    ap.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = all CPUs, 1 = in-process)")
+    ap.add_argument("--cache", type=Path, default=DEFAULT_CACHE_PATH, help="Per-file result cache")
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    ap.add_argument("--out", type=Path, default=DEFAULT_AUDIT_PATH, help="Audit output path")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if args.root is None:
+        ap.error("root is required")
+
+    try:
+        audit = validate_mirror(
+            args.root, args.contract, tier=args.tier, jobs=args.jobs,
+            frequency=args.frequency, cache_path=None if args.no_cache else args.cache,
+        )
+    except ValidationError as e:
+        print(f"ERROR: {e}")
+        return 2
+    dump_json(args.out, audit)
+    for f in audit["files"]:
+        if f["valid"] is False:
+            print(f"FAIL {f['file']} ({f['frequency']})")
+            for e in f["errors"]:
+                print(f"  - {e}")
+        elif f["valid"] is None:
+            print(f"UNDECIDED {f['file']} ({f['frequency']})")
+    total = len(audit["files"])
+    print(
+        f"{total} files: {audit['invalid_files']} invalid, {audit['undecided_files']} undecided, "
+        f"{audit['cached_files']} from cache -> {args.out}"
+    )
+    if audit["invalid_files"]:
+        return 1
+    return 3 if audit["undecided_files"] else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
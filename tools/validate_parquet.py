@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""Execute the enriched market-data quality gates against parquet files.
+
+The gates come straight from data_formats/enriched_market_data_v1.json
+(`quality_gates.expectations` plus the per-frequency `validation_rules`
+spread/depth checks), so the contract is the single source of truth. Files
+are scanned one row group at a time, projecting only the columns a gate
+needs, and every check is a pyarrow.compute kernel (no per-row Python).
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from validation_lib import ValidationError, load_json
+
+# pyarrow is imported on first use (see require_pyarrow) so that --help and
+# --describe, and tools that only import this module's helpers, start fast.
+pa = pc = paipc = pq = None
+
+BASE = Path(__file__).resolve().parent.parent
+CONTRACT_PATH = BASE / "data_formats" / "enriched_market_data_v1.json"
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_IPC_MAGIC = b"ARROW1"
+
+_COMPARE = {"<": "less", "<=": "less_equal", ">": "greater", ">=": "greater_equal"}
+_SPREAD_RE = re.compile(r"^\s*(\w+)\s*(<=|>=|<|>)\s*(\w+)\s*$")
+_DEPTH_RE = re.compile(r"^\s*len\((\w+)\)\s*(<=|>=|<|>)\s*(\d+)\s*$")
+
+
+@dataclass
+class QualityGates:
+    frequency: str
+    columns: List[str]
+    total_columns: Optional[int]
+    zero_nans_in: List[str]
+    dtype_checks: Dict[str, str]
+    spread_check: Optional[Tuple[str, str, str]] = None
+    depth_check: Optional[Tuple[str, str, int]] = None
+
+    def scan_columns(self) -> List[str]:
+        """Columns whose data pages a full scan must read."""
+        cols = list(self.zero_nans_in)
+        if self.spread_check:
+            cols += [self.spread_check[0], self.spread_check[2]]
+        if self.depth_check:
+            cols.append(self.depth_check[0])
+        return list(dict.fromkeys(cols))
+
+
+@dataclass
+class GateReport:
+    path: str
+    frequency: str
+    valid: Optional[bool]  # None when a footer-only check could not decide
+    rows: int = 0
+    row_groups: int = 0
+    errors: List[str] = field(default_factory=list)
+    undecided: List[str] = field(default_factory=list)
+    decided_by: str = "schema"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def require_pyarrow():
+    """Import pyarrow (and the compute/ipc/parquet modules) on first use; return it."""
+    global pa, pc, paipc, pq
+    if pa is None:
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.compute  # type: ignore
+            import pyarrow.ipc  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError as e:  # pragma: no cover
+            raise ValidationError("pyarrow is required for parquet quality gates") from e
+        pa, pc, paipc, pq = pyarrow, pyarrow.compute, pyarrow.ipc, pyarrow.parquet
+    return pa
+
+
+def load_quality_gates(contract: Dict[str, Any], frequency: str) -> QualityGates:
+    """Build the gate set for ``frequency`` from an enriched data-format contract."""
+    expectations = contract.get("quality_gates", {}).get("expectations", {})
+    freq_spec = contract.get("frequencies", {}).get(frequency)
+    if frequency not in expectations or freq_spec is None:
+        raise ValidationError(f"contract has no quality gates for frequency '{frequency}'")
+    exp = expectations[frequency]
+    rules = freq_spec.get("validation_rules", {})
+    gates = QualityGates(
+        frequency=frequency,
+        columns=list(freq_spec.get("columns", {})),
+        total_columns=exp.get("total_columns"),
+        zero_nans_in=list(exp.get("zero_nans_in", [])),
+        dtype_checks=dict(exp.get("dtype_checks", {})),
+    )
+    if "spread_check" in rules:
+        m = _SPREAD_RE.match(rules["spread_check"])
+        if not m:
+            raise ValidationError(f"unsupported spread_check expression: {rules['spread_check']!r}")
+        gates.spread_check = (m.group(1), m.group(2), m.group(3))
+    if "depth_check" in rules:
+        m = _DEPTH_RE.match(rules["depth_check"])
+        if not m:
+            raise ValidationError(f"unsupported depth_check expression: {rules['depth_check']!r}")
+        gates.depth_check = (m.group(1), m.group(2), int(m.group(3)))
+    return gates
+
+
+def arrow_type_matches(arrow_type: Any, dtype: str) -> bool:
+    """Return True if a pyarrow DataType satisfies a contract (pandas-style) dtype."""
+    require_pyarrow()
+    t = pa.types
+    if dtype == "float64":
+        return t.is_float64(arrow_type)
+    if dtype == "int64":
+        return t.is_int64(arrow_type)
+    if dtype == "string":
+        return t.is_string(arrow_type) or t.is_large_string(arrow_type)
+    m = re.fullmatch(r"datetime64\[(s|ms|us|ns)(?:,\s*(.+))?\]", dtype)
+    if m:
+        if not t.is_timestamp(arrow_type) or arrow_type.unit != m.group(1):
+            return False
+        want_tz = m.group(2)
+        if want_tz is None:
+            return arrow_type.tz is None
+        return arrow_type.tz is not None and (arrow_type.tz == want_tz or (want_tz == "UTC" and arrow_type.tz in ("+00:00", "Etc/UTC")))
+    if dtype == "object":
+        return (
+            t.is_nested(arrow_type)
+            or t.is_string(arrow_type)
+            or t.is_large_string(arrow_type)
+            or t.is_binary(arrow_type)
+            or t.is_large_binary(arrow_type)
+        )
+    return False
+
+
+def sniff_format(path: Path | str) -> str:
+    """Return 'parquet' or 'arrow' from the file magic (``.ftr`` may hold either)."""
+    with open(path, "rb") as fh:
+        head = fh.read(6)
+    if head[:4] == PARQUET_MAGIC:
+        return "parquet"
+    if head == ARROW_IPC_MAGIC:
+        return "arrow"
+    raise ValidationError(f"{path}: neither a parquet nor an Arrow IPC (feather v2) file")
+
+
+def read_schema(path: Path | str):
+    """Return (arrow schema, parquet metadata or None, format) without reading column data."""
+    require_pyarrow()
+    fmt = sniff_format(path)
+    if fmt == "parquet":
+        pf = pq.ParquetFile(path, memory_map=True)
+        return pf.schema_arrow, pf.metadata, fmt
+    with pa.memory_map(str(path), "r") as source:
+        return paipc.open_file(source).schema, None, fmt
+
+
+def iter_column_chunks(path: Path | str, columns: Sequence[str]) -> Iterator[Any]:
+    """Yield pyarrow Tables holding only ``columns``, one parquet row group (or IPC batch) at a time."""
+    require_pyarrow()
+    if sniff_format(path) == "parquet":
+        pf = pq.ParquetFile(path, memory_map=True)
+        for rg in range(pf.metadata.num_row_groups):
+            yield pf.read_row_group(rg, columns=list(columns))
+        return
+    with pa.memory_map(str(path), "r") as source:
+        reader = paipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield pa.Table.from_batches([batch]).select(list(columns))
+
+
+def missing_value_count(column: Any) -> int:
+    """Nulls plus NaNs (for floating point columns) in a pyarrow array/chunked array."""
+    require_pyarrow()
+    n = column.null_count
+    if pa.types.is_floating(column.type):
+        n += pc.sum(pc.is_nan(column)).as_py() or 0
+    return n
+
+
+def check_schema(schema: Any, gates: QualityGates) -> List[str]:
+    """Column count, presence and dtype gates, decided from the schema alone."""
+    errors: List[str] = []
+    names = list(schema.names)
+    if gates.total_columns is not None and len(names) != gates.total_columns:
+        errors.append(f"expected {gates.total_columns} columns, found {len(names)}")
+    for col in dict.fromkeys(gates.columns + gates.scan_columns()):
+        if col not in names:
+            errors.append(f"missing column '{col}'")
+    for col, dtype in gates.dtype_checks.items():
+        if col in names:
+            actual = schema.field(col).type
+            if not arrow_type_matches(actual, dtype):
+                errors.append(f"column '{col}' dtype {actual} does not match {dtype}")
+    if gates.depth_check and gates.depth_check[0] in names:
+        col = gates.depth_check[0]
+        if not _is_list_type(schema.field(col).type):
+            errors.append(f"column '{col}' dtype {schema.field(col).type} is not a list; depth_check needs list lengths")
+    for col in _non_numeric_spread_columns(schema, gates):
+        errors.append(f"column '{col}' dtype {schema.field(col).type} is not numeric; spread_check compares numbers")
+    return errors
+
+
+def _is_list_type(arrow_type: Any) -> bool:
+    t = pa.types
+    return t.is_list(arrow_type) or t.is_large_list(arrow_type) or t.is_fixed_size_list(arrow_type)
+
+
+def _is_numeric_type(arrow_type: Any) -> bool:
+    t = pa.types
+    return t.is_integer(arrow_type) or t.is_floating(arrow_type) or t.is_decimal(arrow_type)
+
+
+def _non_numeric_spread_columns(schema: Any, gates: QualityGates) -> List[str]:
+    if not gates.spread_check:
+        return []
+    names = set(schema.names)
+    cols = dict.fromkeys((gates.spread_check[0], gates.spread_check[2]))
+    return [c for c in cols if c in names and not _is_numeric_type(schema.field(c).type)]
+
+
+def unusable_columns(schema: Any, gates: QualityGates) -> set:
+    """Columns the data gates cannot be run on: missing, or failing a schema gate."""
+    names = set(schema.names)
+    bad = {c for c in gates.columns + gates.scan_columns() if c not in names}
+    bad |= {
+        col for col, dtype in gates.dtype_checks.items()
+        if col in names and not arrow_type_matches(schema.field(col).type, dtype)
+    }
+    if gates.depth_check and gates.depth_check[0] in names and not _is_list_type(schema.field(gates.depth_check[0]).type):
+        bad.add(gates.depth_check[0])
+    bad.update(_non_numeric_spread_columns(schema, gates))
+    return bad
+
+
+@dataclass
+class FooterVerdict:
+    """What the parquet footer alone could decide about the data gates."""
+    errors: List[str] = field(default_factory=list)
+    nan_columns: List[str] = field(default_factory=list)  # still need a data scan
+    spread: bool = False  # spread check still needs a data scan
+    depth: bool = False  # depth check still needs a data scan
+    rows: int = 0
+    row_groups: int = 0
+
+    @property
+    def decided(self) -> bool:
+        return bool(self.errors) or not (self.nan_columns or self.spread or self.depth)
+
+    def undecided(self) -> List[str]:
+        out = [f"NaN count for '{c}'" for c in self.nan_columns]
+        if self.spread:
+            out.append("spread_check")
+        if self.depth:
+            out.append("depth_check")
+        return out
+
+
+def _column_stats(metadata: Any) -> Dict[str, List[Any]]:
+    """Map top-level column name -> [(num_values, statistics or None)] per row group."""
+    stats: Dict[str, List[Any]] = {}
+    for rg in range(metadata.num_row_groups):
+        group = metadata.row_group(rg)
+        for j in range(group.num_columns):
+            col = group.column(j)
+            stats.setdefault(col.path_in_schema, []).append((col.num_values, col.statistics if col.is_stats_set else None))
+    return stats
+
+
+def check_footer(schema: Any, metadata: Any, gates: QualityGates) -> FooterVerdict:
+    """Decide the data gates from parquet footer statistics where possible.
+
+    Null counts are exact in the footer, so non-float columns are fully
+    decided. Parquet statistics do not record NaNs (writers exclude them from
+    min/max), so a float column with zero nulls stays undecided unless a row
+    group has values but no min/max at all, which means it is entirely NaN.
+    The spread check passes (or fails) outright when the per-row-group
+    min/max ranges of the two columns cannot overlap. List lengths are not in
+    the footer, so the depth check always needs a scan.
+    """
+    verdict = FooterVerdict(rows=metadata.num_rows, row_groups=metadata.num_row_groups)
+    if metadata.num_rows == 0:
+        return verdict
+    present = set(schema.names) - unusable_columns(schema, gates)
+    stats = _column_stats(metadata)
+
+    for col in gates.zero_nans_in:
+        if col not in present:
+            continue
+        chunks = stats.get(col)
+        if not chunks or any(st is None or not st.has_null_count for _, st in chunks):
+            verdict.nan_columns.append(col)
+            continue
+        nulls = sum(st.null_count for _, st in chunks)
+        if nulls:
+            verdict.errors.append(f"column '{col}' has {nulls} null values (footer statistics)")
+            continue
+        if pa.types.is_floating(schema.field(col).type):
+            all_nan = sum(n for n, st in chunks if n and not st.has_min_max)
+            if all_nan:
+                verdict.errors.append(f"column '{col}' has {all_nan} NaN values (footer statistics)")
+            else:
+                verdict.nan_columns.append(col)
+
+    if gates.spread_check:
+        left, op, right = gates.spread_check
+        if not (left in present and right in present):
+            verdict.spread = False
+        elif not (_is_numeric_type(schema.field(left).type) and _is_numeric_type(schema.field(right).type)):
+            verdict.spread = True  # min/max of mixed types cannot be ordered; leave it to the scan
+        else:
+            verdict.spread = _footer_spread(stats, gates, verdict)
+    if gates.depth_check and gates.depth_check[0] in present:
+        verdict.depth = True
+    return verdict
+
+
+def _footer_spread(stats: Dict[str, List[Any]], gates: QualityGates, verdict: FooterVerdict) -> bool:
+    """Try to decide the spread check from min/max; return True if a scan is still needed."""
+    left, op, right = gates.spread_check
+    lch, rch = stats.get(left), stats.get(right)
+    if not lch or not rch or len(lch) != len(rch):
+        return True
+    all_pass = True
+    for (n, ls), (_, rs) in zip(lch, rch):
+        if n == 0:
+            continue
+        if ls is None or rs is None or not (ls.has_min_max and rs.has_min_max) or ls.null_count or rs.null_count:
+            return True
+        # Every row passes when the ranges are ordered; every row fails when reversed.
+        if op in ("<", "<="):
+            passes = ls.max < rs.min if op == "<" else ls.max <= rs.min
+            fails = ls.min >= rs.max if op == "<" else ls.min > rs.max
+        else:
+            passes = ls.min > rs.max if op == ">" else ls.min >= rs.max
+            fails = ls.max <= rs.min if op == ">" else ls.max < rs.min
+        if fails:
+            verdict.errors.append(f"spread_check {left} {op} {right} violated in {n} rows (footer statistics)")
+            return False
+        all_pass = all_pass and passes
+    return not all_pass
+
+
+def scan_gates(
+    path: Path | str,
+    gates: QualityGates,
+    nan_columns: Sequence[str],
+    spread: bool = True,
+    depth: bool = True,
+) -> Tuple[List[str], int, int]:
+    """Run the data gates one row group at a time, reading only the columns they need.
+
+    Returns (errors, rows, chunks). Only ``nan_columns`` are NaN/null counted;
+    ``spread``/``depth`` toggle the Level2 checks when the contract defines them.
+    """
+    spread_rule = gates.spread_check if spread else None
+    depth_rule = gates.depth_check if depth else None
+    columns = list(nan_columns)
+    if spread_rule:
+        columns += [spread_rule[0], spread_rule[2]]
+    if depth_rule:
+        columns.append(depth_rule[0])
+    columns = list(dict.fromkeys(columns))
+
+    nan_counts = {c: 0 for c in nan_columns}
+    spread_bad = depth_bad = 0
+    rows = chunks = 0
+    for table in iter_column_chunks(path, columns):
+        chunks += 1
+        rows += table.num_rows
+        for c in nan_columns:
+            nan_counts[c] += missing_value_count(table.column(c))
+        if spread_rule:
+            left, op, right = spread_rule
+            ok = pc.fill_null(getattr(pc, _COMPARE[op])(table.column(left), table.column(right)), False)
+            spread_bad += table.num_rows - (pc.sum(ok).as_py() or 0)
+        if depth_rule:
+            col, op, n = depth_rule
+            ok = pc.fill_null(getattr(pc, _COMPARE[op])(pc.list_value_length(table.column(col)), n), False)
+            depth_bad += table.num_rows - (pc.sum(ok).as_py() or 0)
+
+    errors = [f"column '{c}' has {n} NaN/null values" for c, n in nan_counts.items() if n]
+    if spread_rule and spread_bad:
+        errors.append(f"spread_check {spread_rule[0]} {spread_rule[1]} {spread_rule[2]} violated in {spread_bad} rows")
+    if depth_rule and depth_bad:
+        errors.append(f"depth_check len({depth_rule[0]}) {depth_rule[1]} {depth_rule[2]} violated in {depth_bad} rows")
+    return errors, rows, chunks
+
+
+TIERS = ("auto", "footer", "scan")
+
+
+def validate_file(path: Path | str, gates: QualityGates, tier: str = "auto") -> GateReport:
+    """Validate one parquet/feather file against ``gates``.
+
+    ``tier`` selects how data gates are decided:
+      * ``scan``   - read the gated columns of every row group.
+      * ``footer`` - parquet footer only; anything the statistics cannot
+        decide is listed in ``report.undecided`` and ``valid`` is None.
+      * ``auto``   - footer first, then scan only the columns/checks the
+        footer left undecided (and nothing at all once a failure is known).
+    """
+    require_pyarrow()
+    if tier not in TIERS:
+        raise ValidationError(f"unknown tier '{tier}' (expected one of {', '.join(TIERS)})")
+    report = GateReport(path=str(path), frequency=gates.frequency, valid=False)
+    try:
+        schema, metadata, _ = read_schema(path)
+    except (ValidationError, OSError, pa.ArrowException) as e:
+        report.errors.append(str(e))
+        return report
+    report.errors.extend(check_schema(schema, gates))
+    # Columns already failing a schema gate are not scanned: their checks cannot be evaluated.
+    bad = unusable_columns(schema, gates)
+    present = set(schema.names) - bad
+
+    if tier != "scan" and metadata is not None:
+        verdict = check_footer(schema, metadata, gates)
+        report.rows, report.row_groups = verdict.rows, verdict.row_groups
+        report.errors.extend(verdict.errors)
+        report.decided_by = "footer"
+        if report.errors or verdict.decided:
+            report.valid = not report.errors
+            return report
+        if tier == "footer":
+            report.undecided = verdict.undecided()
+            report.valid = None
+            return report
+        nan_columns, spread, depth = verdict.nan_columns, verdict.spread, verdict.depth
+    else:
+        if tier == "footer":
+            report.undecided = ["no parquet footer statistics (Arrow IPC file)"]
+            report.valid = None
+            return report
+        nan_columns, spread, depth = [c for c in gates.zero_nans_in if c in present], True, True
+    if gates.spread_check and not {gates.spread_check[0], gates.spread_check[2]} <= present:
+        spread = False
+    if gates.depth_check and gates.depth_check[0] not in present:
+        depth = False
+
+    try:
+        errors, rows, chunks = scan_gates(path, gates, nan_columns, spread=spread, depth=depth)
+    except (OSError, pa.ArrowException) as e:
+        report.errors.append(f"data scan failed: {e}")
+        report.decided_by = "scan"
+        return report
+    report.rows, report.row_groups = rows, chunks
+    report.errors.extend(errors)
+    report.decided_by = "scan"
+    report.valid = not report.errors
+    return report
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_parquet",
+        "description": "Run enriched_market_data_v1 quality gates (column count, dtypes, zero NaNs, spread/depth) against parquet files.",
+        "inputs": {"files": "Parquet/feather files", "flags": ["--frequency", "--contract", "--tier", "--json", "--describe"]},
+        "outputs": {"stdout": "PASS/FAIL/UNDECIDED per file (or JSON reports with --json)"},
+        "examples": [
+            "python tools/validate_parquet.py --frequency Seconds AAPL_2025-09-15.parquet",
+            "python tools/validate_parquet.py --frequency Seconds --tier footer Stocks_clean_v1/Seconds/*.parquet",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Validate parquet files against the enriched data-format quality gates")
+    ap.add_argument("files", nargs="*", type=Path)
+    ap.add_argument("--frequency", choices=["Seconds", "Hourly", "Minutes", "Level2"])
+    ap.add_argument("--contract", type=Path, default=CONTRACT_PATH)
+    ap.add_argument("--tier", choices=TIERS, default="auto", help="footer = metadata only, scan = read data, auto = footer then scan what is undecided")
+    ap.add_argument("--json", action="store_true", help="Print JSON reports instead of PASS/FAIL lines")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if not args.files or not args.frequency:
+        ap.error("files and --frequency are required")
+
+    gates = load_quality_gates(load_json(args.contract), args.frequency)
+    reports = [validate_file(f, gates, tier=args.tier) for f in args.files]
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+    else:
+        for r in reports:
+            status = "UNDECIDED" if r.valid is None else ("PASS" if r.valid else "FAIL")
+            print(f"{status} {r.path}")
+            for e in r.errors:
+                print(f"  - {e}")
+            for u in r.undecided:
+                print(f"  ? {u}")
+    if any(r.valid is False for r in reports):
+        return 1
+    return 3 if any(r.valid is None for r in reports) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
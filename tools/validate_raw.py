@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Validate raw Trading Platform exports against data_formats/raw_market_data_v1.json.
+
+Checks per frequency: required columns, dtypes and nullability, plus a
+repairability report for nullable columns flagged ``repairable`` (WAP is
+often 100% NaN in raw exports and is recomputed during the mirror build).
+
+Reads are cheap: column presence and dtypes come from the file footer/schema,
+and only the columns a nullability or repairability check needs are read,
+one row group (or IPC batch) at a time from a memory-mapped file. Both
+``.parquet`` and ``.ftr`` are accepted; the on-disk format is sniffed from the
+magic bytes because ``.ftr`` exports may hold either Arrow IPC or parquet.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from validate_parquet import require_pyarrow, arrow_type_matches, iter_column_chunks, missing_value_count, read_schema
+from validation_lib import ValidationError, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+CONTRACT_PATH = BASE / "data_formats" / "raw_market_data_v1.json"
+ENRICHED_CONTRACT_PATH = BASE / "data_formats" / "enriched_market_data_v1.json"
+DEFAULT_EXTENSIONS = (".parquet", ".ftr")
+
+
+@dataclass
+class RawColumnSpec:
+    name: str
+    dtype: str
+    required: bool
+    nullable: bool
+    repairable: Optional[bool] = None
+
+
+@dataclass
+class RawReport:
+    path: str
+    frequency: str
+    valid: bool
+    rows: int = 0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    repair: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    extra_columns: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def load_raw_spec(contract: Dict[str, Any], frequency: str) -> List[RawColumnSpec]:
+    spec = contract.get("frequencies", {}).get(frequency)
+    if spec is None:
+        raise ValidationError(f"raw contract has no frequency '{frequency}'")
+    return [
+        RawColumnSpec(
+            name=name,
+            dtype=col.get("dtype", ""),
+            required=bool(col.get("required", False)),
+            nullable=bool(col.get("nullable", True)),
+            repairable=col.get("repairable"),
+        )
+        for name, col in spec.get("columns", {}).items()
+    ]
+
+
+def allowed_extensions() -> tuple:
+    """File extensions from the enriched contract's common_expectations (raw lists none)."""
+    try:
+        exts = load_json(ENRICHED_CONTRACT_PATH).get("common_expectations", {}).get("extensions")
+    except (OSError, ValueError):
+        exts = None
+    return tuple(exts) if exts else DEFAULT_EXTENSIONS
+
+
+def validate_raw_file(
+    path: Path | str,
+    frequency: str,
+    columns: List[RawColumnSpec],
+    extensions: tuple = DEFAULT_EXTENSIONS,
+) -> RawReport:
+    """Validate one raw export against the column specs of ``frequency``."""
+    pa = require_pyarrow()
+    path = Path(path)
+    report = RawReport(path=str(path), frequency=frequency, valid=False)
+    if path.suffix.lower() not in extensions:
+        report.errors.append(f"unexpected extension '{path.suffix}' (expected one of {', '.join(extensions)})")
+        return report
+    try:
+        schema, metadata, _ = read_schema(path)
+    except (ValidationError, OSError, pa.ArrowException) as e:
+        report.errors.append(str(e))
+        return report
+
+    present = set(schema.names)
+    known = {c.name for c in columns}
+    report.extra_columns = [n for n in schema.names if n not in known]
+    scan: List[RawColumnSpec] = []
+    for col in columns:
+        if col.name not in present:
+            if col.required:
+                report.errors.append(f"missing required column '{col.name}'")
+            continue
+        actual = schema.field(col.name).type
+        if col.dtype and not arrow_type_matches(actual, col.dtype):
+            report.errors.append(f"column '{col.name}' dtype {actual} does not match {col.dtype}")
+        if not col.nullable or col.repairable is not None:
+            scan.append(col)
+
+    # Projected, chunked read of just the columns with value-level checks.
+    missing = {c.name: 0 for c in scan}
+    rows = 0
+    if scan:
+        for table in iter_column_chunks(path, [c.name for c in scan]):
+            rows += table.num_rows
+            for c in scan:
+                missing[c.name] += missing_value_count(table.column(c.name))
+    elif metadata is not None:
+        rows = metadata.num_rows
+    report.rows = rows
+
+    for c in scan:
+        n = missing[c.name]
+        if not c.nullable and n:
+            report.errors.append(f"column '{c.name}' is not nullable but has {n} NaN/null values")
+        if c.repairable is not None:
+            all_nan = rows > 0 and n == rows
+            report.repair[c.name] = {"nan_count": n, "rows": rows, "all_nan": all_nan, "repairable": c.repairable}
+            if all_nan:
+                if c.repairable:
+                    report.warnings.append(f"column '{c.name}' is entirely NaN; repairable during mirror build")
+                else:
+                    report.warnings.append(f"column '{c.name}' is entirely NaN and is not repaired downstream")
+    report.valid = not report.errors
+    return report
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_raw",
+        "description": "Validate raw Trading Platform exports (parquet/ftr) against raw_market_data_v1: required columns, dtypes, nullability, WAP repairability.",
+        "inputs": {"files": "Raw .parquet/.ftr files", "flags": ["--frequency", "--contract", "--json", "--describe"]},
+        "outputs": {"stdout": "PASS/FAIL per file with warnings (or JSON reports with --json)"},
+        "examples": ["python tools/validate_raw.py --frequency Seconds AAPL_2025-09-15.ftr"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Validate raw market-data exports against the raw input contract")
+    ap.add_argument("files", nargs="*", type=Path)
+    ap.add_argument("--frequency", choices=["Seconds", "Hourly", "Minutes", "Level2"])
+    ap.add_argument("--contract", type=Path, default=CONTRACT_PATH)
+    ap.add_argument("--json", action="store_true", help="Print JSON reports instead of PASS/FAIL lines")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+    if not args.files or not args.frequency:
+        ap.error("files and --frequency are required")
+
+    columns = load_raw_spec(load_json(args.contract), args.frequency)
+    extensions = allowed_extensions()
+    reports = [validate_raw_file(f, args.frequency, columns, extensions) for f in args.files]
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+    else:
+        for r in reports:
+            print(f"{'PASS' if r.valid else 'FAIL'} {r.path}")
+            for e in r.errors:
+                print(f"  - {e}")
+            for w in r.warnings:
+                print(f"  ! {w}")
+    return 0 if all(r.valid for r in reports) else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -9,13 +9,13 @@ import json
 import sys
 from pathlib import Path
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from validation_lib import (
+    SchemaCache,
     audit_schema,
     gather_schema_files,
     load_checksums,
-    load_json,
     verify_drift,
     ensure_no_duplicate_properties,
 )
@@ -36,24 +36,22 @@ def describe() -> Dict[str, Any]:
     }
 
 
-def main() -> int:
-    import argparse
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--describe", action="store_true")
-    args = ap.parse_args()
-    if args.describe:
-        print(json.dumps(describe(), indent=2))
-        return 0
-
-    checksum_map = load_checksums(CHECKSUM_DIR)
+def audit_schemas(
+    schema_dir: Path = SCHEMA_DIR,
+    checksum_dir: Path = CHECKSUM_DIR,
+    cache: Optional[SchemaCache] = None,
+) -> Dict[str, Any]:
+    """Audit every schema under ``schema_dir``; returns the schema_audit.json payload."""
+    cache = cache or SchemaCache()
+    checksum_map = load_checksums(checksum_dir)
     audits = []
     drift_count = 0
-    for schema_file in gather_schema_files(SCHEMA_DIR):
-        schema = load_json(schema_file)
+    for schema_file in gather_schema_files(schema_dir):
+        schema = cache.load(schema_file)
         ensure_no_duplicate_properties(schema)
-        aud = audit_schema(schema_file)
+        aud = audit_schema(schema_file, schema)
         stored = checksum_map.get(schema_file.name)
-        drift, current_hash = verify_drift(schema_file, stored)
+        drift, current_hash = verify_drift(schema_file, stored, schema)
         audits.append({
             "file": schema_file.name,
             "schema_version": aud.schema_version,
@@ -65,11 +63,27 @@ def main() -> int:
         })
         if drift:
             drift_count += 1
+    return {"schemas": audits, "drift_count": drift_count}
+
+
+def write_audit(audit: Dict[str, Any], out_dir: Path = OUT_DIR) -> None:
+    out_dir.mkdir(exist_ok=True)
+    (out_dir / "schema_audit.json").write_text(json.dumps(audit, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--describe", action="store_true")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
 
-    OUT_DIR.mkdir(exist_ok=True)
-    (OUT_DIR / "schema_audit.json").write_text(json.dumps({"schemas": audits, "drift_count": drift_count}, indent=2) + "\n", encoding="utf-8")
-    if drift_count:
-        print(f"Schema drift detected: {drift_count}", file=sys.stderr)
+    audit = audit_schemas()
+    write_audit(audit)
+    if audit["drift_count"]:
+        print(f"Schema drift detected: {audit['drift_count']}", file=sys.stderr)
         return 2
     return 0
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Resident validation server on a Unix domain socket.
+
+Shelling out to validate.py per manifest pays interpreter start-up, imports
+and schema compilation every time. This server keeps them warm: schemas,
+rules and policies are held in a ``SchemaCache(reload=True)`` (re-read when
+a file's mtime/size changes, so edits are picked up without a restart) and
+compiled validators/rules are memoised by document content.
+
+Protocol: newline-delimited JSON over the socket. Each request is one
+object with an ``op`` and its parameters; each response is one object with
+``ok``, ``exit_code`` (the exit code validate.py / promotion_rules.py would
+return for the same input) and op-specific fields. An optional ``id`` is
+echoed back.
+
+    {"op": "validate-manifest", "manifest_path": "/abs/m.json", "policy_path": "..."}
+    {"op": "validate-jsonl-chunk", "lines": ["{...}", ...], "schema_path": "...", "line_offset": 0}
+    {"op": "evaluate-promotion", "manifest": {...}}
+    {"op": "compare-policy", "manifest_path": "...", "policy_path": "..."}
+    {"op": "ping"} / {"op": "stats"}
+
+Manifests may be sent inline (``manifest``) or by path (``manifest_path``).
+Paths are resolved by the server, so clients should send absolute paths.
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from promotion_rules import MANIFEST_SCHEMA_PATH, RULE_PATH, CompiledRule, RuleError, compile_rule
+from validate import _resolve_manifest_schema_path, _validate_lines, compare_data_collection
+from validate_client import DEFAULT_SOCKET_PATH
+from validation_lib import SchemaCache, compute_structural_hash, load_json
+
+BASE = Path(__file__).resolve().parent.parent
+DEFAULT_POLICY_PATH = BASE / "contracts" / "policies" / "data_collection_policy_v1.json"
+BARS_JSONL_SCHEMA_PATH = BASE / "schemas" / "bars_download_manifest.schema.json"
+
+
+class RequestError(Exception):
+    """Malformed request; reported with exit code 2 like a CLI usage error."""
+
+
+class ValidationService:
+    """Request handlers over warm, hot-reloading caches. Thread-safe."""
+
+    def __init__(self, docs: Optional[SchemaCache] = None):
+        self.docs = docs or SchemaCache(reload=True)
+        self._rules: Dict[str, CompiledRule] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.ops: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "validate-manifest": self.validate_manifest,
+            "validate-jsonl-chunk": self.validate_jsonl_chunk,
+            "evaluate-promotion": self.evaluate_promotion,
+            "compare-policy": self.compare_policy,
+            "ping": lambda req: {"ok": True, "exit_code": 0},
+            "stats": self.stats,
+        }
+
+    def handle(self, request: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.requests += 1
+        if not isinstance(request, dict):
+            return {"ok": False, "exit_code": 2, "error": "request must be a JSON object"}
+        op = request.get("op")
+        handler = self.ops.get(op)
+        if handler is None:
+            response = {"ok": False, "exit_code": 2, "error": f"unknown op {op!r} (expected one of {', '.join(self.ops)})"}
+        else:
+            try:
+                response = handler(request)
+            except RequestError as e:
+                response = {"ok": False, "exit_code": 2, "error": str(e)}
+            except Exception as e:  # never let a request kill the connection thread
+                response = {"ok": False, "exit_code": 2, "error": f"{type(e).__name__}: {e}"}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def _manifest(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if "manifest" in request:
+            manifest = request["manifest"]
+        elif "manifest_path" in request:
+            manifest = load_json(request["manifest_path"])
+        else:
+            raise RequestError("request needs 'manifest' or 'manifest_path'")
+        if not isinstance(manifest, dict):
+            raise RequestError("manifest must be a JSON object")
+        return manifest
+
+    def _validator(self, schema: Dict[str, Any], fast: bool = False):
+        from validator_registry import get_validator
+
+        if fast:
+            from schema_codegen import get_fast_validator
+
+            compiled = get_fast_validator(schema)
+            if compiled is not None:
+                return compiled
+        return get_validator(schema)
+
+    def _rule(self, path: Path | str) -> CompiledRule:
+        rule = self.docs.load(path)
+        key = compute_structural_hash(rule)
+        with self._lock:
+            compiled = self._rules.get(key)
+        if compiled is None:
+            compiled = compile_rule(rule)
+            with self._lock:
+                compiled = self._rules.setdefault(key, compiled)
+        return compiled
+
+    def validate_manifest(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        manifest = self._manifest(request)
+        schema_path = _resolve_manifest_schema_path(manifest, Path(request.get("schema_path") or MANIFEST_SCHEMA_PATH))
+        validator = self._validator(self.docs.load(schema_path))
+        errors = [
+            f"{'/'.join(str(p) for p in e.absolute_path) or '<root>'}: {e.message}"
+            for e in sorted(validator.iter_errors(manifest), key=lambda e: list(map(str, e.absolute_path)))
+        ]
+        response: Dict[str, Any] = {"ok": not errors, "exit_code": 1 if errors else 0, "schema": str(schema_path), "errors": errors}
+        policy_path = request.get("policy_path")
+        if not errors and policy_path and Path(policy_path).exists():
+            response["warnings"] = compare_data_collection(manifest, self.docs.load(policy_path))
+        return response
+
+    def validate_jsonl_chunk(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        lines = request.get("lines")
+        if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+            raise RequestError("'lines' must be a list of JSON strings")
+        schema = self.docs.load(request.get("schema_path") or BARS_JSONL_SCHEMA_PATH)
+        validator = self._validator(schema, fast=bool(request.get("fast")))
+        offset = int(request.get("line_offset", 0))
+        count, errors, _ = _validate_lines(lines, validator, collect_all=bool(request.get("all_errors")))
+        return {
+            "ok": not errors,
+            "exit_code": 1 if errors else 0,
+            "records": count,
+            "errors": [{"line": n + offset, "message": msg} for n, msg in errors],
+        }
+
+    def evaluate_promotion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        manifest = self._manifest(request)
+        compiled = self._rule(request.get("rule_path") or RULE_PATH)
+        try:
+            result = compiled.explain(manifest)
+        except RuleError as e:
+            return {"ok": False, "exit_code": 3, "error": str(e)}
+        if result.error:
+            return {"ok": False, "exit_code": 3, "error": result.error}
+        return {"ok": result.passed, "exit_code": 0 if result.passed else 1, **result.to_dict()}
+
+    def compare_policy(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        manifest = self._manifest(request)
+        warnings = compare_data_collection(manifest, self.docs.load(request.get("policy_path") or DEFAULT_POLICY_PATH))
+        return {"ok": True, "exit_code": 0, "warnings": warnings}
+
+    def stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from validator_registry import cache_stats
+
+        return {
+            "ok": True,
+            "exit_code": 0,
+            "pid": os.getpid(),
+            "uptime_sec": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "documents": len(self.docs),
+            "reloads": self.docs.reloads,
+            "rules": len(self._rules),
+            "validators": cache_stats(),
+        }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                request = json.loads(raw)
+            except ValueError as e:
+                response = {"ok": False, "exit_code": 2, "error": f"invalid JSON request: {e}"}
+            else:
+                response = self.server.service.handle(request)
+            self.wfile.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class ValidationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path | str, service: Optional[ValidationService] = None):
+        self.socket_path = Path(socket_path)
+        if self.socket_path.exists():
+            self.socket_path.unlink()  # stale socket from a previous run
+        self.service = service or ValidationService()
+        super().__init__(str(self.socket_path), _Handler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+
+def warm(service: ValidationService) -> List[str]:
+    """Load and compile the default schemas and rule so the first request is fast."""
+    warmed = []
+    for path in (MANIFEST_SCHEMA_PATH, BARS_JSONL_SCHEMA_PATH):
+        service._validator(service.docs.load(path))
+        warmed.append(path.name)
+    service._rule(RULE_PATH)
+    warmed.append(RULE_PATH.name)
+    if DEFAULT_POLICY_PATH.exists():
+        service.docs.load(DEFAULT_POLICY_PATH)
+        warmed.append(DEFAULT_POLICY_PATH.name)
+    return warmed
+
+
+def describe() -> Dict[str, Any]:
+    return {
+        "name": "validate_server",
+        "description": "Long-lived validation server on a Unix socket keeping compiled schemas, rules and policies warm (hot-reloaded on change).",
+        "inputs": {"flags": ["--socket", "--no-warm", "--describe"]},
+        "outputs": {"socket": "JSON-lines API: validate-manifest, validate-jsonl-chunk, evaluate-promotion, compare-policy, ping, stats"},
+        "examples": [
+            "python tools/validate_server.py &",
+            "python tools/validate_client.py --manifest manifest.json --policy contracts/policies/data_collection_policy_v1.json",
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Run the resident validation server")
+    ap.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    ap.add_argument("--no-warm", action="store_true", help="Do not precompile the default schemas and rule")
+    ap.add_argument("--describe", action="store_true", help="Print JSON description and exit")
+    args = ap.parse_args(argv)
+    if args.describe:
+        print(json.dumps(describe(), indent=2))
+        return 0
+
+    server = ValidationServer(args.socket)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # clean up the socket on kill
+    if not args.no_warm:
+        print(f"warmed: {', '.join(warm(server.service))}")
+    print(f"listening on {args.socket}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -1,26 +1,126 @@
 """Core validation and schema change detection utilities for ml-contracts.
 
-This module intentionally contains only pure functions operating on in-memory
-Python data structures (dict/list primitives). No network or environment
-specific dependencies. It is imported by validate_* CLI tools and tests.
+Mostly pure functions over in-memory Python data structures (dict/list
+primitives), plus the shared process-wide pieces every tool needs: the JSON
+decoder backend (chosen once at import from ML_CONTRACTS_JSON_BACKEND, or via
+set_json_backend) and the file-backed SchemaCache/PathIndex caches. No network
+dependencies. It is imported by validate_* CLI tools and tests.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+
+try:  # pragma: no cover - optional fast decoders
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+try:  # pragma: no cover - optional fast decoders
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+JSON_BACKEND_ENV = "ML_CONTRACTS_JSON_BACKEND"
 
 
 class ValidationError(Exception):
     pass
 
 
-def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def _msgspec_loads(data: bytes | str) -> Any:
+    try:
+        return _MSGSPEC_DECODER.decode(data)
+    except msgspec.DecodeError as e:  # normalise to ValueError like json/orjson
+        raise ValueError(str(e)) from e
+
+
+_JSON_DECODERS: Dict[str, Callable[[bytes | str], Any]] = {"json": json.loads}
+if orjson is not None:
+    _JSON_DECODERS["orjson"] = orjson.loads
+if msgspec is not None:
+    _MSGSPEC_DECODER = msgspec.json.Decoder()
+    _JSON_DECODERS["msgspec"] = _msgspec_loads
+_json_backend = "json"
+# orjson (and msgspec) turn integers outside int64/uint64 into floats without
+# an error. Those need at least 19 digits in a row, so documents with such a
+# run go to the stdlib; mapping digits to "1" with bytes.translate finds one
+# far faster than a regex.
+_DIGIT_MASK = bytes(0x31 if 0x30 <= i <= 0x39 else 0x30 for i in range(256))
+_WIDE_RUN = b"1" * 19
+
+
+def available_json_backends() -> List[str]:
+    return sorted(_JSON_DECODERS)
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """Select the JSON decoder used by json_loads/load_json.
+
+    ``auto`` prefers orjson, then msgspec, then the stdlib. All backends accept
+    bytes directly (no text decode step) and raise ValueError on malformed
+    input. Results never depend on the backend: orjson and msgspec reject
+    NaN/Infinity literals and silently decode integers wider than 64 bits as
+    floats, so ``json_loads`` hands such documents to the stdlib.
+    """
+    global _json_backend
+    if name == "auto":
+        name = next(b for b in ("orjson", "msgspec", "json") if b in _JSON_DECODERS)
+    if name not in _JSON_DECODERS:
+        raise ValidationError(f"JSON backend '{name}' is not available (have: {', '.join(available_json_backends())})")
+    _json_backend = name
+    return name
+
+
+def json_backend() -> str:
+    return _json_backend
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON document (bytes preferred) with the selected backend.
+
+    A fast backend is skipped for documents with a possible wide integer
+    (a run of 19+ digits) and retried with the stdlib when it raises, so
+    NaN/Infinity and big integers decode exactly as ``json.loads`` would;
+    malformed input still raises the stdlib's ValueError.
+    """
+    if _json_backend == "json":
+        return json.loads(data)
+    raw = data.encode() if isinstance(data, str) else data
+    if _WIDE_RUN in raw.translate(_DIGIT_MASK):
+        return json.loads(data)
+    try:
+        return _JSON_DECODERS[_json_backend](data)
+    except ValueError:
+        return json.loads(data)
+
+
+def load_json(path: Path | str) -> Any:
+    return json_loads(Path(path).read_bytes())
+
+
+def _backend_from_env() -> str:
+    """Apply ML_CONTRACTS_JSON_BACKEND; an unusable value warns and falls back to ``auto``.
+
+    This runs at import time, so it must never raise: a typo in the
+    environment should not turn every tool (even --describe) into a traceback.
+    """
+    requested = os.environ.get(JSON_BACKEND_ENV, "auto")
+    try:
+        return set_json_backend(requested)
+    except ValidationError as e:
+        import sys
+
+        print(f"WARNING: {JSON_BACKEND_ENV}={requested!r} ignored: {e}; using auto", file=sys.stderr)
+        return set_json_backend("auto")
+
+
+_backend_from_env()
 
 
 def dump_json(path: Path, obj: Any) -> None:
@@ -30,6 +130,47 @@ def dump_json(path: Path, obj: Any) -> None:
         f.write("\n")
 
 
+class SchemaCache:
+    """Thread-safe memo of parsed JSON documents keyed by resolved path.
+
+    Lets several validation stages running in one process share a single
+    parsed copy of each schema instead of re-reading it per stage.
+
+    With ``reload=True`` each ``load`` also stats the file and re-reads it
+    when its (mtime_ns, size) changed, for long-lived processes that must
+    pick up edited schemas without a restart.
+    """
+
+    def __init__(self, reload: bool = False) -> None:
+        self._docs: Dict[str, Any] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self.reload = reload
+        self.reloads = 0
+
+    def load(self, path: Path | str) -> Any:
+        key = str(Path(path).resolve())
+        stamp = None
+        if self.reload:
+            st = os.stat(key)
+            stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if key in self._docs and (stamp is None or self._stamps.get(key) == stamp):
+                return self._docs[key]
+        doc = load_json(key)
+        with self._lock:
+            if stamp is None:
+                return self._docs.setdefault(key, doc)
+            if key in self._docs:
+                self.reloads += 1
+            self._docs[key] = doc
+            self._stamps[key] = stamp
+            return doc
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
 def canonicalize(obj: Any) -> Any:
     """Return object with dictionaries recursively key-sorted.
 
@@ -57,6 +198,137 @@ def compute_structural_hash(schema: Dict[str, Any]) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+WILDCARD = "*"
+_COMBINATORS = ("allOf", "anyOf", "oneOf", "if", "then", "else")
+
+
+@dataclass(frozen=True, eq=False)
+class PathIndex:
+    """Every property path reachable in a schema, as dotted strings and a trie.
+
+    Array items and ``additionalProperties``/``patternProperties`` schemas
+    appear as a ``*`` segment, which matches any key or list index. For
+    recursive schemas ``paths`` lists one level of recursion; use
+    ``has_path``/``in`` for arbitrary depth.
+    """
+
+    paths: frozenset
+    trie: Dict[str, Any]
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self.has_path(path)
+
+    def has_path(self, path: str) -> bool:
+        if path in self.paths:
+            return True
+        return _trie_match(self.trie, path.split("."))
+
+    def children(self, path: str = "") -> List[str]:
+        """Sorted property names directly under ``path`` ("" for the root)."""
+        node: Any = self.trie
+        for part in path.split(".") if path else []:
+            node = node.get(part, node.get(WILDCARD))
+            if node is None:
+                return []
+        return sorted(k for k in node if k != WILDCARD)
+
+
+def _trie_match(node: Dict[str, Any], parts: List[str]) -> bool:
+    if not parts:
+        return True
+    head, rest = parts[0], parts[1:]
+    if head in node and _trie_match(node[head], rest):
+        return True
+    return WILDCARD in node and _trie_match(node[WILDCARD], rest)
+
+
+def _resolve_pointer(root: Dict[str, Any], ref: str) -> Any:
+    """Resolve a local ``#/...`` JSON pointer; None for remote or dangling refs."""
+    if not ref.startswith("#"):
+        return None
+    node: Any = root
+    pointer = ref[1:].lstrip("/")
+    for token in pointer.split("/") if pointer else []:
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, list) and token.isdigit():
+            node = node[int(token)] if int(token) < len(node) else None
+        elif isinstance(node, dict):
+            node = node.get(token)
+        else:
+            return None
+        if node is None:
+            return None
+    return node
+
+
+def build_path_index(schema: Dict[str, Any]) -> PathIndex:
+    """Flatten every reachable property path of ``schema`` into a PathIndex.
+
+    Follows local ``$ref`` (JSON pointers into ``$defs``/``definitions``) and
+    merges ``allOf``/``anyOf``/``oneOf`` and ``if``/``then``/``else`` branches.
+    A ``$ref`` met again while it is still being expanded (a recursive schema)
+    is linked back to the first expansion's trie node instead of being
+    re-entered, so the trie stays finite and ``has_path`` still accepts paths
+    of any recursion depth.
+    """
+    holder: Dict[str, Any] = {}
+
+    def walk(node: Any, parent: Dict[str, Any], key: str, expanding: Dict[str, Dict[str, Any]]) -> None:
+        if not isinstance(node, dict):
+            return
+        into = parent.setdefault(key, {})
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            shared = expanding.get(ref)
+            if shared is None:
+                walk(_resolve_pointer(schema, ref), parent, key, {**expanding, ref: into})
+            elif into is not shared:
+                if into:
+                    for k, v in shared.items():
+                        into.setdefault(k, v)
+                else:
+                    parent[key] = into = shared
+        for name in _COMBINATORS:
+            sub = node.get(name)
+            for branch in sub if isinstance(sub, list) else [sub]:
+                walk(branch, parent, key, expanding)
+        for name, sub in (node.get("properties") or {}).items():
+            walk(sub, into, name, expanding)
+        wild = [node.get("additionalProperties"), *(node.get("patternProperties") or {}).values()]
+        items = node.get("items")
+        wild += items if isinstance(items, list) else [items]
+        wild += node.get("prefixItems") or []
+        for sub in wild:
+            walk(sub, into, WILDCARD, expanding)
+
+    walk(schema, holder, "", {})
+    trie = holder.get("", {})
+
+    paths: List[str] = []
+
+    def flatten(node: Dict[str, Any], prefix: str, stack: Tuple[int, ...]) -> None:
+        for name, child in node.items():
+            path = f"{prefix}.{name}" if prefix else name
+            paths.append(path)
+            if stack.count(id(child)) < 2:  # unroll recursive refs once
+                flatten(child, path, stack + (id(child),))
+
+    flatten(trie, "", (id(trie),))
+    return PathIndex(paths=frozenset(paths), trie=trie)
+
+
+_PATH_INDEX_CACHE: Dict[str, PathIndex] = {}
+
+
+def get_path_index(schema: Dict[str, Any]) -> PathIndex:
+    """``build_path_index`` memoised by structural hash (schemas rarely change per process)."""
+    key = compute_structural_hash(schema)
+    index = _PATH_INDEX_CACHE.get(key)
+    if index is None:
+        index = _PATH_INDEX_CACHE[key] = build_path_index(schema)
+    return index
+
+
 @dataclass
 class SchemaAudit:
     path: str
@@ -78,8 +350,10 @@ def extract_schema_version(schema: Dict[str, Any]) -> str | None:
     return None
 
 
-def audit_schema(path: Path) -> SchemaAudit:
-    schema = load_json(path)
+def audit_schema(path: Path, schema: Dict[str, Any] | None = None) -> SchemaAudit:
+    """Summarise a schema file; pass ``schema`` to reuse an already loaded copy."""
+    if schema is None:
+        schema = load_json(path)
     required_count = len(schema.get("required", []) or [])
     properties_count = len(schema.get("properties", {}) or {})
     structural_hash = compute_structural_hash(schema)
@@ -142,8 +416,9 @@ def write_checksum(dir_path: Path, schema_file: Path, hash_hex: str) -> None:
     out.write_text(f"{hash_hex}  {schema_file.name}\n", encoding="utf-8")
 
 
-def verify_drift(schema_path: Path, stored_hash: str | None) -> Tuple[bool, str]:
-    schema = load_json(schema_path)
+def verify_drift(schema_path: Path, stored_hash: str | None, schema: Dict[str, Any] | None = None) -> Tuple[bool, str]:
+    if schema is None:
+        schema = load_json(schema_path)
     current = compute_structural_hash(schema)
     if stored_hash is None:
         return False, current  # No drift; baseline creation scenario.
@@ -182,10 +457,20 @@ def gather_schema_files(base: Path) -> List[Path]:
 
 __all__ = [
     "ValidationError",
+    "JSON_BACKEND_ENV",
+    "available_json_backends",
+    "set_json_backend",
+    "json_backend",
+    "json_loads",
     "load_json",
     "dump_json",
+    "SchemaCache",
     "canonicalize",
     "compute_structural_hash",
+    "WILDCARD",
+    "PathIndex",
+    "build_path_index",
+    "get_path_index",
     "SchemaAudit",
     "audit_schema",
     "classify_schema_change",
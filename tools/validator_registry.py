@@ -0,0 +1,71 @@
+"""Process-wide registry of compiled jsonschema validators.
+
+Validators are keyed by the schema's structural hash (see
+validation_lib.compute_structural_hash), so the metaschema check and
+validator construction happen once per distinct schema per process. The
+cached validator instance also keeps its own ``$ref`` resolver, so local
+references such as ``#/$defs/kpi`` are resolved once and reused for every
+instance validated afterwards.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+from validation_lib import compute_structural_hash
+
+_LOCK = threading.Lock()
+_VALIDATORS: Dict[str, Any] = {}
+_STATS = {"hits": 0, "misses": 0}
+
+
+def validator_class_for(schema: Dict[str, Any]):
+    """Pick a jsonschema Validator class based on the $schema meta.
+
+    Defaults to Draft202012Validator; supports draft-07 for bars/manifest schemas.
+    """
+    from jsonschema import Draft202012Validator, Draft7Validator
+
+    meta = (schema.get("$schema") or "").lower()
+    if "draft-07" in meta:
+        return Draft7Validator
+    return Draft202012Validator
+
+
+def get_validator(schema: Dict[str, Any]):
+    """Return a compiled validator for ``schema``, building it on first use."""
+    key = compute_structural_hash(schema)
+    with _LOCK:
+        validator = _VALIDATORS.get(key)
+        if validator is not None:
+            _STATS["hits"] += 1
+            return validator
+        _STATS["misses"] += 1
+    cls = validator_class_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    with _LOCK:
+        # Another thread may have compiled the same schema meanwhile; keep the first.
+        return _VALIDATORS.setdefault(key, validator)
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return hit/miss counters and the number of cached validators."""
+    with _LOCK:
+        return {"hits": _STATS["hits"], "misses": _STATS["misses"], "size": len(_VALIDATORS)}
+
+
+def clear_cache() -> None:
+    """Drop all cached validators and reset counters (mainly for tests)."""
+    with _LOCK:
+        _VALIDATORS.clear()
+        _STATS["hits"] = 0
+        _STATS["misses"] = 0
+
+
+__all__ = [
+    "validator_class_for",
+    "get_validator",
+    "cache_stats",
+    "clear_cache",
+]